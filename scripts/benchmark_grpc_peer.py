@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Collective benchmark for GrpcCommunicator on localhost.
+
+Spawns N ranks as separate processes and times repeated MEAN aggregations
+of a synthetic model with the star (central server), ring, and tree
+collectives, reporting seconds per aggregation for each world size.
+With --broadcast, times model broadcasts from rank 0 through the central
+server and pipelined along a peer tree or chain instead.
+"""
+
+import argparse
+import multiprocessing as mp
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+import torch
+
+# Add OmniFed root to path and import modules
+script_dir = Path(__file__).parent
+omnifed_root = script_dir.parent
+sys.path.insert(0, str(omnifed_root))
+
+from src.omnifed.communicator import AggregationOp  # noqa: E402
+from src.omnifed.communicator.grpc import GrpcCommunicator  # noqa: E402
+from src.omnifed.communicator.grpc_peer import (  # noqa: E402
+    PeerBroadcast,
+    PeerCollective,
+)
+from src.omnifed.utils import print  # noqa: E402
+
+MAX_MESSAGE_LENGTH = 1 << 30
+
+# Broadcast modes: central server, or peer_broadcast relay topologies
+BROADCAST_MODES = ["server"] + [t.value for t in PeerBroadcast]
+
+
+def make_tensordict(num_params: int, num_tensors: int = 8) -> dict:
+    """Build a synthetic model state with num_params float32 values."""
+    size = max(1, num_params // num_tensors)
+    return {f"layer{i}.weight": torch.randn(size) for i in range(num_tensors)}
+
+
+def run_rank(
+    rank: int,
+    world_size: int,
+    port: int,
+    mode: str,
+    broadcast: bool,
+    rounds: int,
+    num_params: int,
+    barrier,
+    timings,
+) -> None:
+    """Rank process: set up the communicator and time each operation."""
+    if broadcast:
+        topology = None if mode == "server" else mode
+        options = dict(peer_broadcast=topology)
+    else:
+        options = dict(collective=mode)
+    comm = GrpcCommunicator(
+        rank=rank,
+        world_size=world_size,
+        master_addr="localhost",
+        master_port=port,
+        max_send_message_length=MAX_MESSAGE_LENGTH,
+        max_receive_message_length=MAX_MESSAGE_LENGTH,
+        retry_delay=0.5,
+        max_retries=60,
+        peer_host="localhost",
+        **options,
+    )
+    comm.setup()
+    tensordict = make_tensordict(num_params)
+
+    def operation():
+        if broadcast:
+            comm.broadcast(tensordict)
+            # Server broadcasts are not collective; finish before publishing again
+            barrier.wait()
+        else:
+            comm.aggregate(tensordict, AggregationOp.MEAN)
+
+    operation()  # Warm up channels
+    barrier.wait()
+    start = time.perf_counter()
+    for _ in range(rounds):
+        operation()
+    timings.put(time.perf_counter() - start)
+
+    # Keep serving until every rank has received its last result
+    barrier.wait()
+    comm.close()
+
+
+def benchmark(world_size: int, mode: str, args: argparse.Namespace, port: int) -> float:
+    """Run one configuration and return seconds per operation."""
+    ctx = mp.get_context("spawn")
+    barrier = ctx.Barrier(world_size)
+    timings = ctx.Queue()
+    procs = [
+        ctx.Process(
+            target=run_rank,
+            args=(
+                rank,
+                world_size,
+                port,
+                mode,
+                args.broadcast,
+                args.rounds,
+                args.params,
+                barrier,
+                timings,
+            ),
+        )
+        for rank in range(world_size)
+    ]
+    for proc in procs:
+        proc.start()
+
+    elapsed = max(timings.get() for _ in procs)
+    for proc in procs:
+        proc.join()
+
+    failed = [proc.pid for proc in procs if proc.exitcode != 0]
+    if failed:
+        raise RuntimeError(f"Rank processes failed: {failed}")
+    return elapsed / args.rounds
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--world-sizes", type=int, nargs="+", default=[2, 4, 8])
+    parser.add_argument(
+        "--modes",
+        nargs="+",
+        help=f"Collectives {[c.value for c in PeerCollective]} or, with "
+        f"--broadcast, {BROADCAST_MODES} (default: all)",
+    )
+    parser.add_argument(
+        "--broadcast", action="store_true", help="Time broadcasts from rank 0"
+    )
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--params", type=int, default=1_000_000)
+    parser.add_argument("--port", type=int, default=50251)
+    args = parser.parse_args(argv)
+    choices = BROADCAST_MODES if args.broadcast else [c.value for c in PeerCollective]
+    modes = args.modes or choices
+    invalid = set(modes) - set(choices)
+    if invalid:
+        parser.error(f"unknown modes {sorted(invalid)}, choose from {choices}")
+
+    results = {}
+    port = args.port
+    for world_size in args.world_sizes:
+        for mode in modes:
+            results[world_size, mode] = benchmark(world_size, mode, args, port)
+            port += 1
+
+    operation = "broadcast" if args.broadcast else "aggregation"
+    print(
+        f"\ngRPC {operation} ({args.params:,} params, {args.rounds} rounds, s/{operation})"
+    )
+    print(f"{'ranks':>6} " + " ".join(f"{m:>8}" for m in modes))
+    for world_size in args.world_sizes:
+        row = " ".join(f"{results[world_size, m]:>8.3f}" for m in modes)
+        print(f"{world_size:>6} {row}")
+
+
+if __name__ == "__main__":
+    main()
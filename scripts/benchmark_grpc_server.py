@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Contention benchmark for the OmniFed gRPC aggregation server.
+
+Runs a GrpcServer (or GrpcAioServer) in-process and drives it with K client
+processes that submit and fetch aggregation results for several rounds,
+reporting submission throughput for each client count.
+"""
+
+import argparse
+import asyncio
+import multiprocessing as mp
+import sys
+import threading
+import time
+from concurrent import futures
+from pathlib import Path
+from typing import List
+
+import grpc
+import torch
+
+# Add OmniFed root to path and import modules
+script_dir = Path(__file__).parent
+omnifed_root = script_dir.parent
+sys.path.insert(0, str(omnifed_root))
+
+from src.omnifed.communicator import AggregationOp  # noqa: E402
+from src.omnifed.communicator import grpc_pb2_grpc  # noqa: E402
+from src.omnifed.communicator.grpc_aio_server import GrpcAioServer  # noqa: E402
+from src.omnifed.communicator.grpc_client import GrpcClient  # noqa: E402
+from src.omnifed.communicator.grpc_server import GrpcServer  # noqa: E402
+from src.omnifed.utils import print  # noqa: E402
+
+MAX_MESSAGE_LENGTH = 1 << 30
+
+
+def make_tensordict(num_params: int, num_tensors: int = 8) -> dict:
+    """Build a synthetic model state with num_params float32 values."""
+    size = max(1, num_params // num_tensors)
+    return {f"layer{i}.weight": torch.randn(size) for i in range(num_tensors)}
+
+
+def run_client(
+    client_id: int,
+    port: int,
+    rounds: int,
+    num_params: int,
+    streaming: bool,
+    shared_memory: bool,
+    barrier,
+    timings,
+) -> None:
+    """Client process: submit and fetch the aggregate for each round."""
+    client = GrpcClient(
+        client_id=str(client_id),
+        master_addr="localhost",
+        master_port=port,
+        max_send_message_length=MAX_MESSAGE_LENGTH,
+        max_receive_message_length=MAX_MESSAGE_LENGTH,
+        retry_delay=0.5,
+        max_retries=60,
+        streaming=streaming,
+        shared_memory=shared_memory,
+    )
+    tensordict = make_tensordict(num_params)
+    barrier.wait()
+    start = time.perf_counter()
+    for _ in range(rounds):
+        client.submit_for_aggregation(tensordict, AggregationOp.MEAN)
+        client.get_aggregation_result()
+    timings.put(time.perf_counter() - start)
+    client.close()
+
+
+def start_threaded_server(servicer: GrpcServer, port: int, max_workers: int):
+    """Start a thread-pool gRPC server and return a stop callback."""
+    server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=max_workers),
+        options=[
+            ("grpc.max_send_message_length", MAX_MESSAGE_LENGTH),
+            ("grpc.max_receive_message_length", MAX_MESSAGE_LENGTH),
+        ],
+    )
+    grpc_pb2_grpc.add_GrpcServerServicer_to_server(servicer, server)
+    server.add_insecure_port(f"[::]:{port}")
+    server.start()
+    return lambda: server.stop(grace=None)
+
+
+def start_aio_server(servicer: GrpcAioServer, port: int):
+    """Start a grpc.aio server on a background event loop and return a stop callback."""
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+
+    async def start():
+        server = grpc.aio.server(
+            options=[
+                ("grpc.max_send_message_length", MAX_MESSAGE_LENGTH),
+                ("grpc.max_receive_message_length", MAX_MESSAGE_LENGTH),
+            ]
+        )
+        grpc_pb2_grpc.add_GrpcServerServicer_to_server(servicer, server)
+        server.add_insecure_port(f"[::]:{port}")
+        await server.start()
+        return server
+
+    server = asyncio.run_coroutine_threadsafe(start(), loop).result()
+
+    def stop():
+        asyncio.run_coroutine_threadsafe(server.stop(grace=None), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+
+    return stop
+
+
+def benchmark(num_clients: int, args: argparse.Namespace, port: int) -> float:
+    """Run one configuration and return submissions per second."""
+    server_cls = GrpcAioServer if args.aio else GrpcServer
+    servicer = server_cls(world_size=num_clients, shared_memory=args.shared_memory)
+    if args.aio:
+        stop = start_aio_server(servicer, port)
+    else:
+        stop = start_threaded_server(servicer, port, max_workers=2 * num_clients + 4)
+
+    ctx = mp.get_context("spawn")
+    barrier = ctx.Barrier(num_clients)
+    timings = ctx.Queue()
+    procs = [
+        ctx.Process(
+            target=run_client,
+            args=(
+                i,
+                port,
+                args.rounds,
+                args.params,
+                args.streaming,
+                args.shared_memory,
+                barrier,
+                timings,
+            ),
+        )
+        for i in range(num_clients)
+    ]
+    for proc in procs:
+        proc.start()
+
+    # Rounds are timed inside the clients, from the moment all are connected
+    elapsed = max(timings.get() for _ in procs)
+    for proc in procs:
+        proc.join()
+    stop()
+    servicer.close()
+
+    failed = [proc.pid for proc in procs if proc.exitcode != 0]
+    if failed:
+        raise RuntimeError(f"Client processes failed: {failed}")
+    return num_clients * args.rounds / elapsed
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--params", type=int, default=1_000_000)
+    parser.add_argument("--aio", action="store_true", help="Use GrpcAioServer")
+    parser.add_argument("--streaming", action="store_true", help="Use chunked RPCs")
+    parser.add_argument(
+        "--shared-memory",
+        action="store_true",
+        help="Co-located shared-memory transport",
+    )
+    parser.add_argument("--port", type=int, default=50151)
+    args = parser.parse_args(argv)
+
+    results = []
+    for i, num_clients in enumerate(args.clients):
+        rate = benchmark(num_clients, args, args.port + i)
+        results.append((num_clients, rate))
+
+    mode = "aio" if args.aio else "threaded"
+    transport = "streaming" if args.streaming else "unary"
+    if args.shared_memory:
+        transport = "shared memory"
+    print(
+        f"\ngRPC server contention ({mode}, {transport}, {args.params:,} params, {args.rounds} rounds)"
+    )
+    print(f"{'clients':>8} {'submissions/s':>14} {'speedup':>8}")
+    base = results[0][1]
+    for num_clients, rate in results:
+        print(f"{num_clients:>8} {rate:>14.1f} {rate / base:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
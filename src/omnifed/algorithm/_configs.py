@@ -17,6 +17,8 @@ from typing import List, Optional, Union
 
 from omegaconf import MISSING
 
+from .utils import IntegrityCheck, OptimizerPolicy, Precision
+
 
 @dataclass
 class TriggerConfig:
@@ -103,6 +105,14 @@ class BaseAlgorithmConfig:
     max_epochs_per_round: int = MISSING
     schedules: ExecutionSchedulesConfig = MISSING
     log_dir: str = MISSING  # Directory for metrics logging and TensorBoard output
+    overlap_comm: bool = False  # Overlap intra-group aggregation with pre-sync eval
+    error_feedback: bool = False  # Carry compression residuals into the next sync
+    error_feedback_dtype: Optional[str] = None  # e.g. "bfloat16" residual storage
+    delta_transmission: bool = False  # Send deltas to the last global model
+    integrity_check: IntegrityCheck = IntegrityCheck.FULL  # off/norms/sampled/full
+    precision: Precision = Precision.FP32  # fp32/bf16/fp16 forward passes
+    grad_accumulation_steps: int = 1  # Micro-batches per optimizer step
+    optimizer_policy: OptimizerPolicy = OptimizerPolicy.RESET  # reset/zero/keep
 
 
 @dataclass
@@ -60,6 +60,10 @@ class Trigger:
         self._step_counter += 1
         return should_run
 
+    def peek(self) -> bool:
+        """Check if the next call will execute, without advancing the counter."""
+        return self._should_run(self._step_counter)
+
     def _should_run(self, step: int) -> bool:
         """Check firing condition without advancing counter."""
         if not self.enabled:
@@ -16,17 +16,19 @@ import logging
 import math
 import time
 import warnings
+import weakref
 from abc import abstractmethod
-from contextlib import contextmanager
+from contextlib import closing, contextmanager
 from functools import wraps
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import rich.repr
 import torch
 from torch import nn
 from typeguard import typechecked
 
-from ..communicator import AggregationOp, BaseCommunicator
+from ..communicator import AggregationOp, AsyncWork, BaseCommunicator, TensorFilter
+from ..communicator.compression import BaseCompressor, ErrorFeedback
 from ..data import DataModule
 from ..utils import MetricAggType, MetricLogger, RequiredSetup, print
 from . import utils
@@ -35,6 +37,9 @@ from ._schedules import ExecutionSchedules
 
 # ======================================================================================
 
+# Message key of the round metadata piggybacked on the default aggregation payload
+_CONTROL_KEY = "__control__"
+
 
 @rich.repr.auto
 class BaseAlgorithm(RequiredSetup, LifecycleHooks, MetricLogger):
@@ -68,8 +73,7 @@ class BaseAlgorithm(RequiredSetup, LifecycleHooks, MetricLogger):
         class CustomAlgorithm(BaseAlgorithm):
             # ... same required methods ...
             def _aggregate_within_group(self, comm, weight):
-                utils.scale_params(self.local_model, weight)
-                return comm.aggregate(self.local_model, AggregationOp.SUM)
+                return self._aggregate_weighted_model(comm, weight)
 
     **Advanced - HierarchicalTopology (Cross-Institutional FL):**
     When using HierarchicalTopology for cross-institutional federated learning,
@@ -106,6 +110,16 @@ class BaseAlgorithm(RequiredSetup, LifecycleHooks, MetricLogger):
         max_epochs_per_round: int,
         schedules: ExecutionSchedules,
         log_dir: str,
+        overlap_comm: bool = False,
+        error_feedback: bool = False,
+        error_feedback_dtype: Optional[str] = None,
+        delta_transmission: bool = False,
+        integrity_check: Union[str, utils.IntegrityCheck] = utils.IntegrityCheck.FULL,
+        precision: Union[str, utils.Precision] = utils.Precision.FP32,
+        grad_accumulation_steps: int = 1,
+        optimizer_policy: Union[
+            str, utils.OptimizerPolicy
+        ] = utils.OptimizerPolicy.RESET,
     ):
         """
         Set up a federated learning algorithm with training parameters.
@@ -115,6 +129,22 @@ class BaseAlgorithm(RequiredSetup, LifecycleHooks, MetricLogger):
             max_epochs_per_round: How many epochs each client trains per FL round
             schedules: When to aggregate models and run evaluations
             log_dir: Where to save TensorBoard logs and metrics CSV files
+            overlap_comm: Run the default intra-group aggregation asynchronously
+                on a model snapshot, overlapping it with pre-aggregation evaluation
+            error_feedback: Keep what the local communicator's compression drops
+                from each intra-group aggregation and add it back next sync
+            error_feedback_dtype: Dtype for stored residuals (e.g. "bfloat16");
+                None keeps the dtype of each compressed tensor
+            delta_transmission: Send weighted differences to the last global model
+                instead of weighted models in sample-weighted intra-group aggregation
+            integrity_check: Model checks around each aggregation and broadcast
+                ("off", "norms", "sampled" hashes, or "full" hashes)
+            precision: Forward-pass precision for training and evaluation
+                ("fp32", "bf16" autocast, or "fp16" autocast with loss scaling)
+            grad_accumulation_steps: Micro-batches each training batch is split
+                into, accumulating their gradients into one optimizer step
+            optimizer_policy: Local optimizer after each aggregation ("reset"
+                builds a new one, "zero" zeroes its state in place, "keep" keeps it)
         """
         # Validate training parameters
         if local_lr <= 0:
@@ -123,6 +153,10 @@ class BaseAlgorithm(RequiredSetup, LifecycleHooks, MetricLogger):
             raise ValueError(
                 f"max_epochs_per_round must be positive, got {max_epochs_per_round}"
             )
+        if grad_accumulation_steps < 1:
+            raise ValueError(
+                f"grad_accumulation_steps must be at least 1, got {grad_accumulation_steps}"
+            )
 
         RequiredSetup.__init__(self)
         LifecycleHooks.__init__(self)
@@ -147,6 +181,36 @@ class BaseAlgorithm(RequiredSetup, LifecycleHooks, MetricLogger):
         # Directory for metrics logging and TensorBoard output
         self.log_dir: str = log_dir
 
+        # Overlap intra-group aggregation with pre-aggregation evaluation
+        self.overlap_comm: bool = overlap_comm
+
+        # Residual memory for compressed intra-group aggregation
+        self.__error_feedback: Optional[ErrorFeedback] = (
+            ErrorFeedback(error_feedback_dtype) if error_feedback else None
+        )
+
+        # Transmit model deltas against the last global model (captured in _setup)
+        self.delta_transmission: bool = delta_transmission
+        self.__global_reference: Optional[Dict[str, torch.Tensor]] = None
+        # References of other models aggregated with _aggregate_weighted_model
+        self.__model_references: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+        # Divisor of the sample weights in default aggregation (same on every rank)
+        self.__weight_base: Optional[int] = None
+
+        # Model checks run by track_model_operation()
+        self.integrity_check = utils.IntegrityCheck(integrity_check)
+
+        # Mixed precision (fp16 loss scaler created in _setup for the model's device)
+        self.precision = utils.Precision(precision)
+        self.__grad_scaler: Optional[torch.amp.GradScaler] = None
+
+        # Micro-batches per optimizer step (bounds activation memory per pass)
+        self.grad_accumulation_steps: int = grad_accumulation_steps
+
+        # Local optimizer lifecycle across aggregations
+        self.optimizer_policy = utils.OptimizerPolicy(optimizer_policy)
+
         # Node context dependencies (injected via _setup())
         self.__local_comm: Optional[BaseCommunicator] = None
         self.__global_comm: Optional[BaseCommunicator] = None
@@ -240,6 +304,11 @@ class BaseAlgorithm(RequiredSetup, LifecycleHooks, MetricLogger):
     def local_optimizer(self, value: torch.optim.Optimizer) -> None:
         self.__local_optimizer = value
 
+    @property
+    def grad_scaler(self) -> Optional[torch.amp.GradScaler]:
+        """Loss scaler for fp16 training (None for fp32 and bf16)."""
+        return self.__grad_scaler
+
     @property
     def round_idx(self) -> int:
         """Current federated learning round index."""
@@ -413,6 +482,15 @@ class BaseAlgorithm(RequiredSetup, LifecycleHooks, MetricLogger):
         self.__group_max_epochs_per_round = group_max_epochs_per_round
         self.__max_rounds = max_rounds
 
+        # Validate precision for the model's device; kept across rounds
+        self.__grad_scaler = utils.make_grad_scaler(
+            self.precision, next(model.parameters()).device
+        )
+
+        # Models are identical across the group here (broadcast by Node before setup)
+        if self.delta_transmission:
+            self.__update_global_reference()
+
     # =============================================================================
     # MINIMAL OVERRIDES
     # =============================================================================
@@ -424,7 +502,8 @@ class BaseAlgorithm(RequiredSetup, LifecycleHooks, MetricLogger):
 
         **REQUIRED OVERRIDE**: Subclasses must implement this method.
 
-        Called once per FL round to get a fresh optimizer.
+        Called before the first round and, with optimizer_policy="reset", after
+        every aggregation to get a fresh optimizer.
         Most algorithms just use SGD, but you can use Adam, AdamW, or whatever works for your problem.
 
         Args:
@@ -448,6 +527,8 @@ class BaseAlgorithm(RequiredSetup, LifecycleHooks, MetricLogger):
         This is where your model's forward pass happens.
         The framework handles everything else (backward pass, optimizer steps, metrics tracking).
         Just focus on getting your predictions and computing the loss.
+        It runs once per micro-batch (and under torch.no_grad() in evaluation),
+        so step extra optimizers in _optimizer_step() rather than here.
 
         Args:
             batch: Single batch from your DataLoader (already moved to device)
@@ -488,19 +569,10 @@ class BaseAlgorithm(RequiredSetup, LifecycleHooks, MetricLogger):
             return comm.aggregate(self.local_model, AggregationOp.MEAN)
 
             # Sample-weighted aggregation (default behavior, better for unbalanced data)
-            utils.scale_params(self.local_model, weight)
-            return comm.aggregate(self.local_model, AggregationOp.SUM)
+            return self._aggregate_weighted_model(comm, weight)
         """
-        # Scale this client's model by its data proportion within the group
-        utils.scale_params(self.local_model, weight, include_buffers=True)
-
-        # Aggregate weighted models across all clients in the group
-        aggregated_model = comm.aggregate(
-            self.local_model,
-            reduction=AggregationOp.SUM,
-        )
-
-        return aggregated_model
+        # Sum this client's model, weighted by its data proportion within the group
+        return self._aggregate_weighted_model(comm, weight, include_buffers=True)
 
     def _aggregate_across_groups(
         self, comm: BaseCommunicator, weight: float
@@ -533,6 +605,100 @@ class BaseAlgorithm(RequiredSetup, LifecycleHooks, MetricLogger):
 
         return aggregated_model
 
+    def _aggregate_weighted_model(
+        self,
+        comm: BaseCommunicator,
+        weight: float,
+        *,
+        include_buffers: bool = False,
+        filter_fn: Optional[Callable[[str, torch.Tensor], bool]] = None,
+        model: Optional[nn.Module] = None,
+    ) -> nn.Module:
+        """
+        Sum a model across the group, scaled by this client's weight.
+
+        Only trainable parameters (and floating-point buffers if
+        include_buffers) accepted by filter_fn are weighted and sent; all
+        other tensors never leave this client and keep their local values.
+        With delta_transmission, each client sends its weighted difference to
+        the last global model and the model is rebuilt from the aggregated
+        delta, which yields the same result while the payload stays small in
+        magnitude (and compresses better). Other models (e.g. Ditto's global
+        model) are sent in full the first time and as deltas to their own
+        previous aggregate afterwards.
+
+        Args:
+            comm: Communication interface to aggregate over
+            weight: This client's contribution weight
+            include_buffers: Whether buffers (BN stats, etc.) are aggregated
+            filter_fn: Custom filter function(name, tensor) -> bool
+            model: Model to aggregate in place (default: the local model)
+
+        Returns:
+            The aggregated model
+
+        Example:
+            # FedBN: keep BatchNorm layers local
+            return self._aggregate_weighted_model(
+                comm, weight, filter_fn=lambda name, tensor: "bn" not in name
+            )
+        """
+        tensor_filter = TensorFilter(
+            include_buffers=include_buffers, filter_fn=filter_fn
+        )
+        local = model is None or model is self.local_model
+        model = self.local_model if local else model
+        tensors = tensor_filter.select(model)
+        if local:
+            reference = self.__global_reference
+        else:
+            reference = self.__model_references.get(model)
+        if reference is None:
+            # Scale exactly the tensors that are sent
+            with torch.no_grad():
+                for tensor in tensors.values():
+                    tensor.mul_(weight)
+            model = comm.aggregate(
+                model, AggregationOp.SUM, tensor_filter=tensor_filter
+            )
+            if self.delta_transmission and not local:
+                self.__update_model_reference(model, tensors)
+            return model
+
+        with torch.no_grad():
+            deltas = {
+                name: (tensor - reference[name]).mul_(weight)
+                for name, tensor in tensors.items()
+            }
+
+        deltas = comm.aggregate(deltas, reduction=AggregationOp.SUM)
+
+        # Weights sum to 1 over the group, so the reference is added back once
+        with torch.no_grad():
+            for name, tensor in tensors.items():
+                tensor.copy_(deltas[name]).add_(reference[name])
+        if not local:
+            self.__update_model_reference(model, tensors)
+        return model
+
+    def __update_model_reference(
+        self, model: nn.Module, tensors: Dict[str, torch.Tensor]
+    ) -> None:
+        """
+        Record a non-local model's aggregate as its next delta reference.
+
+        The local model's reference is refreshed by __sync_comm instead,
+        after inter-group aggregation and the final broadcast.
+
+        Args:
+            model: Model that was just aggregated
+            tensors: Its aggregated tensors by name
+        """
+        with torch.no_grad():
+            self.__model_references[model] = {
+                name: tensor.clone() for name, tensor in tensors.items()
+            }
+
     # =============================================================================
     # =============================================================================
 
@@ -545,40 +711,228 @@ class BaseAlgorithm(RequiredSetup, LifecycleHooks, MetricLogger):
             print("Starting evaluation epoch")
             self.__eval_epoch(self.local_model)
 
-    def __sync_comm(self) -> None:
+    def __comm_tensors(self) -> Dict[str, torch.Tensor]:
         """
-        Synchronize communication interfaces for intra-group and inter-group operations.
+        Tensors of the local model that communicators exchange.
+
+        Returns:
+            Trainable parameters and floating-point buffers by name
         """
-        # Phase 1: Intra-group aggregation via all-reduce
-        with self.track_model_operation("local_agg"):
-            # Calculate within-group sample totals and weights
-            group_total_samples = self.local_comm.aggregate(
-                torch.tensor([self.__num_samples_trained], dtype=torch.float32),
-                reduction=AggregationOp.SUM,
-            ).item()
-
-            # Validation: warn if no samples trained in group
-            if group_total_samples == 0:
-                warnings.warn(
-                    f"Zero samples trained across all nodes in group ({self.progress_info_str}). "
-                    "Check data availability or epoch scheduling. Using uniform weights for aggregation.",
-                    UserWarning,
-                )
+        return TensorFilter().select(self.local_model)
+
+    def __update_global_reference(self) -> None:
+        """Record the current (global) model as the reference for delta transmission."""
+        with torch.no_grad():
+            self.__global_reference = {
+                name: tensor.clone() for name, tensor in self.__comm_tensors().items()
+            }
 
-            within_group_weight = self.__num_samples_trained / max(
-                group_total_samples, 1
+    def __control_vector(self) -> torch.Tensor:
+        """
+        Round metadata this node contributes to one SUM over the group.
+
+        Integer-typed, so wire dtypes and compression pass it through exactly.
+
+        Returns:
+            [samples trained since last sync, 1 if in inter-group aggregation else 0]
+        """
+        return torch.tensor(
+            [self.__num_samples_trained, int(self.global_comm is not None)],
+            dtype=torch.int64,
+        )
+
+    def __read_control(self, control: torch.Tensor) -> Tuple[float, bool]:
+        """
+        Unpack a control vector summed over the group.
+
+        Args:
+            control: Group sum of __control_vector()
+
+        Returns:
+            Tuple of (group total samples, whether a final broadcast is needed)
+        """
+        group_total_samples, global_members = control.tolist()
+
+        # Validation: warn if no samples trained in group
+        if group_total_samples == 0:
+            warnings.warn(
+                f"Zero samples trained across all nodes in group ({self.progress_info_str}). "
+                "Check data availability or epoch scheduling. Using uniform weights for aggregation.",
+                UserWarning,
             )
+        return float(group_total_samples), global_members > 0
+
+    def __attach_error_feedback(self) -> Optional[BaseCompressor]:
+        """
+        Attach the residual memory to the local communicator's compressor.
+
+        Returns:
+            Compressor now applying error feedback, or None if disabled
+        """
+        if self.__error_feedback is None:
+            return None
+        compressor = getattr(self.local_comm, "compression", None)
+        if compressor is None:
+            warnings.warn(
+                "error_feedback ignored: local communicator has no compression",
+                UserWarning,
+            )
+            self.__error_feedback = None
+            return None
+        self.__error_feedback.reset_calls()
+        compressor.error_feedback = self.__error_feedback
+        return compressor
+
+    def __detach_error_feedback(self) -> None:
+        """Stop applying error feedback (residuals are kept for the next sync)."""
+        compressor = getattr(self.local_comm, "compression", None)
+        if compressor is not None:
+            compressor.error_feedback = None
+
+    @contextmanager
+    def __error_feedback_scope(self):
+        """Apply error feedback to compression within this block."""
+        self.__attach_error_feedback()
+        try:
+            yield
+        finally:
+            self.__detach_error_feedback()
+
+    def __aggregate_within_group_sync(self) -> Tuple[float, bool]:
+        """
+        Run intra-group aggregation through an overridden _aggregate_within_group.
+
+        The round metadata needed for the weights takes one collective first.
 
+        Returns:
+            Tuple of (group total samples, whether a final broadcast is needed)
+        """
+        # Calculate within-group sample totals and weights
+        group_total_samples, needs_final_bcast = self.__read_control(
+            self.local_comm.aggregate(self.__control_vector(), AggregationOp.SUM)
+        )
+        within_group_weight = self.__num_samples_trained / max(group_total_samples, 1)
+
+        with self.__error_feedback_scope():
             self.local_model = self._aggregate_within_group(
                 self.local_comm, within_group_weight
             )
+        return group_total_samples, needs_final_bcast
+
+    def __uses_default_aggregation(self) -> bool:
+        """Whether _aggregate_within_group is the framework's sample-weighted default."""
+        default_agg = BaseAlgorithm._aggregate_within_group
+        return type(self)._aggregate_within_group is default_agg
+
+    def __can_overlap_comm(self) -> bool:
+        """Whether intra-group aggregation can be started before pre-sync evaluation."""
+        if not self.overlap_comm:
+            return False
+        # Custom aggregation may read or modify algorithm state synchronously
+        if not self.__uses_default_aggregation():
+            warnings.warn(
+                f"overlap_comm ignored: {type(self).__name__} overrides _aggregate_within_group",
+                UserWarning,
+            )
+            self.overlap_comm = False
+            return False
+        return True
+
+    def __start_local_agg(self) -> AsyncWork:
+        """
+        Start default sample-weighted intra-group aggregation without blocking.
+
+        Reduces a snapshot of the model (or of its delta to the last global
+        model) scaled by this node's sample count over the weight base, with
+        the control vector piggybacked in the same payload, so the round
+        metadata needs no collective of its own. The local model can still be
+        evaluated while the reduction is in flight. Error feedback stays
+        attached until __finish_local_agg has waited for the result.
+
+        The weight base is the group total of the previous sync, identical on
+        every rank, so weights stay near 1 (raw counts would overflow fp16
+        wire dtypes) and __finish_local_agg can rescale exactly. The first
+        sync reads the group total with one extra collective instead.
+
+        Returns:
+            Handle to the aggregated payload
+        """
+        if self.__weight_base is None:
+            control = self.local_comm.aggregate(
+                self.__control_vector(), AggregationOp.SUM
+            )
+            self.__weight_base = max(int(control[0].item()), 1)
+
+        weight = self.__num_samples_trained / self.__weight_base
+        reference = self.__global_reference
+        with torch.no_grad():
+            payload = {
+                name: (
+                    tensor * weight
+                    if reference is None
+                    else (tensor - reference[name]).mul_(weight)
+                )
+                for name, tensor in self.__comm_tensors().items()
+            }
+        payload[_CONTROL_KEY] = self.__control_vector()
+        self.__attach_error_feedback()
+        return self.local_comm.aggregate_async(payload, AggregationOp.SUM)
+
+    def __finish_local_agg(self, work: AsyncWork) -> Tuple[float, bool]:
+        """
+        Wait for __start_local_agg and normalize the result into the local model.
+
+        Args:
+            work: Handle returned by __start_local_agg
+
+        Returns:
+            Tuple of (group total samples, whether a final broadcast is needed)
+        """
+        try:
+            aggregated = work.wait()
+        finally:
+            self.__detach_error_feedback()
+        group_total_samples, needs_final_bcast = self.__read_control(
+            aggregated[_CONTROL_KEY]
+        )
+
+        # Payloads were weighted by samples / weight base; rescale to samples / total
+        scale = self.__weight_base / max(group_total_samples, 1)
+        self.__weight_base = max(int(group_total_samples), 1)
+        reference = self.__global_reference
+        with torch.no_grad():
+            for name, tensor in self.__comm_tensors().items():
+                tensor.copy_(aggregated[name]).mul_(scale)
+                if reference is not None:
+                    tensor.add_(reference[name])
+        return group_total_samples, needs_final_bcast
+
+    def __sync_comm(self, pending: Optional[AsyncWork] = None) -> None:
+        """
+        Synchronize communication interfaces for intra-group and inter-group operations.
+
+        Args:
+            pending: In-flight intra-group aggregation from __start_local_agg, if any
+        """
+        # Phase 1: Intra-group aggregation via all-reduce (round metadata included)
+        with self.track_model_operation("local_agg"):
+            if pending is None and self.__uses_default_aggregation():
+                pending = self.__start_local_agg()
+            if pending is not None:
+                group_total_samples, needs_final_bcast = self.__finish_local_agg(
+                    pending
+                )
+            else:
+                group_total_samples, needs_final_bcast = (
+                    self.__aggregate_within_group_sync()
+                )
 
         # Phase 2: Inter-group coordination (group servers only)
         if self.global_comm is not None:
             with self.track_model_operation("global_agg"):
                 # Calculate across-group sample totals and weights using group totals
                 global_total_samples = self.global_comm.aggregate(
-                    torch.tensor([group_total_samples], dtype=torch.float32),
+                    torch.tensor([int(group_total_samples)], dtype=torch.int64),
                     reduction=AggregationOp.SUM,
                 ).item()
 
@@ -599,19 +953,16 @@ class BaseAlgorithm(RequiredSetup, LifecycleHooks, MetricLogger):
         # Phase 3: Conditional broadcast to distribute global results
         # In cross-institutional/hierarchical FL: only group representatives participate in global_comm,
         # but all nodes need the final global model.
-        # Check if any node in this local group participated in global aggregation.
-        needs_final_bcast = (
-            self.local_comm.aggregate(
-                torch.tensor(1.0 if self.global_comm is not None else 0.0),
-                AggregationOp.MAX,
-            )
-            > 0
-        )
-
+        # Whether any node in this local group participated in global aggregation
+        # arrived with the phase 1 round metadata.
         if needs_final_bcast:
             with self.track_model_operation("local_bcast"):
                 self.local_model = self.local_comm.broadcast(self.local_model)
 
+        # Deltas of the next sync are taken against this global model
+        if self.delta_transmission:
+            self.__update_global_reference()
+
     def __post_sync(self) -> None:
         """
         Finalize federated model aggregation and evaluation.
@@ -641,21 +992,48 @@ class BaseAlgorithm(RequiredSetup, LifecycleHooks, MetricLogger):
         2. Inter-group coordination: Group representatives aggregate globally
         3. Conditional broadcast: Distribute global results if inter-group occurred
         4. Post-aggregation evaluation (final aggregated model state)
+
+        Round metadata (sample counts, inter-group participation) travels in
+        one collective per sync, inside the model payload for the default
+        aggregation. With overlap_comm, phase 1 is launched before phase 0
+        and completed after it.
         """
+        # Start intra-group aggregation early so it overlaps with pre-sync evaluation
+        pending = self.__start_local_agg() if self.__can_overlap_comm() else None
+
         self.__pre_sync()
 
-        self.__sync_comm()
+        self.__sync_comm(pending)
 
         self.__post_sync()
 
         # Reset optimizer and sample counter after aggregation
         # After any aggregation (including broadcast), the model parameters have changed,
-        # so the optimizer's internal state (momentum, Adam statistics, etc.) is no longer valid.
-        # All nodes must create fresh optimizers for the new parameters.
-        # Similarly, num_samples_trained resets to track samples for the next aggregation.
-        self.__local_optimizer = self._configure_local_optimizer(self.local_lr)
+        # so the optimizer's internal state (momentum, Adam statistics, etc.) is stale.
+        # num_samples_trained resets to track samples for the next aggregation.
+        self.__renew_local_optimizer()
         self.__num_samples_trained = 0
 
+    def __renew_local_optimizer(self) -> None:
+        """
+        Apply the optimizer policy after an aggregation.
+
+        "reset" builds a new optimizer with _configure_local_optimizer().
+        "zero" and "keep" reuse the current one, zeroing its state buffers in
+        place or keeping them, so nothing is reallocated (a scheduler or other
+        object attached to the optimizer also carries on). The optimizer is
+        rebuilt regardless if aggregation replaced the model's parameters.
+        """
+        optimizer = self.__local_optimizer
+        if (
+            self.optimizer_policy == utils.OptimizerPolicy.RESET
+            or optimizer is None
+            or not utils.optimizes_model(optimizer, self.local_model)
+        ):
+            self.__local_optimizer = self._configure_local_optimizer(self.local_lr)
+        elif self.optimizer_policy == utils.OptimizerPolicy.ZERO:
+            utils.zero_optimizer_state(optimizer)
+
     def round_exec(self, round_idx: int, max_rounds: int) -> None:
         """
         Execute one complete federated learning round.
@@ -735,83 +1113,94 @@ class BaseAlgorithm(RequiredSetup, LifecycleHooks, MetricLogger):
         # Train epoch start hook
         self._train_epoch_start()
 
-        # Initialize dataloader iterator for sequential batch processing
-        dataloader_iter = iter(self.datamodule.train or [])
-
+        # Device-ready batches (prefetched in the background if the datamodule says so)
         device = next(self.local_model.parameters()).device
+        batches = self.datamodule.iter_batches(
+            self.datamodule.train,
+            device,
+            lambda batch: self._transfer_batch_to_device(batch, device=device),
+        )
+
+        # Closing stops prefetching batches this epoch will not use
+        with closing(batches):
+            # All nodes participate in synchronized batch loop
+            for batch_idx in range(self.group_max_iters_per_epoch):
+                # Set batch index and start batch processing
+                self.batch_idx = batch_idx
+                _t_batch_start = time.time()
+                # Overridable hook for algorithm-specific logic
+                self._train_batch_start()
 
-        # All nodes participate in synchronized batch loop
-        for batch_idx in range(self.group_max_iters_per_epoch):
-            # Set batch index and start batch processing
-            self.batch_idx = batch_idx
-            _t_batch_start = time.time()
-            # Overridable hook for algorithm-specific logic
-            self._train_batch_start()
-
-            # Data preparation: fetch and transfer batch
-            batch = None
-            if self.epoch_idx < self.max_epochs_per_round:
-                try:
-                    _t_batch_data_start = time.time()
-                    batch = next(dataloader_iter)
-                    batch = self._transfer_batch_to_device(batch, device=device)
-                    _t_batch_data_end = time.time()
+                # Data preparation: fetch and transfer batch
+                batch = None
+                if self.epoch_idx < self.max_epochs_per_round:
+                    try:
+                        _t_batch_data_start = time.time()
+                        batch = next(batches)
+                        _t_batch_data_end = time.time()
+                        self.log_metric(
+                            "batch_time_data",
+                            _t_batch_data_end - _t_batch_data_start,
+                        )
+                    except StopIteration:
+                        # Node has exhausted its data - continue with None batch for synchronization
+                        pass
+
+                # Execute batch computation
+                if batch is not None:
+                    _t_batch_compute_start = time.time()
+                    # Framework handles batch size inference first
+                    batch_size = self._infer_batch_size(batch)
+
+                    # Execute user training logic and get metrics
+                    user_metrics = self._train_batch(batch)
+
+                    # Only count samples after successful training
+                    self.__num_samples_trained += batch_size
+
+                    # Framework handles metric logging
+                    for metric_name, metric_value in user_metrics.items():
+                        self.log_metric(metric_name, metric_value)
+
+                    # Framework adds automatic metrics
                     self.log_metric(
-                        "batch_time_data",
-                        _t_batch_data_end - _t_batch_data_start,
+                        "epoch_total_samples", batch_size, MetricAggType.SUM
                     )
-                except StopIteration:
-                    # Node has exhausted its data - continue with None batch for synchronization
-                    pass
+                    self.log_metric("epoch_total_batches", 1, MetricAggType.SUM)
 
-            # Execute batch computation
-            if batch is not None:
-                _t_batch_compute_start = time.time()
-                # Framework handles batch size inference first
-                batch_size = self._infer_batch_size(batch)
+                    _t_batch_compute_end = time.time()
+                    self.log_metric(
+                        "batch_time_compute",
+                        _t_batch_compute_end - _t_batch_compute_start,
+                    )
 
-                # Execute user training logic and get metrics
-                user_metrics = self._train_batch(batch)
+                # Batch-level aggregation
+                if self.schedules.aggregation.batch_end():
+                    self.__sync()
 
-                # Only count samples after successful training
-                self.__num_samples_trained += batch_size
+                # Overridable hook for algorithm-specific logic
+                self._train_batch_end()
 
-                # Framework handles metric logging
-                for metric_name, metric_value in user_metrics.items():
-                    self.log_metric(metric_name, metric_value)
+                # Accumulate timing metrics for batch-level processing
+                _t_batch_end = time.time()
 
-                # Framework adds automatic metrics
-                self.log_metric("epoch_total_samples", batch_size, MetricAggType.SUM)
-                self.log_metric("epoch_total_batches", 1, MetricAggType.SUM)
+                # Add batch timing metrics to accumulator
 
-                _t_batch_compute_end = time.time()
                 self.log_metric(
-                    "batch_time_compute",
-                    _t_batch_compute_end - _t_batch_compute_start,
+                    "batch_time_total",
+                    _t_batch_end - _t_batch_start,
                 )
 
-            # Batch-level aggregation
-            if self.schedules.aggregation.batch_end():
-                self.__sync()
-
-            # Overridable hook for algorithm-specific logic
-            self._train_batch_end()
-
-            # Accumulate timing metrics for batch-level processing
-            _t_batch_end = time.time()
-
-            # Add batch timing metrics to accumulator
-
-            self.log_metric(
-                "batch_time_total",
-                _t_batch_end - _t_batch_start,
-            )
-
         # ---
-        # Epoch boundary synchronization
-        with self.log_duration("epoch_heartbeat_time"):
-            sync_signal = torch.tensor([1.0])
-            total_signals = self.local_comm.aggregate(sync_signal, AggregationOp.SUM)
+        # Epoch boundary synchronization (a sync right after is a barrier already)
+        last_epoch = self.epoch_idx == self.group_max_epochs_per_round - 1
+        sync_follows = self.schedules.aggregation.epoch_end.peek() or (
+            last_epoch and self.schedules.aggregation.round_end.peek()
+        )
+        if not sync_follows:
+            with self.log_duration("epoch_heartbeat_time"):
+                sync_signal = torch.tensor([1.0])
+                self.local_comm.aggregate(sync_signal, AggregationOp.SUM)
 
         # Epoch-level aggregation
         if self.schedules.aggregation.epoch_end():
@@ -850,24 +1239,26 @@ class BaseAlgorithm(RequiredSetup, LifecycleHooks, MetricLogger):
         # Overridable hook for algorithm-specific logic
         self._eval_epoch_start()
 
-        # Initialize dataloader iterator for sequential batch processing
-        dataloader_iter = iter(self.datamodule.eval or [])
+        # Device-ready batches (prefetched in the background if the datamodule says so)
+        device = next(model.parameters()).device
+        batches = self.datamodule.iter_batches(
+            self.datamodule.eval,
+            device,
+            lambda batch: self._transfer_batch_to_device(batch, device),
+        )
 
-        with torch.no_grad():
+        with torch.no_grad(), closing(batches):
             # Simple loop through eval data - no synchronization needed during eval
-            for idx, batch in enumerate(dataloader_iter):
+            _t_batch_data_start = time.time()
+            for idx, batch in enumerate(batches):
+                # Data preparation: wait for the fetched and transferred batch
+                _t_batch_data_end = time.time()
+
                 # Start batch processing with detailed timing
-                _t_batch_start = time.time()
+                _t_batch_start = _t_batch_data_start
                 # Overridable hook for algorithm-specific logic
                 self._eval_batch_start()
 
-                # Data preparation: fetch and transfer batch
-                _t_batch_data_start = time.time()
-                batch = self._transfer_batch_to_device(
-                    batch, next(model.parameters()).device
-                )
-                _t_batch_data_end = time.time()
-
                 # Execute evaluation batch computation
                 _t_batch_compute_start = time.time()
 
@@ -875,7 +1266,8 @@ class BaseAlgorithm(RequiredSetup, LifecycleHooks, MetricLogger):
                 batch_size = self._infer_batch_size(batch)
 
                 # Execute user evaluation logic and get metrics
-                user_metrics = self._eval_batch(batch)
+                with self._autocast():
+                    user_metrics = self._eval_batch(batch)
 
                 # Framework handles metric logging
                 for metric_name, metric_value in user_metrics.items():
@@ -906,6 +1298,7 @@ class BaseAlgorithm(RequiredSetup, LifecycleHooks, MetricLogger):
                     "batch_time_total",
                     _t_batch_end - _t_batch_start,
                 )
+                _t_batch_data_start = time.time()
 
         # Overridable hook for algorithm-specific logic
         self._eval_epoch_end()
@@ -918,10 +1311,19 @@ class BaseAlgorithm(RequiredSetup, LifecycleHooks, MetricLogger):
         """
         Execute training computation for one batch.
 
-        **Override for custom training procedures** like gradient accumulation,
-        mixed precision, or specialized batch processing.
+        **Override for custom training procedures** like multi-model updates
+        or specialized batch processing.
         Default: Forward pass, backward pass, optimizer step, return loss metric.
 
+        The batch is split into grad_accumulation_steps micro-batches with
+        _split_batch(); each runs _compute_loss() and _backward_pass() with its
+        loss weighted by its share of the batch, so the accumulated gradients
+        match the full batch's. _optimizer_step() then runs once per batch.
+
+        Forward passes run under self._autocast(). With fp16, the loss handed
+        to _backward_pass() is scaled by self.grad_scaler, gradients are unscaled
+        again before _optimizer_step(), and the step is skipped on overflow.
+
         Args:
             batch: Training batch from DataLoader (already moved to device)
 
@@ -929,24 +1331,55 @@ class BaseAlgorithm(RequiredSetup, LifecycleHooks, MetricLogger):
             Dictionary of metrics to log (e.g., {"loss": 0.5, "accuracy": 0.9})
             Framework automatically adds samples and batches metrics
         """
-        # Forward pass
-        loss = self._compute_loss(batch)
-
-        # Training operations
+        scaler = self.__grad_scaler
         self.local_optimizer.zero_grad()
-        self._backward_pass(loss)
+
+        if self.grad_accumulation_steps == 1:
+            micro_batches = [(batch, 1.0)]
+        else:
+            batch_size = self._infer_batch_size(batch)
+            micro_batches = []
+            for micro_batch in self._split_batch(batch, self.grad_accumulation_steps):
+                # Batches smaller than the step count leave empty micro-batches
+                micro_size = self._infer_batch_size(micro_batch)
+                if micro_size > 0:
+                    micro_batches.append((micro_batch, micro_size / batch_size))
+
+        # Forward and backward pass per micro-batch, accumulating gradients
+        loss = 0.0
+        for micro_batch, share in micro_batches:
+            with self._autocast():
+                micro_loss = self._compute_loss(micro_batch)
+            if share != 1.0:
+                micro_loss = micro_loss * share
+            self._backward_pass(
+                micro_loss if scaler is None else scaler.scale(micro_loss)
+            )
+            loss = loss + micro_loss.detach()
+
+        if scaler is not None:
+            scaler.unscale_(self.local_optimizer)
 
         # Capture gradient norm before optimizer step
         grad_norm = utils.get_grad_norm(self.local_model)
 
-        self._optimizer_step()
-
-        # Return metrics to log
-        return {
-            "loss": loss.detach().item(),
+        metrics = {
+            "loss": loss.item(),
             "grad_norm": grad_norm,
         }
 
+        if scaler is None:
+            self._optimizer_step()
+        else:
+            # Overflowed fp16 gradients: skip the step and let the scaler back off
+            if math.isfinite(grad_norm):
+                self._optimizer_step()
+            scaler.update()
+            metrics["grad_scale"] = scaler.get_scale()
+
+        # Return metrics to log
+        return metrics
+
     def _eval_batch(self, batch: Any) -> Dict[str, float]:
         """
         Execute evaluation computation for one batch.
@@ -976,6 +1409,11 @@ class BaseAlgorithm(RequiredSetup, LifecycleHooks, MetricLogger):
         **Override for custom gradient computation** like gradient clipping,
         gradient accumulation, or specialized differentiation techniques.
         Default implementation uses standard PyTorch backpropagation.
+
+        Called once per micro-batch, so gradients may already hold earlier
+        micro-batches' contributions. With fp16 precision the loss (and so every
+        gradient) is still scaled here; edit gradients in _optimizer_step(),
+        where they are unscaled and complete.
         """
         loss.backward()
 
@@ -989,6 +1427,18 @@ class BaseAlgorithm(RequiredSetup, LifecycleHooks, MetricLogger):
         """
         self.local_optimizer.step()
 
+    def _autocast(self) -> torch.autocast:
+        """
+        Autocast context for forward passes at the configured precision.
+
+        Applied by the framework around _compute_loss() in _train_batch() and
+        around _eval_batch(); use it in overrides that run their own forward pass.
+        Disabled (a no-op) for fp32.
+        """
+        device = next(self.local_model.parameters()).device
+        dtype = self.precision.autocast_dtype
+        return torch.autocast(device.type, dtype=dtype, enabled=dtype is not None)
+
     # =============================================================================
     # MISC UTILITY METHODS
     # =============================================================================
@@ -1079,12 +1529,79 @@ class BaseAlgorithm(RequiredSetup, LifecycleHooks, MetricLogger):
             f"Override _infer_batch_size() to handle your custom batch format."
         )
 
+    def _split_batch(self, batch: Any, num_micro_batches: int) -> List[Any]:
+        """
+        Split a batch into micro-batches for gradient accumulation.
+
+        **Override for custom batch formats** not supported by the default logic.
+        Tensors (also inside tuples, lists and dicts) are split along their first
+        dimension with torch.tensor_split, so trailing micro-batches are empty
+        when the batch has fewer samples than num_micro_batches. Other values
+        are shared by every micro-batch.
+
+        Args:
+            batch: Data batch (already moved to device)
+            num_micro_batches: Number of micro-batches to produce
+
+        Returns:
+            List of num_micro_batches batches with the same structure
+        """
+        # Single tensor
+        if isinstance(batch, torch.Tensor):
+            return list(torch.tensor_split(batch, num_micro_batches))
+
+        # Tuple/list - split each item and regroup
+        if isinstance(batch, (tuple, list)):
+            columns = [self._split_batch(item, num_micro_batches) for item in batch]
+            return [
+                tuple(column[i] for column in columns)
+                if isinstance(batch, tuple)
+                else [column[i] for column in columns]
+                for i in range(num_micro_batches)
+            ]
+
+        # Dictionary - split each value and regroup
+        if isinstance(batch, dict):
+            columns = {
+                key: self._split_batch(value, num_micro_batches)
+                for key, value in batch.items()
+            }
+            return [
+                {key: column[i] for key, column in columns.items()}
+                for i in range(num_micro_batches)
+            ]
+
+        return [batch] * num_micro_batches
+
     @contextmanager
     def track_model_operation(self, op_name: str):
-        """Context manager to track model parameter and buffer changes during operations."""
+        """
+        Context manager to track model parameter and buffer changes during operations.
+
+        How much is checked depends on integrity_check: "off" only times the
+        operation, "norms" adds the norm-based fatal checks and warnings, and
+        "sampled"/"full" also hash parameters and buffers to detect no-ops.
+        """
+        level = self.integrity_check
+        if level == utils.IntegrityCheck.OFF:
+            with self.log_duration(f"{op_name}_time"):
+                yield
+            return
+
+        hashing = level != utils.IntegrityCheck.NORMS
+        sample_numel = (
+            utils.SAMPLED_HASH_NUMEL if level == utils.IntegrityCheck.SAMPLED else None
+        )
+
+        def model_hashes() -> Tuple[str, str]:
+            return (
+                utils.hash_model_params(self.local_model, sample_numel),
+                utils.hash_model_buffers(self.local_model, sample_numel),
+            )
+
         before_param_norm = utils.get_param_norm(self.local_model)
-        before_param_hash = utils.hash_model_params(self.local_model)
-        before_buffer_hash = utils.hash_model_buffers(self.local_model)
+        if hashing:
+            before_param_hash, before_buffer_hash = model_hashes()
 
         # Log before metrics
         self.log_metric(f"{op_name}_param_norm_before", before_param_norm)
@@ -1103,39 +1620,45 @@ class BaseAlgorithm(RequiredSetup, LifecycleHooks, MetricLogger):
             yield
 
         after_param_norm = utils.get_param_norm(self.local_model)
-        after_param_hash = utils.hash_model_params(self.local_model)
-        after_buffer_hash = utils.hash_model_buffers(self.local_model)
-
         delta = after_param_norm - before_param_norm
-        params_changed = before_param_hash != after_param_hash
-        buffers_changed = before_buffer_hash != after_buffer_hash
 
         # Log after metrics
         self.log_metric(f"{op_name}_param_norm_after", after_param_norm)
         self.log_metric(f"{op_name}_param_norm_delta", delta)
-        self.log_metric(f"{op_name}_params_changed", 1.0 if params_changed else 0.0)
-        self.log_metric(f"{op_name}_buffers_changed", 1.0 if buffers_changed else 0.0)
 
-        print(
-            f"{op_name.upper()} local_model params: {before_param_hash[:8]} → {after_param_hash[:8]} | "
-            f"buffers: {before_buffer_hash[:8]} → {after_buffer_hash[:8]} | "
-            f"param_norm: {before_param_norm:.4f} → {after_param_norm:.4f} (Δ={delta:.6f}) | "
-            f"P:{'CHG' if params_changed else 'SAME'} B:{'CHG' if buffers_changed else 'SAME'}"
-        )
+        norm_info = f"param_norm: {before_param_norm:.4f} → {after_param_norm:.4f} (Δ={delta:.6f})"
+        if hashing:
+            after_param_hash, after_buffer_hash = model_hashes()
+            params_changed = before_param_hash != after_param_hash
+            buffers_changed = before_buffer_hash != after_buffer_hash
 
-        # Warnings for suspicious patterns (before fatal checks)
-        if not params_changed:
-            warnings.warn(
-                f"Operation {op_name} completed but parameters unchanged.",
-                UserWarning,
+            self.log_metric(f"{op_name}_params_changed", 1.0 if params_changed else 0.0)
+            self.log_metric(
+                f"{op_name}_buffers_changed", 1.0 if buffers_changed else 0.0
             )
 
-        if not buffers_changed:
-            warnings.warn(
-                f"Operation {op_name} completed but buffers unchanged.",
-                UserWarning,
+            print(
+                f"{op_name.upper()} local_model params: {before_param_hash[:8]} → {after_param_hash[:8]} | "
+                f"buffers: {before_buffer_hash[:8]} → {after_buffer_hash[:8]} | "
+                f"{norm_info} | "
+                f"P:{'CHG' if params_changed else 'SAME'} B:{'CHG' if buffers_changed else 'SAME'}"
             )
 
+            # Warnings for suspicious patterns (before fatal checks)
+            if not params_changed:
+                warnings.warn(
+                    f"Operation {op_name} completed but parameters unchanged.",
+                    UserWarning,
+                )
+
+            if not buffers_changed:
+                warnings.warn(
+                    f"Operation {op_name} completed but buffers unchanged.",
+                    UserWarning,
+                )
+        else:
+            print(f"{op_name.upper()} local_model {norm_info}")
+
         # Fatal check: operation must not corrupt the model
         if after_param_norm == 0.0:
             raise RuntimeError(
@@ -13,15 +13,14 @@
 # limitations under the License.
 
 import copy
-from typing import Any
+from typing import Any, Dict
 
 import rich.repr
 import torch
 import torch.nn as nn
 
 
-from ..communicator import AggregationOp, BaseCommunicator
-from . import utils
+from ..communicator import BaseCommunicator
 from .base import BaseAlgorithm
 
 # ======================================================================================
@@ -52,7 +51,7 @@ class Ditto(BaseAlgorithm):
 
         # Deep-copy retains requires_grad state from local_model
         self.global_model = copy.deepcopy(self.local_model)
-        # Ditto trains the global model actively (forward/backward/optimizer.step)
+        # Ditto trains the global model actively (see _compute_loss and _optimizer_step)
 
         self.global_optimizer = torch.optim.SGD(
             self.global_model.parameters(), lr=self.global_lr
@@ -66,20 +65,17 @@ class Ditto(BaseAlgorithm):
 
     def _compute_loss(self, batch: Any) -> torch.Tensor:
         """
-        Perform dual training: update both global model and personal model.
+        Compute the personal objective; in training, also the global model's loss.
+
+        The global loss is added with zero value (loss - loss.detach()), so the
+        returned loss is the personal objective while one backward pass also
+        accumulates the global model's gradients. Both models thereby get the
+        same micro-batch weighting and fp16 loss scaling; _optimizer_step()
+        updates the global model once per batch.
         """
         inputs, targets = batch
-        batch_size = inputs.size(0)
-
-        # Step 1: Update global model with standard loss
-        global_outputs = self.global_model(inputs)
-        global_loss = nn.functional.cross_entropy(global_outputs, targets)
-
-        self.global_optimizer.zero_grad()
-        global_loss.backward()
-        self.global_optimizer.step()
 
-        # Step 2: Update personal model with proximal regularization
+        # Personal model with proximal regularization towards the global model
         personal_outputs = self.local_model(inputs)
         personal_loss = nn.functional.cross_entropy(personal_outputs, targets)
 
@@ -94,21 +90,43 @@ class Ditto(BaseAlgorithm):
 
         total_loss = personal_loss + 0.5 * self.ditto_lambda * proximal_reg
 
+        if torch.is_grad_enabled():
+            # Global model with standard loss (gradients reach global_model only)
+            global_outputs = self.global_model(inputs)
+            global_loss = nn.functional.cross_entropy(global_outputs, targets)
+            total_loss = total_loss + (global_loss - global_loss.detach())
+
         return total_loss
 
+    def _train_batch(self, batch: Any) -> Dict[str, float]:
+        """
+        Clear the global model's gradients, then train both models on the batch.
+        """
+        self.global_optimizer.zero_grad()
+        return super()._train_batch(batch)
+
+    def _optimizer_step(self) -> None:
+        """
+        Step the personal model, then the global model from its accumulated gradients.
+        """
+        super()._optimizer_step()
+        scaler = self.grad_scaler
+        if scaler is None:
+            self.global_optimizer.step()
+        else:
+            # Skipped by the scaler if the global gradients overflowed
+            scaler.unscale_(self.global_optimizer)
+            scaler.step(self.global_optimizer)
+
     def _aggregate_within_group(
         self, comm: BaseCommunicator, weight: float
     ) -> nn.Module:
         """
         Ditto aggregation: aggregate global models while keeping personal models local.
         """
-        # All nodes participate regardless of sample count
-        utils.scale_params(self.global_model, weight)
-
-        # Aggregate global models (personal models remain local)
-        self.global_model = comm.aggregate(
-            self.global_model,
-            reduction=AggregationOp.SUM,
+        # Aggregate global models (personal models remain local), all nodes participate
+        self.global_model = self._aggregate_weighted_model(
+            comm, weight, include_buffers=True, model=self.global_model
         )
 
         # Return the personal local model, not the aggregated global model
@@ -18,8 +18,7 @@ import rich.repr
 import torch
 import torch.nn as nn
 
-from ..communicator import AggregationOp, BaseCommunicator
-from . import utils
+from ..communicator import BaseCommunicator
 from .base import BaseAlgorithm
 
 # ======================================================================================
@@ -59,34 +58,16 @@ class FedBN(BaseAlgorithm):
 
         BatchNorm layers are kept local because they capture client-specific data statistics.
         Aggregating BN parameters would mix statistics from different data distributions.
+        BN parameters and running statistics are never sent.
         """
-        # Save local BN parameters before aggregation
-        local_bn_params = {}
-        for param_name, local_param in self.local_model.named_parameters():
-            if self._is_bn_layer(param_name):
-                local_bn_params[param_name] = local_param.data.clone()
-
-        # Scale only non-BN parameters by data proportion (all nodes participate)
-        utils.scale_params(
-            self.local_model,
+        # Aggregate only non-BN parameters and buffers by data proportion (all nodes participate)
+        return self._aggregate_weighted_model(
+            comm,
             weight,
+            include_buffers=True,
             filter_fn=lambda name, tensor: not self._is_bn_layer(name),
         )
 
-        # Aggregate non-BN parameters
-        aggregated_model = comm.aggregate(
-            self.local_model,
-            reduction=AggregationOp.SUM,
-        )
-
-        # Restore local BN parameters
-        with torch.no_grad():
-            for param_name, aggregated_param in aggregated_model.named_parameters():
-                if self._is_bn_layer(param_name) and param_name in local_bn_params:
-                    aggregated_param.data.copy_(local_bn_params[param_name])
-
-        return aggregated_model
-
     def _is_bn_layer(self, param_name: str) -> bool:
         """
         Check if parameter belongs to a batch normalization layer.
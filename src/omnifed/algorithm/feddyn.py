@@ -18,8 +18,7 @@ import rich.repr
 import torch
 from torch import nn
 
-from ..communicator import AggregationOp, BaseCommunicator
-from . import utils
+from ..communicator import BaseCommunicator
 from .base import BaseAlgorithm
 
 # ======================================================================================
@@ -107,13 +106,9 @@ class FedDyn(BaseAlgorithm):
             if local_param.requires_grad:
                 local_model_params[param_name] = local_param.data.clone()
 
-        # All nodes participate regardless of sample count
-        utils.scale_params(self.local_model, weight)
-
-        # Aggregate weighted model parameters
-        aggregated_model = comm.aggregate(
-            self.local_model,
-            reduction=AggregationOp.SUM,
+        # Aggregate weighted model parameters and buffers (all nodes participate)
+        aggregated_model = self._aggregate_weighted_model(
+            comm, weight, include_buffers=True
         )
 
         # Update server momentum (dynamic regularizer)
@@ -18,8 +18,7 @@ import rich.repr
 import torch
 import torch.nn as nn
 
-from ..communicator import AggregationOp, BaseCommunicator
-from . import utils
+from ..communicator import BaseCommunicator
 from .base import BaseAlgorithm
 
 # ======================================================================================
@@ -68,28 +67,13 @@ class FedPer(BaseAlgorithm):
     ) -> nn.Module:
         """
         FedPer aggregation: aggregate base model while preserving personal layers.
-        """
-        # All nodes participate regardless of sample count
-        utils.scale_params(self.local_model, weight)
-
-        # Store personal layer parameters before aggregation
-        with torch.no_grad():
-            personal_params = {
-                name: param.data.clone()
-                for name, param in self.local_model.named_parameters()
-                if self._is_personal_layer(name)
-            }
 
-        # Aggregate entire model (including personal layers)
-        aggregated_model = comm.aggregate(
-            self.local_model,
-            reduction=AggregationOp.SUM,
+        Personal layers are never sent, so they cost neither bandwidth nor reduce time.
+        """
+        # Aggregate only the base model, all nodes participate
+        return self._aggregate_weighted_model(
+            comm,
+            weight,
+            include_buffers=True,
+            filter_fn=lambda name, tensor: not self._is_personal_layer(name),
         )
-
-        # Restore personal layer parameters (keep them local)
-        with torch.no_grad():
-            for param_name, aggregated_param in aggregated_model.named_parameters():
-                if param_name in personal_params:
-                    aggregated_param.data.copy_(personal_params[param_name])
-
-        return aggregated_model
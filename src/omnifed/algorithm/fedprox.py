@@ -19,8 +19,7 @@ import rich.repr
 import torch
 from torch import nn
 
-from ..communicator import AggregationOp, BaseCommunicator
-from . import utils
+from ..communicator import BaseCommunicator
 from .base import BaseAlgorithm
 
 # ======================================================================================
@@ -88,12 +87,4 @@ class FedProx(BaseAlgorithm):
         FedProx aggregation: weighted averaging of model parameters.
         """
         # All nodes participate regardless of sample count
-        utils.scale_params(self.local_model, weight)
-
-        # Aggregate weighted model parameters from all clients
-        aggregated_model = comm.aggregate(
-            self.local_model,
-            reduction=AggregationOp.SUM,
-        )
-
-        return aggregated_model
+        return self._aggregate_weighted_model(comm, weight, include_buffers=True)
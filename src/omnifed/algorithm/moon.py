@@ -19,8 +19,7 @@ import rich.repr
 import torch
 import torch.nn as nn
 
-from ..communicator import AggregationOp, BaseCommunicator
-from . import utils
+from ..communicator import BaseCommunicator
 from .base import BaseAlgorithm
 
 # ======================================================================================
@@ -168,12 +167,8 @@ class MOON(BaseAlgorithm):
         MOON aggregation: weighted averaging with model history for contrastive learning.
         """
         # All nodes participate regardless of sample count
-        utils.scale_params(self.local_model, weight)
-
-        # Aggregate scaled models
-        aggregated_model = comm.aggregate(
-            self.local_model,
-            reduction=AggregationOp.SUM,
+        aggregated_model = self._aggregate_weighted_model(
+            comm, weight, include_buffers=True
         )
 
         # Update previous model history
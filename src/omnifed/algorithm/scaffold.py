@@ -82,19 +82,17 @@ class Scaffold(BaseAlgorithm):
 
     def _optimizer_step(self) -> None:
         """
-        Track optimizer steps for control variate normalization.
-        """
-        self.local_optimizer.step()
-        self.optimizer_steps += 1
+        Apply SCAFFOLD gradient correction, step, and track optimizer steps
+        for control variate normalization.
 
-    def _backward_pass(self, loss: torch.Tensor) -> None:
+        The correction is applied here rather than in _backward_pass() so it
+        is added to unscaled gradients under fp16 precision.
         """
-        Apply SCAFFOLD gradient correction after backward pass.
-        """
-        loss.backward()
         for name, param in self.local_model.named_parameters():
             if param.grad is not None and name in self.server_cv:
                 param.grad.add_(self.server_cv[name] - self.client_cv[name])
+        self.local_optimizer.step()
+        self.optimizer_steps += 1
 
     def _aggregate_within_group(
         self, comm: BaseCommunicator, weight: float
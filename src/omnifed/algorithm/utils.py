@@ -15,13 +15,185 @@
 import copy
 import hashlib
 import warnings
-from typing import Any, Callable, Dict, List, Optional
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
 import torch
 from torch import nn
 
 from ..utils import print
 
+# Elements per tensor hashed by IntegrityCheck.SAMPLED (evenly strided)
+SAMPLED_HASH_NUMEL = 4096
+
+
+class IntegrityCheck(str, Enum):
+    """Model checks run around each aggregation and broadcast."""
+
+    OFF = "off"  # Timing only
+    NORMS = "norms"  # Parameter norms: zero/NaN/explosion checks and deltas
+    SAMPLED = "sampled"  # Norms + change detection on strided samples of tensors
+    FULL = "full"  # Norms + change detection on every element
+
+
+class Precision(str, Enum):
+    """Numeric precision of local forward passes."""
+
+    FP32 = "fp32"  # Full precision, no autocast
+    BF16 = "bf16"  # bfloat16 autocast (CPU and GPU)
+    FP16 = "fp16"  # float16 autocast with dynamic loss scaling
+
+    @property
+    def autocast_dtype(self) -> Optional[torch.dtype]:
+        """Autocast dtype, or None for full precision."""
+        return {
+            Precision.BF16: torch.bfloat16,
+            Precision.FP16: torch.float16,
+        }.get(self)
+
+
+class OptimizerPolicy(str, Enum):
+    """What happens to the local optimizer after each aggregation."""
+
+    RESET = "reset"  # Build a new optimizer (fresh state, new allocations)
+    ZERO = "zero"  # Reuse the optimizer and zero its state buffers in place
+    KEEP = "keep"  # Reuse the optimizer and carry its state over
+
+
+def optimizes_model(optimizer: torch.optim.Optimizer, model: nn.Module) -> bool:
+    """
+    Check whether an optimizer still updates parameters of a model.
+
+    Aggregation may return a different module; an optimizer built for the old
+    one would then update parameters that are no longer trained.
+
+    Args:
+        optimizer: Optimizer to check
+        model: Model whose parameters it should hold
+
+    Returns:
+        True if every optimizer parameter belongs to the model
+    """
+    model_params = {id(param) for param in model.parameters()}
+    return all(
+        id(param) in model_params
+        for group in optimizer.param_groups
+        for param in group["params"]
+    )
+
+
+def _zero_all(tensors: List[torch.Tensor]) -> None:
+    """Zero tensors in place, with one fused call where torch provides it."""
+    # torch._foreach_* are private; keep training working if one disappears
+    foreach_zero = getattr(torch, "_foreach_zero_", None)
+    if foreach_zero is not None:
+        foreach_zero(tensors)
+        return
+    for tensor in tensors:
+        tensor.zero_()
+
+
+def _float32_norms(tensors: List[torch.Tensor]) -> List[torch.Tensor]:
+    """L2 norm of each tensor accumulated in float32, fused where torch provides it."""
+    foreach_norm = getattr(torch, "_foreach_norm", None)
+    if foreach_norm is not None:
+        return list(foreach_norm(tensors, 2, dtype=torch.float32))
+    return [
+        torch.linalg.vector_norm(tensor, 2, dtype=torch.float32) for tensor in tensors
+    ]
+
+
+def zero_optimizer_state(optimizer: torch.optim.Optimizer) -> None:
+    """
+    Zero an optimizer's per-parameter state in place without reallocating it.
+
+    Tensor buffers (momentum, Adam moments, step counts) are zeroed with one
+    fused call and numeric entries reset to 0; other entries are kept. For
+    SGD without dampening and the Adam family this matches a fresh optimizer.
+
+    Args:
+        optimizer: Optimizer whose state to zero
+    """
+    buffers = []
+    for state in optimizer.state.values():
+        for key, value in state.items():
+            if isinstance(value, torch.Tensor):
+                buffers.append(value)
+            elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                state[key] = type(value)(0)
+    if buffers:
+        _zero_all(buffers)
+
+
+def make_grad_scaler(
+    precision: Precision, device: torch.device
+) -> Optional[torch.amp.GradScaler]:
+    """
+    Validate a precision mode for a device and create its gradient scaler.
+
+    Only fp16 needs loss scaling: its narrow exponent range flushes small
+    gradients to zero. bf16 shares fp32's range and trains unscaled.
+
+    Args:
+        precision: Requested precision mode
+        device: Device the model trains on
+
+    Returns:
+        GradScaler for fp16, None otherwise
+    """
+    if precision == Precision.FP32:
+        return None
+
+    if not torch.amp.is_autocast_available(device.type):
+        raise ValueError(f"precision={precision.value} has no autocast on {device}")
+    if (
+        precision == Precision.BF16
+        and device.type == "cuda"
+        and not torch.cuda.is_bf16_supported(including_emulation=False)
+    ):
+        warnings.warn(
+            f"{device} has no native bfloat16 support; bf16 autocast will be slow",
+            UserWarning,
+        )
+    if precision == Precision.FP16 and device.type == "cpu":
+        warnings.warn(
+            "fp16 autocast on CPU is usually slower than fp32; prefer bf16",
+            UserWarning,
+        )
+
+    if precision == Precision.FP16:
+        return torch.amp.GradScaler(device.type)
+    return None
+
+
+def fused_norm(tensors: Iterable[torch.Tensor]) -> float:
+    """
+    Calculate the joint L2 norm of many tensors with a single host sync.
+
+    Per-tensor norms are computed on each tensor's device with one fused
+    kernel per device and dtype (accumulated in float32); only the final
+    scalar is copied to the host.
+
+    Args:
+        tensors: Tensors to include
+
+    Returns:
+        L2 norm of all elements (0.0 if there are none)
+    """
+    by_device: Dict[torch.device, List[torch.Tensor]] = {}
+    for tensor in tensors:
+        by_device.setdefault(tensor.device, []).append(tensor.detach())
+    if not by_device:
+        return 0.0
+
+    device_norms = [
+        torch.linalg.vector_norm(torch.stack(_float32_norms(group)))
+        for group in by_device.values()
+    ]
+    device = device_norms[0].device
+    norms = torch.stack([norm.to(device) for norm in device_norms])
+    return torch.linalg.vector_norm(norms).item()
+
 
 def get_param_norm(model: nn.Module) -> float:
     """
@@ -32,12 +204,7 @@ def get_param_norm(model: nn.Module) -> float:
     Args:
         model: Model to compute parameter norm for
     """
-    param_norm = 0.0
-    for p in model.parameters():
-        if p.requires_grad:
-            param_norm += p.data.norm(2).item() ** 2
-    param_norm = param_norm**0.5
-    return param_norm
+    return fused_norm(p for p in model.parameters() if p.requires_grad)
 
 
 def get_grad_norm(model: nn.Module) -> float:
@@ -49,12 +216,7 @@ def get_grad_norm(model: nn.Module) -> float:
     Args:
         model: Model to compute gradient norm for
     """
-    grad_norm = 0.0
-    for p in model.parameters():
-        if p.grad is not None:
-            grad_norm += p.grad.data.norm(2).item() ** 2
-    grad_norm = grad_norm**0.5
-    return grad_norm
+    return fused_norm(p.grad for p in model.parameters() if p.grad is not None)
 
 
 def clip_grads(model: nn.Module, max_norm: float) -> float:
@@ -347,7 +509,35 @@ def calculate_batch_size(batch: Any) -> int:
     raise ValueError(f"Cannot estimate batch size for type {type(batch)}")
 
 
-def hash_model_params(model: nn.Module) -> str:
+def hash_tensors(
+    tensors: Iterable[torch.Tensor], sample_numel: Optional[int] = None
+) -> str:
+    """
+    Hash tensor contents incrementally, one tensor at a time.
+
+    Each tensor's raw bytes are fed to the hasher directly (no concatenation).
+    With sample_numel, only up to that many evenly strided elements of each
+    tensor are selected on its device and copied to the host.
+
+    Args:
+        tensors: Tensors to hash (in a deterministic order)
+        sample_numel: Elements hashed per tensor; None hashes every element
+
+    Returns:
+        Hexadecimal hash string (first 16 chars for brevity)
+    """
+    hasher = hashlib.sha256()
+    for tensor in tensors:
+        flat = tensor.detach().reshape(-1)
+        if sample_numel is not None and flat.numel() > sample_numel:
+            stride = (flat.numel() + sample_numel - 1) // sample_numel
+            flat = flat[::stride]
+        data = flat.cpu().contiguous().view(torch.uint8)
+        hasher.update(memoryview(data.numpy()))
+    return hasher.hexdigest()[:16]
+
+
+def hash_model_params(model: nn.Module, sample_numel: Optional[int] = None) -> str:
     """
     Generate deterministic hash of model parameters for exact change detection.
 
@@ -356,22 +546,16 @@ def hash_model_params(model: nn.Module) -> str:
 
     Args:
         model: Model to compute parameter hash for
+        sample_numel: Elements hashed per tensor; None hashes every element
 
     Returns:
         Hexadecimal hash string representing current parameter state
     """
+    params = (p for p in model.parameters() if p.requires_grad)
+    return hash_tensors(params, sample_numel)
 
-    # Concatenate all parameter tensors
-    param_bytes = b""
-    for p in model.parameters():
-        if p.requires_grad:
-            param_bytes += p.data.cpu().numpy().tobytes()
-
-    # Generate deterministic hash
-    return hashlib.sha256(param_bytes).hexdigest()[:16]  # First 16 chars for brevity
 
-
-def hash_model_buffers(model: nn.Module) -> str:
+def hash_model_buffers(model: nn.Module, sample_numel: Optional[int] = None) -> str:
     """
     Generate deterministic hash of model buffers (batch norm stats, etc.) for debugging.
 
@@ -380,16 +564,10 @@ def hash_model_buffers(model: nn.Module) -> str:
 
     Args:
         model: Model to compute buffer hash for
+        sample_numel: Elements hashed per tensor; None hashes every element
 
     Returns:
         Hexadecimal hash string representing current buffer state
     """
-
-    # Concatenate all buffer tensors
-    buffer_bytes = b""
-    for name, buffer in model.named_buffers():
-        if buffer is not None:
-            buffer_bytes += buffer.data.cpu().numpy().tobytes()
-
-    # Generate deterministic hash
-    return hashlib.sha256(buffer_bytes).hexdigest()[:16]  # First 16 chars for brevity
+    buffers = (b for _, b in model.named_buffers() if b is not None)
+    return hash_tensors(buffers, sample_numel)
@@ -13,6 +13,6 @@
 # limitations under the License.
 
 from ._configs import *
-from .base import AggregationOp, BaseCommunicator
+from .base import AggregationOp, AsyncWork, BaseCommunicator, TensorFilter
 from .grpc import GrpcCommunicator
 from .torchdist import TorchDistCommunicator
@@ -13,9 +13,12 @@
 # limitations under the License.
 
 from dataclasses import dataclass
+from typing import Any, Optional
 from omegaconf import MISSING
 
+from .grpc_peer import PeerBroadcast, PeerCollective
 from .torchdist import InitMethod
+from .utils import SerializationMode
 
 
 @dataclass
@@ -50,6 +53,15 @@ class TorchDistCommunicatorConfig(BaseCommunicatorConfig):
     # Retry settings
     max_retries: int = 5
 
+    # Collective coalescing
+    bucket_size_mb: float = 25.0  # Flat bucket size per collective (0 = per tensor)
+
+    # Topology-aware aggregation
+    hierarchical: bool = False  # Two-level all-reduce across hosts (by Ray node IP)
+
+    # Compression (e.g. TopKCompressorConfig; see communicator.compression)
+    compression: Optional[Any] = None  # Compressor for aggregated tensors
+
 
 @dataclass
 class GrpcCommunicatorConfig(BaseCommunicatorConfig):
@@ -59,8 +71,18 @@ class GrpcCommunicatorConfig(BaseCommunicatorConfig):
 
     # gRPC server configuration
     max_workers: int = 10
+    use_aio: bool = False  # asyncio server/client (waiting clients hold no threads)
     max_send_message_length: int = 104857600  # 100 MB
     max_receive_message_length: int = 104857600  # 100 MB
+    serialization: SerializationMode = SerializationMode.FLAT  # Tensor wire format
+    streaming: bool = False  # Chunked streaming RPCs for models beyond message limits
+    stream_chunk_size: int = 4194304  # 4 MB
+    wire_dtype: Optional[str] = None  # e.g. "bfloat16" to halve float32 payloads
+    shared_memory: bool = False  # Model data via shared memory for same-host clients
+    compression: Optional[Any] = None  # Compressor for client submissions
+    collective: PeerCollective = PeerCollective.STAR  # "ring"/"tree": peer-to-peer
+    peer_host: Optional[str] = None  # Peer server address (default: node IP)
+    peer_broadcast: Optional[PeerBroadcast] = None  # "tree"/"chain" chunk relay
 
     # Timeout settings
     aggregation_timeout: float = 600.0  # Seconds for server to wait for all clients
@@ -0,0 +1,175 @@
+# Copyright (c) 2025, Oak Ridge National Laboratory.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+from typing import Dict, Sequence, Union
+
+import rich.repr
+import torch
+
+from .base import AggregationOp
+
+# Half-precision contributions are accumulated in float32 to avoid rounding drift
+_ACCUMULATE_DTYPES = {
+    torch.float16: torch.float32,
+    torch.bfloat16: torch.float32,
+}
+
+
+@rich.repr.auto
+class IncrementalAggregator:
+    """
+    Running SUM/MEAN/MAX accumulator for server-side aggregation.
+
+    Contributions are folded in as soon as they arrive and can be dropped
+    afterwards, so memory stays at one model regardless of participant count.
+    Only finalization (the divide for MEAN) is left for the last arrival.
+
+    float16/bfloat16 tensors are accumulated in float32 and cast back to
+    their wire dtype on finalize.
+
+    Thread-safe: each tensor has its own lock, so concurrent submissions fold
+    different tensors in parallel and only serialize on the same tensor.
+
+    Used by: GrpcServer for unary and streamed client submissions
+    """
+
+    def __init__(self, reduction_type: Union[AggregationOp, str]):
+        """
+        Initialize an empty accumulator.
+
+        Args:
+            reduction_type: SUM, MEAN, or MAX aggregation operation
+
+        Raises:
+            ValueError: If the reduction type is unknown
+        """
+        self.reduction_type = AggregationOp(reduction_type)
+        self.accumulators: Dict[str, torch.Tensor] = {}
+        self.dtypes: Dict[str, torch.dtype] = {}
+        self.num_folded = 0
+
+        # Guards accumulator creation and num_folded; folds use per-key locks
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+
+    def ensure(
+        self,
+        key: str,
+        shape: Sequence[int],
+        dtype: torch.dtype,
+        device: Union[str, torch.device] = "cpu",
+    ) -> torch.Tensor:
+        """
+        Get the accumulator for a key, creating it with the reduction's identity.
+
+        Args:
+            key: Tensor name
+            shape: Tensor shape
+            dtype: Tensor dtype (the accumulator may use a wider one)
+            device: Device for a newly created accumulator
+
+        Returns:
+            Accumulator tensor for the key
+        """
+        with self._lock:
+            accumulator = self.accumulators.get(key)
+            if accumulator is None:
+                accumulate_dtype = _ACCUMULATE_DTYPES.get(dtype, dtype)
+                accumulator = self._identity(tuple(shape), accumulate_dtype, device)
+                self.accumulators[key] = accumulator
+                self.dtypes[key] = dtype
+                self._key_locks[key] = threading.Lock()
+            return accumulator
+
+    def fold(self, tensordict: Dict[str, torch.Tensor]):
+        """
+        Fold a complete contribution into the running aggregate.
+
+        The caller may release the contribution immediately afterwards.
+
+        Args:
+            tensordict: Dictionary mapping tensor names to client values
+        """
+        with torch.no_grad():
+            for key, tensor in tensordict.items():
+                accumulator = self.ensure(
+                    key, tensor.shape, tensor.dtype, tensor.device
+                )
+                with self._key_locks[key]:
+                    self._fold_into(accumulator, tensor)
+        self.mark_folded()
+
+    def fold_slice(self, key: str, start: int, values: torch.Tensor):
+        """
+        Fold a contiguous element range of one tensor (streamed chunks).
+
+        The accumulator must exist (see ensure); call mark_folded once the
+        whole contribution has been streamed.
+
+        Args:
+            key: Tensor name
+            start: Index of the first element in the flattened tensor
+            values: 1-D slice of client values
+        """
+        flat = self.accumulators[key].view(-1)
+        with torch.no_grad(), self._key_locks[key]:
+            self._fold_into(flat[start : start + values.numel()], values)
+
+    def mark_folded(self):
+        """Record that one contribution has been completely folded."""
+        with self._lock:
+            self.num_folded += 1
+
+    def finalize(self, world_size: int) -> Dict[str, torch.Tensor]:
+        """
+        Complete the aggregation and hand over the accumulated tensors.
+
+        Must only be called once every contribution has been folded.
+
+        Args:
+            world_size: Number of contributions (divisor for MEAN)
+
+        Returns:
+            Dictionary mapping tensor names to aggregated values
+        """
+        result = self.accumulators
+        with torch.no_grad():
+            for key, tensor in result.items():
+                if self.reduction_type == AggregationOp.MEAN:
+                    tensor /= world_size
+                result[key] = tensor.to(self.dtypes[key])
+        self.accumulators = {}
+        self.dtypes = {}
+        self._key_locks = {}
+        return result
+
+    def _fold_into(self, accumulator: torch.Tensor, values: torch.Tensor):
+        """Fold values into an accumulator (or a slice of it) in place."""
+        values = values.to(accumulator.device, accumulator.dtype)
+        values = values.view(accumulator.shape)
+        if self.reduction_type == AggregationOp.MAX:
+            torch.maximum(accumulator, values, out=accumulator)
+        else:
+            accumulator += values
+
+    def _identity(
+        self, shape, dtype: torch.dtype, device: Union[str, torch.device]
+    ) -> torch.Tensor:
+        """Create a tensor filled with the reduction's identity value."""
+        if self.reduction_type != AggregationOp.MAX or dtype == torch.bool:
+            return torch.zeros(shape, dtype=dtype, device=device)
+        if dtype.is_floating_point:
+            return torch.full(shape, float("-inf"), dtype=dtype, device=device)
+        return torch.full(shape, torch.iinfo(dtype).min, dtype=dtype, device=device)
@@ -12,9 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import warnings
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, TypeVar
+from typing import Any, Callable, Dict, Optional, TypeVar, Union
 
 import torch
 import torch.nn as nn
@@ -32,6 +34,116 @@ class AggregationOp(str, Enum):
     MAX = "MAX"  # Element-wise maximum across ranks
 
 
+@dataclass(frozen=True)
+class TensorFilter:
+    """
+    Selects which tensors of a message are communicated.
+
+    Mirrors the filtering arguments of algorithm.utils.scale_params. Tensors
+    that are not selected are never serialized or reduced and keep their
+    local values. The defaults communicate trainable parameters and
+    floating-point buffers; integer buffers (e.g. num_batches_tracked) are
+    always excluded.
+
+    Example:
+        # FedPer: keep the personal head off the wire
+        TensorFilter(filter_fn=lambda name, tensor: not name.startswith("head."))
+    """
+
+    requires_grad: Optional[bool] = True  # None=all, True=trainable, False=frozen
+    include_buffers: bool = True  # Floating-point buffers (BN stats, etc.)
+    filter_fn: Optional[Callable[[str, torch.Tensor], bool]] = None  # Custom filter
+
+    def select(
+        self,
+        msg: Union[nn.Module, Dict[str, torch.Tensor]],
+        operation: str = "communication",
+    ) -> Dict[str, torch.Tensor]:
+        """
+        Collect the selected tensors of a model or tensor dict.
+
+        Only filter_fn applies to tensor dicts, which carry no gradient or
+        buffer information.
+
+        Args:
+            msg: Model or tensor dict
+            operation: Operation name for warnings
+
+        Returns:
+            Selected tensors by name, in a rank-independent order
+        """
+        if isinstance(msg, dict):
+            if self.filter_fn is None:
+                return msg
+            return {
+                name: tensor
+                for name, tensor in msg.items()
+                if self.filter_fn(name, tensor)
+            }
+
+        def keep(name: str, tensor: torch.Tensor) -> bool:
+            return self.filter_fn is None or self.filter_fn(name, tensor)
+
+        selected = {}
+        for name, param in msg.named_parameters():
+            trainable = param.requires_grad
+            if self.requires_grad is not None and trainable != self.requires_grad:
+                continue
+            if keep(name, param):
+                selected[name] = param.data
+        if not self.include_buffers:
+            return selected
+        for name, buffer in msg.named_buffers():
+            if buffer is None:  # type: ignore
+                warnings.warn(f"Buffer '{name}' is None, skipping {operation}")
+                continue
+            if not buffer.dtype.is_floating_point:
+                continue  # Skip integer buffers like num_batches_tracked
+            if keep(name, buffer):
+                selected[name] = buffer.data
+        return selected
+
+
+class AsyncWork:
+    """
+    Handle to an in-flight broadcast or aggregation.
+
+    Returned by BaseCommunicator.broadcast_async / aggregate_async. The
+    message must not be read or modified until wait() returns.
+    """
+
+    def __init__(
+        self,
+        wait_fn: Optional[Callable[[], Any]] = None,
+        result: Any = None,
+    ):
+        """
+        Initialize handle.
+
+        Args:
+            wait_fn: Blocks until the operation completes and returns its result
+            result: Result of an already completed operation (when wait_fn is None)
+        """
+        self._wait_fn = wait_fn
+        self._result = result
+
+    def is_completed(self) -> bool:
+        """Whether wait() has already returned (or the operation ran synchronously)."""
+        return self._wait_fn is None
+
+    def wait(self) -> Any:
+        """
+        Block until the operation completes.
+
+        Returns:
+            Same message type with updated values
+        """
+        if self._wait_fn is not None:
+            self._result = self._wait_fn()
+            self._wait_fn = None
+        return self._result
+
+
 class BaseCommunicator(RequiredSetup, ABC):
     """
     Abstract interface for federated learning communication backends.
@@ -67,6 +179,7 @@ class BaseCommunicator(RequiredSetup, ABC):
         self,
         msg: MsgT,
         src: int = 0,
+        tensor_filter: Optional[TensorFilter] = None,
     ) -> MsgT:
         """
         Broadcast message from source rank to all other ranks.
@@ -74,6 +187,7 @@ class BaseCommunicator(RequiredSetup, ABC):
         Args:
             msg: Model, tensor dict, or tensor to broadcast
             src: Source rank ID (default: 0)
+            tensor_filter: Tensors to send (default: TensorFilter())
 
         Returns:
             Same message type with updated values from source
@@ -85,6 +199,7 @@ class BaseCommunicator(RequiredSetup, ABC):
         self,
         msg: MsgT,
         reduction: AggregationOp,
+        tensor_filter: Optional[TensorFilter] = None,
     ) -> MsgT:
         """
         Aggregate message across all ranks using specified reduction operation.
@@ -92,12 +207,57 @@ class BaseCommunicator(RequiredSetup, ABC):
         Args:
             msg: Model, tensor dict, or tensor to aggregate
             reduction: SUM, MEAN, or MAX reduction operation
+            tensor_filter: Tensors to reduce (default: TensorFilter())
 
         Returns:
             Same message type with aggregated values
         """
         pass
 
+    def broadcast_async(
+        self,
+        msg: MsgT,
+        src: int = 0,
+        tensor_filter: Optional[TensorFilter] = None,
+    ) -> AsyncWork:
+        """
+        Start a broadcast without waiting for it to complete.
+
+        Default implementation runs synchronously; backends with non-blocking
+        transports override this to overlap communication with computation.
+
+        Args:
+            msg: Model, tensor dict, or tensor to broadcast
+            src: Source rank ID (default: 0)
+            tensor_filter: Tensors to send (default: TensorFilter())
+
+        Returns:
+            Handle whose wait() returns the broadcasted message
+        """
+        return AsyncWork(result=self.broadcast(msg, src, tensor_filter))
+
+    def aggregate_async(
+        self,
+        msg: MsgT,
+        reduction: AggregationOp,
+        tensor_filter: Optional[TensorFilter] = None,
+    ) -> AsyncWork:
+        """
+        Start an aggregation without waiting for it to complete.
+
+        Default implementation runs synchronously; backends with non-blocking
+        transports override this to overlap communication with computation.
+
+        Args:
+            msg: Model, tensor dict, or tensor to aggregate
+            reduction: SUM, MEAN, or MAX reduction operation
+            tensor_filter: Tensors to reduce (default: TensorFilter())
+
+        Returns:
+            Handle whose wait() returns the aggregated message
+        """
+        return AsyncWork(result=self.aggregate(msg, reduction, tensor_filter))
+
     @abstractmethod
     def close(self):
         """
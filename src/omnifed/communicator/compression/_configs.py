@@ -0,0 +1,69 @@
+# Copyright (c) 2025, Oak Ridge National Laboratory.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from dataclasses import dataclass
+
+
+@dataclass
+class BaseCompressorConfig:
+    """Base configuration shared by all compressors."""
+
+    _target_: str = "src.omnifed.communicator.compression.BaseCompressor"
+
+    min_numel: int = 1024  # Smaller tensors are sent uncompressed
+
+
+@dataclass
+class TopKCompressorConfig(BaseCompressorConfig):
+    """Configuration for TopKCompressor."""
+
+    _target_: str = "src.omnifed.communicator.compression.TopKCompressor"
+
+    ratio: float = 0.01  # Fraction of largest-magnitude entries kept
+
+
+@dataclass
+class RandomKCompressorConfig(BaseCompressorConfig):
+    """Configuration for RandomKCompressor."""
+
+    _target_: str = "src.omnifed.communicator.compression.RandomKCompressor"
+
+    ratio: float = 0.01  # Fraction of random entries kept
+    seed: int = 0  # Shared seed so ranks sample identical coordinates
+
+
+@dataclass
+class QSGDCompressorConfig(BaseCompressorConfig):
+    """Configuration for QSGDCompressor."""
+
+    _target_: str = "src.omnifed.communicator.compression.QSGDCompressor"
+
+    bits: int = 8  # Code width per entry: 8, 4 or 2
+
+
+@dataclass
+class SignSGDCompressorConfig(BaseCompressorConfig):
+    """Configuration for SignSGDCompressor."""
+
+    _target_: str = "src.omnifed.communicator.compression.SignSGDCompressor"
+
+
+@dataclass
+class PowerSGDCompressorConfig(BaseCompressorConfig):
+    """Configuration for PowerSGDCompressor."""
+
+    _target_: str = "src.omnifed.communicator.compression.PowerSGDCompressor"
+
+    rank: int = 4  # Approximation rank
+    seed: int = 0  # Seed for initial Q factors
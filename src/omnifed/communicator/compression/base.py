@@ -0,0 +1,203 @@
+# Copyright (c) 2025, Oak Ridge National Laboratory.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from abc import ABC, abstractmethod
+from typing import Dict, Optional
+
+import torch
+import torch.nn.functional as F
+
+from .error_feedback import ErrorFeedback
+
+# Separates tensor names from part names in compressed tensor dicts
+PART_SEPARATOR = "::"
+
+# ======================================================================================
+
+
+def pack_bits(codes: torch.Tensor, bits: int) -> torch.Tensor:
+    """
+    Pack unsigned codes of `bits` width (1, 2, 4 or 8) densely into bytes.
+
+    Args:
+        codes: 1-D uint8 tensor with values below 2**bits
+        bits: Code width in bits
+
+    Returns:
+        1-D uint8 tensor of ceil(len(codes) * bits / 8) bytes
+    """
+    if bits == 8:
+        return codes
+    per_byte = 8 // bits
+    codes = F.pad(codes, (0, -codes.numel() % per_byte)).view(-1, per_byte)
+    shifts = torch.arange(0, 8, bits, dtype=torch.uint8, device=codes.device)
+    return (codes << shifts).sum(dim=1, dtype=torch.uint8)
+
+
+def unpack_bits(packed: torch.Tensor, bits: int, numel: int) -> torch.Tensor:
+    """
+    Inverse of pack_bits.
+
+    Args:
+        packed: Bytes produced by pack_bits
+        bits: Code width in bits
+        numel: Number of codes originally packed
+
+    Returns:
+        1-D uint8 tensor of numel codes
+    """
+    if bits == 8:
+        return packed[:numel]
+    shifts = torch.arange(0, 8, bits, dtype=torch.uint8, device=packed.device)
+    mask = (1 << bits) - 1
+    return ((packed.unsqueeze(1) >> shifts) & mask).flatten()[:numel]
+
+
+class BaseCompressor(ABC):
+    """
+    Abstract interface for lossy tensor dictionary compression.
+
+    compress() maps each tensor to a few named parts (e.g. values and
+    indices) stored under "<name>::<part>" keys, so the result is again a
+    plain tensor dict that any communicator can serialize. Tensors that
+    are not worth compressing are passed through unchanged. decompress()
+    needs nothing but that dict, and part shapes depend only on the input
+    shapes, so equally shaped inputs produce equally shaped parts on every
+    rank (TorchDistCommunicator all-gathers them).
+
+    Subclasses implement _compress_tensor and _decompress_tensor; decompression
+    must be stateless because the gRPC server runs it concurrently.
+
+    While error_feedback is set (BaseAlgorithm attaches its residual memory
+    during aggregation), compress() folds in and updates the residuals.
+    """
+
+    def __init__(self, min_numel: int = 1024):
+        """
+        Initialize compressor.
+
+        Args:
+            min_numel: Tensors with fewer elements are sent uncompressed
+        """
+        self.min_numel = min_numel
+        self.error_feedback: Optional[ErrorFeedback] = None
+
+    def _should_compress(self, tensor: torch.Tensor) -> bool:
+        """
+        Whether a tensor is compressed (floating point and large enough by default).
+
+        Args:
+            tensor: Tensor to inspect
+
+        Returns:
+            True to compress, False to pass the tensor through
+        """
+        return tensor.is_floating_point() and tensor.numel() >= self.min_numel
+
+    @abstractmethod
+    def _compress_tensor(
+        self, name: str, tensor: torch.Tensor
+    ) -> Dict[str, torch.Tensor]:
+        """
+        Compress one tensor.
+
+        Args:
+            name: Key for per-tensor state: the tensor name, scoped by the
+                call position within the sync while error feedback is attached
+            tensor: Floating-point tensor to compress
+
+        Returns:
+            Named parts; at least one floating part keeps the original dtype
+        """
+        pass
+
+    @abstractmethod
+    def _decompress_tensor(
+        self, parts: Dict[str, torch.Tensor], shape: torch.Size
+    ) -> torch.Tensor:
+        """
+        Reconstruct one tensor from its parts.
+
+        Args:
+            parts: Parts returned by _compress_tensor
+            shape: Original tensor shape
+
+        Returns:
+            Reconstructed tensor in the original dtype
+        """
+        pass
+
+    @torch.no_grad()
+    def compress(self, tensordict: Dict[str, torch.Tensor]) -> Dict[str, torch.Tensor]:
+        """
+        Compress a tensor dictionary.
+
+        Args:
+            tensordict: Dictionary mapping names to tensors
+
+        Returns:
+            Dictionary of "<name>::<part>" keys to compressed parts
+        """
+        feedback = self.error_feedback
+        call = feedback.next_call() if feedback is not None else None
+
+        compressed = {}
+        for name, tensor in tensordict.items():
+            if not self._should_compress(tensor):
+                compressed[f"{name}{PART_SEPARATOR}raw"] = tensor
+                continue
+
+            tensor = tensor.detach()
+            key = name
+            if feedback is not None:
+                # Equally named tensors of different messages keep separate state
+                key = f"{call}/{name}"
+                tensor = feedback.compensate(key, tensor)
+            parts = self._compress_tensor(key, tensor)
+            if feedback is not None:
+                reconstructed = self._decompress_tensor(parts, tensor.shape)
+                feedback.update(key, tensor, reconstructed)
+
+            parts["shape"] = torch.tensor(tensor.shape, dtype=torch.int64)
+            for part, value in parts.items():
+                compressed[f"{name}{PART_SEPARATOR}{part}"] = value
+        return compressed
+
+    @torch.no_grad()
+    def decompress(
+        self, compressed: Dict[str, torch.Tensor]
+    ) -> Dict[str, torch.Tensor]:
+        """
+        Reconstruct a tensor dictionary produced by compress().
+
+        Args:
+            compressed: Dictionary of "<name>::<part>" keys to parts
+
+        Returns:
+            Dictionary mapping names to reconstructed tensors (in compress order)
+        """
+        grouped: Dict[str, Dict[str, torch.Tensor]] = {}
+        for key, value in compressed.items():
+            name, _, part = key.rpartition(PART_SEPARATOR)
+            grouped.setdefault(name, {})[part] = value
+
+        tensordict = {}
+        for name, parts in grouped.items():
+            raw: Optional[torch.Tensor] = parts.get("raw")
+            if raw is not None:
+                tensordict[name] = raw
+                continue
+            shape = torch.Size(parts.pop("shape").tolist())
+            tensordict[name] = self._decompress_tensor(parts, shape)
+        return tensordict
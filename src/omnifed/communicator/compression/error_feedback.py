@@ -0,0 +1,107 @@
+# Copyright (c) 2025, Oak Ridge National Laboratory.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Dict, Optional
+
+import rich.repr
+import torch
+
+# ======================================================================================
+
+
+@rich.repr.auto
+class ErrorFeedback:
+    """
+    Residual memory for error-feedback compression.
+
+    While attached to a compressor, each compressed tensor is first
+    corrected by the residual kept from the matching tensor of the
+    previous sync, and the part the compressor dropped becomes the new
+    residual. Residuals are matched by the position of the compress() call
+    within a sync plus the tensor name, so call reset_calls() at the start
+    of every sync.
+
+    [Error Feedback Fixes SignSGD](https://arxiv.org/abs/1901.09847) | Sai Praneeth Karimireddy | 2019-01-28
+    """
+
+    def __init__(self, dtype: Optional[str] = None):
+        """
+        Initialize empty residual memory.
+
+        Args:
+            dtype: Floating-point dtype for stored residuals (e.g. "bfloat16" halves
+                the memory of float32 residuals); None keeps each tensor's dtype
+
+        Raises:
+            ValueError: If dtype is not a floating-point torch dtype
+        """
+        resolved = None
+        if dtype is not None:
+            resolved = getattr(torch, str(dtype).removeprefix("torch."), None)
+            is_float = isinstance(resolved, torch.dtype) and resolved.is_floating_point
+            if not is_float:
+                raise ValueError(
+                    f"dtype must be a floating-point torch dtype, got {dtype}"
+                )
+        self.dtype: Optional[torch.dtype] = resolved
+        self.residuals: Dict[str, torch.Tensor] = {}
+        self._calls = 0
+
+    def reset_calls(self):
+        """Start a new sync (the next compress() call is matched as the first)."""
+        self._calls = 0
+
+    def next_call(self) -> int:
+        """
+        Claim the position of a compress() call within the current sync.
+
+        Returns:
+            Call position used to key this call's residuals
+        """
+        call = self._calls
+        self._calls += 1
+        return call
+
+    def compensate(self, key: str, tensor: torch.Tensor) -> torch.Tensor:
+        """
+        Add the stored residual to a tensor about to be compressed.
+
+        Args:
+            key: Residual key (call position and tensor name)
+            tensor: Tensor to correct (not modified)
+
+        Returns:
+            Corrected tensor (the input itself if there is no matching residual)
+        """
+        residual = self.residuals.get(key)
+        if residual is None or residual.shape != tensor.shape:
+            return tensor
+        return tensor + residual.to(tensor.dtype)
+
+    def update(self, key: str, corrected: torch.Tensor, reconstructed: torch.Tensor):
+        """
+        Store what compression dropped from a corrected tensor.
+
+        Args:
+            key: Residual key (call position and tensor name)
+            corrected: Tensor that was compressed
+            reconstructed: Decompressed version of it
+        """
+        residual = corrected - reconstructed
+        self.residuals[key] = residual.to(self.dtype or corrected.dtype)
+
+    def reset(self):
+        """Drop all residuals."""
+        self.residuals.clear()
+        self._calls = 0
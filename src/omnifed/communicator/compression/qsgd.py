@@ -0,0 +1,77 @@
+# Copyright (c) 2025, Oak Ridge National Laboratory.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Dict
+
+import rich.repr
+import torch
+
+from .base import BaseCompressor, pack_bits, unpack_bits
+
+# ======================================================================================
+
+
+@rich.repr.auto
+class QSGDCompressor(BaseCompressor):
+    """
+    QSGD-style stochastic uniform quantization of each tensor.
+
+    Magnitudes are scaled by the tensor's largest magnitude (the paper
+    uses the L2 norm, which leaves most entries at level zero for large
+    tensors) and rounded at random to one of 2**(bits-1)-1 levels per sign,
+    so the quantized tensor is unbiased. Codes are bit-packed: 8, 4 and 2
+    bits cut float32 payloads by 4x, 8x and 16x.
+
+    [QSGD](https://arxiv.org/abs/1610.02132) | Dan Alistarh | 2016-10-07
+    """
+
+    def __init__(self, bits: int = 8, **kwargs):
+        """
+        Initialize QSGD compressor.
+
+        Args:
+            bits: Code width per entry (8, 4 or 2)
+            **kwargs: BaseCompressor arguments (min_numel)
+
+        Raises:
+            ValueError: If bits is not 8, 4 or 2
+        """
+        super().__init__(**kwargs)
+        if bits not in (8, 4, 2):
+            raise ValueError(f"bits must be 8, 4 or 2, got {bits}")
+        self.bits = bits
+        self.levels = 2 ** (bits - 1) - 1
+
+    def _compress_tensor(
+        self, name: str, tensor: torch.Tensor
+    ) -> Dict[str, torch.Tensor]:
+        flat = tensor.flatten().float()
+        scale = flat.abs().max()
+        scaled = flat.abs() / scale.clamp_min(torch.finfo(flat.dtype).tiny)
+        scaled *= self.levels
+        lower = scaled.floor()
+        level = lower + (torch.rand_like(scaled) < scaled - lower)
+        codes = (flat.sign() * level + self.levels).to(torch.uint8)
+        return {
+            "codes": pack_bits(codes, self.bits),
+            "scale": scale.to(tensor.dtype).reshape(1),
+        }
+
+    def _decompress_tensor(
+        self, parts: Dict[str, torch.Tensor], shape: torch.Size
+    ) -> torch.Tensor:
+        scale = parts["scale"]
+        codes = unpack_bits(parts["codes"], self.bits, shape.numel())
+        flat = (codes.float() - self.levels) * (scale.float() / self.levels)
+        return flat.to(scale.dtype).view(shape)
@@ -0,0 +1,79 @@
+# Copyright (c) 2025, Oak Ridge National Laboratory.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+from typing import Dict
+
+import rich.repr
+import torch
+
+from .base import BaseCompressor
+
+# ======================================================================================
+
+
+def _random_indices(numel: int, k: int, seed: int) -> torch.Tensor:
+    """Draw k distinct indices below numel from a seeded CPU generator."""
+    generator = torch.Generator().manual_seed(seed)
+    return torch.randperm(numel, generator=generator)[:k]
+
+
+@rich.repr.auto
+class RandomKCompressor(BaseCompressor):
+    """
+    Random-k sparsification: keep k uniformly chosen entries of each tensor.
+
+    Only the values and a per-tensor seed are sent; the receiver regenerates
+    the indices from the seed. Compressors built with the same seed draw the
+    same coordinates on every rank for the same call sequence.
+
+    [Sparsified SGD with Memory](https://arxiv.org/abs/1809.07599) | Sebastian U. Stich | 2018-09-20
+    """
+
+    def __init__(self, ratio: float = 0.01, seed: int = 0, **kwargs):
+        """
+        Initialize random-k compressor.
+
+        Args:
+            ratio: Fraction of entries kept per tensor (0 < ratio <= 1)
+            seed: Seed of the generator that draws per-tensor index seeds
+            **kwargs: BaseCompressor arguments (min_numel)
+
+        Raises:
+            ValueError: If ratio is outside (0, 1]
+        """
+        super().__init__(**kwargs)
+        if not 0 < ratio <= 1:
+            raise ValueError(f"ratio must be in (0, 1], got {ratio}")
+        self.ratio = ratio
+        self.seed = seed
+        self._generator = torch.Generator().manual_seed(seed)
+
+    def _compress_tensor(
+        self, name: str, tensor: torch.Tensor
+    ) -> Dict[str, torch.Tensor]:
+        flat = tensor.flatten()
+        k = max(1, math.ceil(self.ratio * flat.numel()))
+        seed = torch.randint(2**62, (1,), generator=self._generator)
+        indices = _random_indices(flat.numel(), k, int(seed)).to(flat.device)
+        return {"values": flat[indices], "seed": seed}
+
+    def _decompress_tensor(
+        self, parts: Dict[str, torch.Tensor], shape: torch.Size
+    ) -> torch.Tensor:
+        values = parts["values"]
+        indices = _random_indices(shape.numel(), values.numel(), int(parts["seed"]))
+        flat = torch.zeros(shape.numel(), dtype=values.dtype, device=values.device)
+        flat[indices.to(values.device)] = values
+        return flat.view(shape)
@@ -0,0 +1,53 @@
+# Copyright (c) 2025, Oak Ridge National Laboratory.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Dict
+
+import rich.repr
+import torch
+
+from .base import BaseCompressor, pack_bits, unpack_bits
+
+# ======================================================================================
+
+
+@rich.repr.auto
+class SignSGDCompressor(BaseCompressor):
+    """
+    Scaled sign compression: one bit per entry plus the tensor's mean magnitude.
+
+    Reconstructs sign(x) * mean(|x|), which keeps the L1 norm of the input
+    (32x smaller than float32).
+
+    [Error Feedback Fixes SignSGD](https://arxiv.org/abs/1901.09847) | Sai Praneeth Karimireddy | 2019-01-28
+    """
+
+    def _compress_tensor(
+        self, name: str, tensor: torch.Tensor
+    ) -> Dict[str, torch.Tensor]:
+        flat = tensor.flatten()
+        signs = (flat >= 0).to(torch.uint8)
+        scale = flat.float().abs().mean()
+        return {
+            "signs": pack_bits(signs, 1),
+            "scale": scale.to(tensor.dtype).reshape(1),
+        }
+
+    def _decompress_tensor(
+        self, parts: Dict[str, torch.Tensor], shape: torch.Size
+    ) -> torch.Tensor:
+        scale = parts["scale"]
+        signs = unpack_bits(parts["signs"], 1, shape.numel())
+        flat = (signs.to(scale.dtype) * 2 - 1) * scale
+        return flat.view(shape)
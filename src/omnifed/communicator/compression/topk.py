@@ -0,0 +1,68 @@
+# Copyright (c) 2025, Oak Ridge National Laboratory.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+from typing import Dict
+
+import rich.repr
+import torch
+
+from .base import BaseCompressor
+
+# ======================================================================================
+
+
+@rich.repr.auto
+class TopKCompressor(BaseCompressor):
+    """
+    Top-k sparsification: keep the k largest-magnitude entries of each tensor.
+
+    Sends values plus int32 indices (int64 beyond 2**31 elements). The
+    dropped mass is lost unless the caller keeps an error-feedback residual.
+
+    [Sparse Communication for Distributed Gradient Descent](https://arxiv.org/abs/1704.05021) | Alham Fikri Aji | 2017-04-17
+    """
+
+    def __init__(self, ratio: float = 0.01, **kwargs):
+        """
+        Initialize top-k compressor.
+
+        Args:
+            ratio: Fraction of entries kept per tensor (0 < ratio <= 1)
+            **kwargs: BaseCompressor arguments (min_numel)
+
+        Raises:
+            ValueError: If ratio is outside (0, 1]
+        """
+        super().__init__(**kwargs)
+        if not 0 < ratio <= 1:
+            raise ValueError(f"ratio must be in (0, 1], got {ratio}")
+        self.ratio = ratio
+
+    def _compress_tensor(
+        self, name: str, tensor: torch.Tensor
+    ) -> Dict[str, torch.Tensor]:
+        flat = tensor.flatten()
+        k = max(1, math.ceil(self.ratio * flat.numel()))
+        _, indices = flat.abs().topk(k, sorted=False)
+        index_dtype = torch.int32 if flat.numel() < 2**31 else torch.int64
+        return {"values": flat[indices], "indices": indices.to(index_dtype)}
+
+    def _decompress_tensor(
+        self, parts: Dict[str, torch.Tensor], shape: torch.Size
+    ) -> torch.Tensor:
+        values = parts["values"]
+        flat = torch.zeros(shape.numel(), dtype=values.dtype, device=values.device)
+        flat[parts["indices"].long()] = values
+        return flat.view(shape)
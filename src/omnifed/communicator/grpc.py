@@ -12,8 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import warnings
+import asyncio
+import threading
 from concurrent import futures
+from typing import Dict, List, Optional
 
 import grpc
 import rich.repr
@@ -22,10 +24,21 @@ from torch import nn
 
 from ..utils import print
 from . import BaseCommunicator, grpc_pb2_grpc
-from .base import AggregationOp
+from .base import AggregationOp, AsyncWork, TensorFilter
+from .compression import BaseCompressor
+from .grpc_aio_client import GrpcAioClient
+from .grpc_aio_server import GrpcAioServer
 from .grpc_client import GrpcClient
+from .grpc_peer import (
+    GrpcPeerGroup,
+    PeerBroadcast,
+    PeerCollective,
+    decode_addresses,
+    encode_address,
+    peer_host,
+)
 from .grpc_server import GrpcServer
-from .utils import get_msg_info
+from .utils import SerializationMode, cast_floating, get_msg_info
 
 
 @rich.repr.auto
@@ -37,6 +50,13 @@ class GrpcCommunicator(BaseCommunicator):
     broadcast and aggregation operations.
     Provides reliable communication across heterogeneous networks with
     built-in retry and timeout handling.
+
+    With collective="ring" or "tree", every rank also runs a peer server and
+    tensors move directly between neighbours (ring all-reduce, binary-tree
+    reduce and broadcast), so no rank carries O(world_size) model copies.
+    The central server then only exchanges peer addresses at setup.
+    peer_broadcast alone keeps star aggregation but relays broadcasts (e.g.
+    the initial model) chunk by chunk between peers.
     """
 
     def __init__(
@@ -52,6 +72,16 @@ class GrpcCommunicator(BaseCommunicator):
         client_timeout: float = 60.0,
         retry_delay: float = 5.0,
         max_retries: int = 5,
+        serialization: SerializationMode = SerializationMode.FLAT,
+        streaming: bool = False,
+        stream_chunk_size: int = 4194304,  # 4 MB
+        use_aio: bool = False,
+        wire_dtype: Optional[str] = None,
+        shared_memory: bool = False,
+        compression: Optional[BaseCompressor] = None,
+        collective: PeerCollective = PeerCollective.STAR,
+        peer_host: Optional[str] = None,
+        peer_broadcast: Optional[PeerBroadcast] = None,
     ) -> None:
         """
         Initialize gRPC-based federated learning communicator.
@@ -68,6 +98,27 @@ class GrpcCommunicator(BaseCommunicator):
             client_timeout: Client timeout waiting for aggregation result (seconds)
             retry_delay: Seconds between connection retry attempts
             max_retries: Maximum connection retry attempts
+            serialization: Tensor wire format (FLAT packs all tensors into one buffer)
+            streaming: Use chunked streaming RPCs (models beyond max message length)
+            stream_chunk_size: Chunk payload size in bytes for streaming RPCs
+            use_aio: Use the asyncio (grpc.aio) server and client so waiting clients
+                don't occupy server threads (max_workers is then unused)
+            wire_dtype: Floating-point dtype for transmission (e.g. "bfloat16"
+                halves payload bytes vs float32); None sends tensors unchanged
+            shared_memory: Exchange model data through POSIX shared memory with
+                clients on the server's host; gRPC then carries only metadata
+            compression: Compressor applied to client submissions; the server
+                decompresses each one before folding it into the aggregate
+            collective: "star" aggregates through rank 0; "ring" and "tree"
+                exchange tensors peer to peer (broadcasts use a tree in both)
+            peer_host: Address other ranks use to reach this rank's peer server
+                (default: Ray node IP, else the IP the hostname resolves to)
+            peer_broadcast: Relay broadcasts chunk by chunk between peers along a
+                "tree" or "chain"; None uses the central server for the star
+                collective and a tree otherwise
+
+        Raises:
+            ValueError: If wire_dtype is not a floating-point torch dtype
         """
         super().__init__(rank, world_size, master_addr, master_port)
         print(f"rank={rank}/{world_size} | addr={master_addr}:{master_port}")
@@ -82,6 +133,18 @@ class GrpcCommunicator(BaseCommunicator):
         self.max_workers = max_workers
         self.max_send_message_length = max_send_message_length
         self.max_receive_message_length = max_receive_message_length
+        self.serialization = SerializationMode(serialization)
+        self.streaming = streaming
+        self.stream_chunk_size = stream_chunk_size
+        self.use_aio = use_aio
+        self.wire_dtype = self._resolve_wire_dtype(wire_dtype)
+        self.shared_memory = shared_memory
+        self.compression = compression
+        self.collective = PeerCollective(collective)
+        self.peer_host = peer_host
+        self.peer_broadcast = (
+            PeerBroadcast(peer_broadcast) if peer_broadcast is not None else None
+        )
 
         # Timeout and retry settings
         self.aggregation_timeout = aggregation_timeout
@@ -93,6 +156,33 @@ class GrpcCommunicator(BaseCommunicator):
         self._server = None
         self._client = None
         self._servicer = None
+        self._loop = None
+        self._loop_thread = None
+        self._async_executor = None  # Runs *_async operations in submission order
+        self._peers: Optional[GrpcPeerGroup] = None  # Peer-to-peer collectives
+
+    @staticmethod
+    def _resolve_wire_dtype(wire_dtype: Optional[str]) -> Optional[torch.dtype]:
+        """
+        Parse the configured transmission dtype.
+
+        Args:
+            wire_dtype: Dtype name (e.g. "bfloat16" or "torch.float16") or None
+
+        Returns:
+            Floating-point torch dtype, or None to send tensors unchanged
+
+        Raises:
+            ValueError: If the name is not a floating-point torch dtype
+        """
+        if wire_dtype is None:
+            return None
+        dtype = getattr(torch, str(wire_dtype).removeprefix("torch."), None)
+        if not isinstance(dtype, torch.dtype) or not dtype.is_floating_point:
+            raise ValueError(
+                f"wire_dtype must be a floating-point torch dtype, got {wire_dtype}"
+            )
+        return dtype
 
     @property
     def client(self):
@@ -155,27 +245,48 @@ class GrpcCommunicator(BaseCommunicator):
 
         Server setup: Creates gRPC server, servicer, and starts listening
         Client setup: Creates gRPC client and connects to server
+        With use_aio, both run on a background asyncio event loop.
+        Peer collectives additionally start a peer server on every rank.
         """
-        if self.is_server:
-            self._server = grpc.server(
-                futures.ThreadPoolExecutor(max_workers=self.max_workers),
-                options=[
-                    ("grpc.max_send_message_length", self.max_send_message_length),
-                    (
-                        "grpc.max_receive_message_length",
-                        self.max_receive_message_length,
-                    ),
-                ],
+        options = [
+            ("grpc.max_send_message_length", self.max_send_message_length),
+            ("grpc.max_receive_message_length", self.max_receive_message_length),
+        ]
+
+        if self.use_aio:
+            self._loop = asyncio.new_event_loop()
+            self._loop_thread = threading.Thread(
+                target=self._loop.run_forever, name="grpc-aio-loop", daemon=True
             )
+            self._loop_thread.start()
 
-            self._servicer = GrpcServer(world_size=self.world_size)
-            grpc_pb2_grpc.add_GrpcServerServicer_to_server(self._servicer, self._server)
+        if self.is_server:
+            servicer_cls = GrpcAioServer if self.use_aio else GrpcServer
+            self._servicer = servicer_cls(
+                world_size=self.world_size,
+                serialization=self.serialization,
+                stream_chunk_size=self.stream_chunk_size,
+                shared_memory=self.shared_memory,
+                # Peer collectives decompress locally; the server only sees addresses
+                compression=self.compression if self._uses_star else None,
+            )
 
-            self._server.add_insecure_port(f"[::]:{self.master_port}")
+            if self.use_aio:
+                self._server = self._run_coroutine(self._start_aio_server(options))
+            else:
+                self._server = grpc.server(
+                    futures.ThreadPoolExecutor(max_workers=self.max_workers),
+                    options=options,
+                )
+                grpc_pb2_grpc.add_GrpcServerServicer_to_server(
+                    self._servicer, self._server
+                )
+                self._server.add_insecure_port(f"[::]:{self.master_port}")
+                self._server.start()
             print(f"Server listening on port {self.master_port}")
-            self._server.start()
         else:
-            self._client = GrpcClient(
+            client_cls = GrpcAioClient if self.use_aio else GrpcClient
+            self._client = client_cls(
                 client_id=str(self.rank),
                 master_addr=self.master_addr,
                 master_port=self.master_port,
@@ -184,41 +295,160 @@ class GrpcCommunicator(BaseCommunicator):
                 retry_delay=self.retry_delay,
                 max_retries=self.max_retries,
                 client_timeout=self.client_timeout,
+                serialization=self.serialization,
+                streaming=self.streaming,
+                stream_chunk_size=self.stream_chunk_size,
+                shared_memory=self.shared_memory,
             )
+            if self.use_aio:
+                self._run_coroutine(self._client.connect())
+
+        if self._broadcast_topology is not None:
+            self._setup_peers()
+
+    @property
+    def _uses_star(self) -> bool:
+        """True if aggregation goes through the central server."""
+        return self.collective == PeerCollective.STAR
+
+    @property
+    def _broadcast_topology(self) -> Optional[PeerBroadcast]:
+        """Relay topology of peer broadcasts (None: through the central server)."""
+        if self.peer_broadcast is not None:
+            return self.peer_broadcast
+        return None if self._uses_star else PeerBroadcast.TREE
+
+    def _setup_peers(self):
+        """
+        Start this rank's peer server and learn every other rank's address.
+
+        Addresses are exchanged with one SUM aggregation through the central
+        server, each rank filling its own row of the address table.
+        """
+        self._peers = GrpcPeerGroup(
+            self.rank,
+            self.world_size,
+            max_workers=self.max_workers,
+            max_send_message_length=self.max_send_message_length,
+            max_receive_message_length=self.max_receive_message_length,
+            stream_chunk_size=self.stream_chunk_size,
+            timeout=self.aggregation_timeout,
+        )
+        port = self._peers.start()
+        address = f"{self.peer_host or peer_host()}:{port}"
+        addresses = self._exchange_peer_addresses(address)
+        self._peers.connect(addresses)
+        print(f"collective={self.collective.value} | peers={addresses}")
+
+    def _exchange_peer_addresses(self, address: str) -> List[str]:
+        """
+        All-gather peer addresses through the central server.
+
+        Args:
+            address: This rank's "host:port"
+
+        Returns:
+            Peer address of every rank
+        """
+        table = {"addresses": encode_address(address, self.rank, self.world_size)}
+        table = self._star_aggregate(table, AggregationOp.SUM)
+        return decode_addresses(table["addresses"])
+
+    async def _start_aio_server(self, options) -> grpc.aio.Server:
+        """
+        Create and start the grpc.aio server on the background event loop.
+
+        Args:
+            options: gRPC channel options
+
+        Returns:
+            Started grpc.aio server
+        """
+        server = grpc.aio.server(options=options)
+        grpc_pb2_grpc.add_GrpcServerServicer_to_server(self._servicer, server)
+        server.add_insecure_port(f"[::]:{self.master_port}")
+        await server.start()
+        return server
+
+    def _run_coroutine(self, coro):
+        """
+        Run a coroutine on the background event loop and wait for its result.
+
+        Args:
+            coro: Coroutine to execute
+
+        Returns:
+            Result of the coroutine
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def _call_client(self, method, *args):
+        """
+        Invoke a client operation, awaiting it on the event loop for asyncio clients.
+
+        Args:
+            method: Bound GrpcClient or GrpcAioClient method
+            *args: Arguments for the method
+
+        Returns:
+            Result of the operation
+        """
+        if self.use_aio:
+            return self._run_coroutine(method(*args))
+        return method(*args)
 
     def broadcast(
         self,
         msg: BaseCommunicator.MsgT,
         src: int = 0,
+        tensor_filter: Optional[TensorFilter] = None,
     ) -> BaseCommunicator.MsgT:
         """
         Broadcast message from server to all clients via gRPC.
 
         Server (rank 0): Stores message in broadcast state for client retrieval
         Clients: Retrieve broadcast state from server via polling
+        Peer broadcast: Relayed from src chunk by chunk along a tree or chain
 
         Args:
             msg: Model, tensor dict, or tensor to broadcast
-            src: Source rank (unused in centralized gRPC - always rank 0)
+            src: Source rank (the central server always broadcasts from rank 0)
+            tensor_filter: Tensors to send (default: TensorFilter())
 
         Returns:
             Broadcasted message with updated values
         """
         print(f"{get_msg_info(msg)} | src={src}")
+        topology = self._broadcast_topology
+        if topology is not None:
+            tensordict = self._extract_tensordict_from_msg(msg, tensor_filter)
+            if self.rank == src:
+                wire_tensordict = cast_floating(tensordict, self.wire_dtype)
+                self._peers.broadcast(wire_tensordict, src, topology)
+                return msg
+            received = self._peers.broadcast(None, src, topology)
+            received = self._restore_dtypes(tensordict, received)
+            return self._apply_tensordict_to_msg(msg, received, tensor_filter)
         if self.is_server:
             # Server: Store broadcast state for client retrieval
-            tensordict = self._extract_tensordict_from_msg(msg)
-            self.servicer.set_broadcast_state(tensordict)
+            tensordict = self._extract_tensordict_from_msg(msg, tensor_filter)
+            self.servicer.set_broadcast_state(
+                cast_floating(tensordict, self.wire_dtype)
+            )
             return msg
         else:
             # Client: Retrieve broadcast state from server
-            tensordict = self.client.get_broadcast_state()
-            return self._apply_tensordict_to_msg(msg, tensordict)
+            tensordict = self._call_client(self.client.get_broadcast_state)
+            tensordict = self._restore_dtypes(
+                self._extract_tensordict_from_msg(msg, tensor_filter), tensordict
+            )
+            return self._apply_tensordict_to_msg(msg, tensordict, tensor_filter)
 
     def aggregate(
         self,
         msg: BaseCommunicator.MsgT,
         reduction: AggregationOp,
+        tensor_filter: Optional[TensorFilter] = None,
     ) -> BaseCommunicator.MsgT:
         """
         Aggregate message across all ranks via central gRPC server.
@@ -229,53 +459,99 @@ class GrpcCommunicator(BaseCommunicator):
         Args:
             msg: Model, tensor dict, or tensor to aggregate
             reduction: SUM, MEAN, or MAX aggregation operation
+            tensor_filter: Tensors to reduce (default: TensorFilter())
 
         Returns:
             Aggregated message with combined values from all ranks
         """
         # Extract tensors and perform distributed aggregation
-        tensordict = self._extract_tensordict_from_msg(msg)
+        tensordict = self._extract_tensordict_from_msg(msg, tensor_filter)
         print(f"{get_msg_info(msg)} | reduction={reduction}")
 
-        # Perform aggregation via gRPC protocol
-        aggregated_tensordict = self._grpc_aggregate(tensordict, reduction)
+        # Perform aggregation via gRPC protocol (in wire_dtype if configured)
+        aggregated_tensordict = self._grpc_aggregate(
+            cast_floating(tensordict, self.wire_dtype), reduction
+        )
+        aggregated_tensordict = self._restore_dtypes(tensordict, aggregated_tensordict)
 
         # Apply aggregated results back to original message format
-        return self._apply_tensordict_to_msg(msg, aggregated_tensordict)
+        return self._apply_tensordict_to_msg(msg, aggregated_tensordict, tensor_filter)
+
+    def _submit_async(self, fn, *args) -> AsyncWork:
+        """
+        Run a blocking operation on the single background worker.
+
+        Args:
+            fn: Bound broadcast or aggregate method
+            *args: Arguments for the method
+
+        Returns:
+            Handle whose wait() returns the operation's result
+        """
+        if self._async_executor is None:
+            self._async_executor = futures.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="grpc-async"
+            )
+        return AsyncWork(self._async_executor.submit(fn, *args).result)
+
+    def broadcast_async(
+        self,
+        msg: BaseCommunicator.MsgT,
+        src: int = 0,
+        tensor_filter: Optional[TensorFilter] = None,
+    ) -> AsyncWork:
+        """
+        Start a broadcast on a background thread.
+
+        Args:
+            msg: Model, tensor dict, or tensor to broadcast
+            src: Source rank (unused in centralized gRPC - always rank 0)
+            tensor_filter: Tensors to send (default: TensorFilter())
+
+        Returns:
+            Handle whose wait() returns the broadcasted message
+        """
+        return self._submit_async(self.broadcast, msg, src, tensor_filter)
+
+    def aggregate_async(
+        self,
+        msg: BaseCommunicator.MsgT,
+        reduction: AggregationOp,
+        tensor_filter: Optional[TensorFilter] = None,
+    ) -> AsyncWork:
+        """
+        Start an aggregation on a background thread.
+
+        Network round trips then overlap with the caller's computation.
+
+        Args:
+            msg: Model, tensor dict, or tensor to aggregate
+            reduction: SUM, MEAN, or MAX aggregation operation
+            tensor_filter: Tensors to reduce (default: TensorFilter())
+
+        Returns:
+            Handle whose wait() returns the aggregated message
+        """
+        return self._submit_async(self.aggregate, msg, reduction, tensor_filter)
 
     def _extract_tensordict_from_msg(
         self,
         msg: BaseCommunicator.MsgT,
-        # TODO: Consider adding control arguments like utils.scale_params:
-        # requires_grad: Optional[bool] = None,
-        # include_buffers: bool = True,
-        # filter_fn: Optional[Callable[[str, torch.Tensor], bool]] = None
+        tensor_filter: Optional[TensorFilter] = None,
     ) -> BaseCommunicator.MsgT:
         """
         Extract tensors from message for gRPC serialization.
 
         Args:
             msg: Model, tensor dict, or single tensor
+            tensor_filter: Tensors to extract (default: TensorFilter())
 
         Returns:
             Dictionary mapping parameter names to tensor values
         """
-        if isinstance(msg, nn.Module):
-            result = dict()
-            for name, param in msg.named_parameters():
-                if param.requires_grad:
-                    result[name] = param.data
-            # Include buffers (batch norm stats, etc.) - only floating-point buffers
-            for name, buffer in msg.named_buffers():
-                if buffer is None:  # type: ignore
-                    warnings.warn(f"Buffer '{name}' is None, skipping serialization")
-                    continue
-                if not buffer.dtype.is_floating_point:
-                    continue  # Skip integer buffers like num_batches_tracked
-                result[name] = buffer.data
-            return result
-        elif isinstance(msg, dict):
-            return msg
+        if isinstance(msg, (nn.Module, dict)):
+            tensor_filter = tensor_filter or TensorFilter()
+            return tensor_filter.select(msg, "serialization")
         else:
             return {"tensor": msg}
 
@@ -283,55 +559,69 @@ class GrpcCommunicator(BaseCommunicator):
         self,
         msg: BaseCommunicator.MsgT,
         tensordict: BaseCommunicator.MsgT,
-        # TODO: Consider adding control arguments like utils.scale_params:
-        # requires_grad: Optional[bool] = None,
-        # include_buffers: bool = True,
-        # filter_fn: Optional[Callable[[str, torch.Tensor], bool]] = None
+        tensor_filter: Optional[TensorFilter] = None,
     ) -> BaseCommunicator.MsgT:
         """
         Apply deserialized tensors back to original message format.
 
+        Tensors outside tensor_filter are left untouched.
+
         Args:
             msg: Original message providing structure and device info
             tensordict: Deserialized tensors from gRPC
+            tensor_filter: Tensors to update (default: TensorFilter())
 
         Returns:
             Message with updated tensor values and proper device placement
         """
         if isinstance(msg, nn.Module):
+            tensor_filter = tensor_filter or TensorFilter()
             with torch.no_grad():
-                # Apply parameters
-                for name, param in msg.named_parameters():
-                    if param.requires_grad and name in tensordict:
-                        # Ensure tensor is on the same device as the parameter before copying
-                        tensor = tensordict[name].to(param.device)
-                        param.data.copy_(tensor)
-                # Apply buffers (batch norm stats, etc.) - only floating-point buffers
-                for name, buffer in msg.named_buffers():
-                    if buffer is None:  # type: ignore
-                        warnings.warn(
-                            f"Buffer '{name}' is None, skipping deserialization"
-                        )
-                        continue
-                    if not buffer.dtype.is_floating_point:
-                        continue  # Skip integer buffers like num_batches_tracked
+                selected = tensor_filter.select(msg, "deserialization")
+                for name, local in selected.items():
                     if name not in tensordict:
-                        continue  # Buffer not in received data
-                    # Ensure tensor is on the same device as the buffer before copying
-                    tensor = tensordict[name].to(buffer.device)
-                    buffer.data.copy_(tensor)
+                        continue  # Tensor not in received data
+                    # Move to the local tensor's device before copying
+                    local.copy_(tensordict[name].to(local.device))
             return msg
         elif isinstance(msg, dict):
-            return tensordict
+            # Unselected entries keep their local values
+            return {**msg, **tensordict}
         else:
             return tensordict.get("tensor", msg)
 
+    def _restore_dtypes(
+        self,
+        reference: Dict[str, torch.Tensor],
+        tensordict: Dict[str, torch.Tensor],
+    ) -> Dict[str, torch.Tensor]:
+        """
+        Cast received tensors back to the local dtypes after wire_dtype transmission.
+
+        Args:
+            reference: Local tensors providing the original dtypes
+            tensordict: Tensors received from the wire
+
+        Returns:
+            Tensors in their local dtypes (unchanged if no wire_dtype is set)
+        """
+        if self.wire_dtype is None:
+            return tensordict
+        restored = {}
+        for key, tensor in tensordict.items():
+            local = reference.get(key)
+            if local is not None and local.dtype != tensor.dtype:
+                tensor = tensor.to(local.dtype)
+            restored[key] = tensor
+        return restored
+
     def _grpc_aggregate(self, tensordict: dict, reduction: AggregationOp) -> dict:
         """
         Perform distributed aggregation via gRPC protocol.
 
         Server: Submits data to local session and waits for aggregation
         Clients: Submit data to server and retrieve aggregated result
+        Peer collectives: Ring or tree all-reduce between ranks
 
         Args:
             tensordict: Local tensors to contribute
@@ -340,12 +630,76 @@ class GrpcCommunicator(BaseCommunicator):
         Returns:
             Aggregated tensor dictionary
         """
+        if not self._uses_star:
+            return self._peer_aggregate(tensordict, reduction)
+        return self._star_aggregate(tensordict, reduction)
+
+    def _star_aggregate(self, tensordict: dict, reduction: AggregationOp) -> dict:
+        """
+        Aggregate through the central server (also used for the peer rendezvous).
+
+        Args:
+            tensordict: Local tensors to contribute
+            reduction: Aggregation operation type
+
+        Returns:
+            Aggregated tensor dictionary
+        """
+        # The server only decompresses submissions in the star collective
+        compress = self.compression is not None and self._uses_star
         if self.is_server:
+            if compress:
+                # Round-trip the server's own contribution so it is as lossy as
+                # every client's (and gets error feedback), as in torchdist
+                tensordict = self.compression.decompress(
+                    self.compression.compress(tensordict)
+                )
             current_session = self._submit_server_data(tensordict, reduction)
             return self._wait_for_aggregation_result(current_session)
         else:
-            self.client.submit_for_aggregation(tensordict, reduction)
-            return self.client.get_aggregation_result()
+            if compress:
+                tensordict = self.compression.compress(tensordict)
+            self._call_client(self.client.submit_for_aggregation, tensordict, reduction)
+            return self._call_client(self.client.get_aggregation_result)
+
+    def _peer_aggregate(self, tensordict: dict, reduction: AggregationOp) -> dict:
+        """
+        All-reduce tensors directly between ranks.
+
+        Compressed parts are not summable (e.g. top-k indices differ per
+        rank), so they are all-gathered around the ring and every rank
+        decompresses and reduces all contributions locally.
+
+        Args:
+            tensordict: Local tensors to contribute
+            reduction: Aggregation operation type
+
+        Returns:
+            Aggregated tensor dictionary
+        """
+        if self.compression is None:
+            return self._peers.all_reduce(tensordict, reduction, self.collective)
+
+        payloads = self._peers.all_gather(self.compression.compress(tensordict))
+        reduced = None
+        for payload in payloads:
+            contribution = self.compression.decompress(payload)
+            if reduced is None:
+                reduced = {key: value.clone() for key, value in contribution.items()}
+                continue
+            for key, value in contribution.items():
+                if reduction == AggregationOp.MAX:
+                    torch.maximum(reduced[key], value, out=reduced[key])
+                else:
+                    reduced[key].add_(value)
+
+        if reduction == AggregationOp.MEAN:
+            for key, value in reduced.items():
+                if value.is_floating_point():
+                    reduced[key] = value / self.world_size
+                else:
+                    reduced[key] = value // self.world_size
+        return reduced
 
     def _submit_server_data(self, tensordict: dict, reduction: AggregationOp) -> int:
         """
@@ -358,31 +712,11 @@ class GrpcCommunicator(BaseCommunicator):
         Returns:
             Session ID for tracking aggregation progress
         """
-        with self.servicer.lock:
-            current_session = self.servicer.current_aggregation_session
-            session_state = self.servicer.aggregation_state[current_session]
-
-            # Set reduction type
-            reduction_str = reduction.value
-            if session_state["reduction_type"] is None:
-                session_state["reduction_type"] = reduction_str
-            elif session_state["reduction_type"] != reduction_str:
-                raise ValueError(
-                    f"Reduction type mismatch - expected {session_state['reduction_type']}, got {reduction_str}"
-                )
-
-            # Store server data
-            session_state["data"]["server"] = tensordict
-            data_count = len(session_state["data"])
-
-            print(
-                f"Server submit | session={current_session} | {data_count}/{self.servicer.world_size}"
-            )
-
-            # Trigger aggregation if ready
-            self.servicer.perform_aggregation_if_ready(session_state, current_session)
-
-            return current_session
+        current_session = self.servicer.submit_tensordict(
+            "server", tensordict, reduction.value
+        )
+        print(f"Server submit | session={current_session}")
+        return current_session
 
     def _wait_for_aggregation_result(self, session_id: int) -> dict:
         """
@@ -392,7 +726,8 @@ class GrpcCommunicator(BaseCommunicator):
             session_id: Aggregation session identifier
 
         Returns:
-            Aggregated tensor dictionary
+            Aggregated tensor dictionary (a copy: clients may still be
+            fetching the session's payload)
 
         Raises:
             RuntimeError: If aggregation times out or fails
@@ -407,10 +742,13 @@ class GrpcCommunicator(BaseCommunicator):
                 f"Aggregation timeout ({self.aggregation_timeout}s) for session {session_id}"
             )
 
-        if session_state["result"] is None:
+        payload = session_state["payload"]
+        if payload is None:
             raise RuntimeError(f"No result available for session {session_id}")
 
-        return session_state["result"]
+        result = {key: tensor.clone() for key, tensor in payload.tensordict.items()}
+        self.servicer.release_result(session_state, "server")
+        return result
 
     def close(self):
         """
@@ -420,7 +758,27 @@ class GrpcCommunicator(BaseCommunicator):
         Should be called when communication is no longer needed.
         """
         print()
+        if self._async_executor is not None:
+            self._async_executor.shutdown(wait=True)
+            self._async_executor = None
+        if self._peers is not None:
+            self._peers.close()
+            self._peers = None
+        if self.use_aio:
+            if self._server is not None:
+                self._run_coroutine(self._server.stop(grace=15))
+                self._servicer.close()
+            if self._client is not None:
+                self._run_coroutine(self._client.close())
+            if self._loop is not None:
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._loop_thread.join()
+                self._loop.close()
+                self._loop = None
+            return
+
         if self._server is not None:
             self._server.stop(grace=15)
+            self._servicer.close()
         if self._client is not None:
-            self._client.channel.close()
+            self._client.close()
@@ -0,0 +1,326 @@
+# Copyright (c) 2025, Oak Ridge National Laboratory.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import time
+from typing import Dict, Optional, Tuple
+
+import grpc
+import rich.repr
+import torch
+
+from ..utils import print
+from . import AggregationOp, grpc_pb2, grpc_pb2_grpc
+from .shm import can_attach, release_segment, write_tensordict
+from .utils import (
+    ChunkAssembler,
+    SerializationMode,
+    get_msg_info,
+    proto_to_tensordict,
+    tensordict_to_chunks,
+    tensordict_to_proto,
+)
+
+
+@rich.repr.auto
+class GrpcAioClient:
+    """
+    asyncio (grpc.aio) client for federated learning communication coordination.
+
+    Mirrors GrpcClient with awaitable operations, so many sessions can be
+    in flight on one event loop. The channel is created in connect() and is
+    bound to the loop that awaits it.
+
+    Used by: GrpcCommunicator (use_aio=True) on its background event loop
+    """
+
+    def __init__(
+        self,
+        client_id: str,
+        master_addr: str,
+        master_port: int,
+        max_send_message_length: int,
+        max_receive_message_length: int,
+        retry_delay: float = 5.0,
+        max_retries: int = 3,
+        client_timeout: float = 60,
+        serialization: SerializationMode = SerializationMode.FLAT,
+        streaming: bool = False,
+        stream_chunk_size: int = 4194304,  # 4 MB
+        shared_memory: bool = False,
+    ):
+        """
+        Initialize asyncio gRPC client settings (call connect() to open the channel).
+
+        Args:
+            client_id: Unique identifier for this client (typically rank)
+            master_addr: gRPC server address
+            master_port: gRPC server port
+            max_send_message_length: Maximum outbound message size in bytes
+            max_receive_message_length: Maximum inbound message size in bytes
+            retry_delay: Seconds between connection retry attempts
+            max_retries: Maximum connection retry attempts
+            client_timeout: Seconds to wait for server responses
+            serialization: Tensor wire format used for submitted tensors
+            streaming: Use chunked streaming RPCs instead of unary messages
+            stream_chunk_size: Chunk payload size in bytes for streamed submissions
+            shared_memory: Exchange tensor data through shared memory when the
+                server runs on the same host (detected at registration)
+        """
+        print(f"addr={master_addr}:{master_port}")
+
+        # Store configuration
+        self.client_id = client_id
+        self.master_addr = master_addr
+        self.master_port = master_port
+        self.max_send_message_length = max_send_message_length
+        self.max_receive_message_length = max_receive_message_length
+        self.retry_delay = retry_delay
+        self.max_retries = max_retries
+        self.client_timeout = client_timeout
+        self.serialization = serialization
+        self.streaming = streaming
+        self.stream_chunk_size = stream_chunk_size
+        self.shared_memory = shared_memory
+
+        # Shared-memory transport state (enabled once co-location is confirmed)
+        self.use_shared_memory = False
+        self._submit_segment = None
+
+        # Last broadcast version received (long-poll cursor)
+        self.broadcast_version = 0
+
+        # Initialize connection state
+        self.channel = None
+        self.stub = None
+
+    async def connect(self):
+        """Establish gRPC connection with retry logic."""
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                self.channel = grpc.aio.insecure_channel(
+                    self.master_addr + ":" + str(self.master_port),
+                    options=[
+                        (
+                            "grpc.max_receive_message_length",
+                            self.max_receive_message_length,
+                        ),
+                        (
+                            "grpc.max_send_message_length",
+                            self.max_send_message_length,
+                        ),
+                    ],
+                )
+                self.stub = grpc_pb2_grpc.GrpcServerStub(self.channel)
+                response = await self.stub.RegisterClient(
+                    grpc_pb2.ClientInfo(client_id=self.client_id),
+                )
+                self.use_shared_memory = self.shared_memory and can_attach(
+                    response.shm_probe
+                )
+                print(
+                    f"Register | success={response.success} | shared_memory={self.use_shared_memory}"
+                )
+                return
+
+            except grpc.RpcError as e:
+                await self.channel.close()
+                if attempt >= self.max_retries:
+                    raise RuntimeError(
+                        f"Failed to connect to server {self.master_addr}:{self.master_port} after {self.max_retries} retries"
+                    ) from e
+
+                print(f"Retry {attempt}/{self.max_retries} | {self.retry_delay}s delay")
+                await asyncio.sleep(self.retry_delay)
+
+    async def close(self):
+        """Close the channel and release the shared-memory submission segment."""
+        if self.channel is not None:
+            await self.channel.close()
+        if self._submit_segment is not None:
+            release_segment(self._submit_segment)
+            self._submit_segment = None
+
+    async def _fetch_tensordict(
+        self, unary_rpc, stream_rpc, request
+    ) -> Tuple[int, Optional[Dict[str, torch.Tensor]]]:
+        """
+        Call a tensor-returning endpoint in unary or streaming form.
+
+        Args:
+            unary_rpc: Stub method returning an OperationResponse
+            stream_rpc: Stub method returning a TensorChunk stream
+            request: ClientInfo request
+
+        Returns:
+            Tuple of (broadcast version, received tensors or None if not ready yet)
+        """
+        if self.streaming and not self.use_shared_memory:
+            assembler = ChunkAssembler()
+            async for chunk in stream_rpc(request):
+                assembler.add(chunk)
+            header = assembler.header
+            if header is None or not header.is_ready:
+                return 0, None
+            return header.version, assembler.tensordict()
+
+        response = await unary_rpc(request)
+        if not response.is_ready:
+            return response.version, None
+        return response.version, proto_to_tensordict(response.tensor_dict)
+
+    async def get_broadcast_state(self) -> Dict[str, torch.Tensor]:
+        """
+        Retrieve the next broadcast state from the server via long-polling.
+
+        Each request waits on the server until a version newer than the last
+        one received is published, so the model arrives as soon as it exists.
+
+        Returns:
+            Dictionary mapping parameter names to tensor values
+        """
+        print("Waiting for server to broadcast model")
+
+        poll_count = 0
+        error_count = 0
+
+        while True:
+            try:
+                request = grpc_pb2.ClientInfo(
+                    client_id=self.client_id,
+                    after_version=self.broadcast_version,
+                    shared_memory=self.use_shared_memory,
+                )
+                version, tensordict = await self._fetch_tensordict(
+                    self.stub.GetBroadcastState,
+                    self.stub.GetBroadcastStateStream,
+                    request,
+                )
+                if tensordict is not None:
+                    self.broadcast_version = version
+                    print(f"Received version={version} | {get_msg_info(tensordict)}")
+                    return tensordict
+                # Server long-poll expired without a new version; ask again
+                poll_count += 1
+                print(
+                    f"Long-poll | {poll_count} total | version={self.broadcast_version}"
+                )
+
+            except grpc.RpcError as e:
+                error_count += 1
+                if error_count > self.max_retries:
+                    raise RuntimeError(
+                        f"Failed to get broadcast state after {self.max_retries} retries"
+                    ) from e
+                print(
+                    f"Retry {error_count}/{self.max_retries} | {self.retry_delay}s delay"
+                )
+                await asyncio.sleep(self.retry_delay)
+
+    async def submit_for_aggregation(
+        self, tensordict: Dict[str, torch.Tensor], reduction_type: AggregationOp
+    ):
+        """
+        Submit local tensors to server for distributed aggregation.
+
+        Args:
+            tensordict: Local tensors to contribute to aggregation
+            reduction_type: SUM, MEAN, or MAX aggregation operation
+        """
+        try:
+            if self.streaming and not self.use_shared_memory:
+                chunks = tensordict_to_chunks(
+                    tensordict,
+                    self.stream_chunk_size,
+                    client_id=self.client_id,
+                    reduction_type=reduction_type.value,
+                )
+                response = await self.stub.SubmitForAggregationStream(chunks)
+            else:
+                if self.use_shared_memory:
+                    # Reused every round: the server has copied it out once the call returns
+                    self._submit_segment, proto_tensordict = write_tensordict(
+                        tensordict, self._submit_segment
+                    )
+                else:
+                    proto_tensordict = tensordict_to_proto(
+                        tensordict, self.serialization
+                    )
+                request = grpc_pb2.AggregationRequest(
+                    client_id=self.client_id,
+                    tensor_dict=proto_tensordict,
+                    reduction_type=reduction_type.value,
+                )
+                response = await self.stub.SubmitForAggregation(request)
+            if response.success:
+                print("Successfully sent local model to server")
+            else:
+                print("Submit failed")
+        except grpc.RpcError as e:
+            print(f"Submit exception | {e}")
+
+    async def get_aggregation_result(self) -> Dict[str, torch.Tensor]:
+        """
+        Await the aggregated result from the server with timeout handling.
+
+        The server holds the call open until the session completes, so no
+        thread is blocked on either side while waiting.
+
+        Returns:
+            Dictionary mapping parameter names to aggregated tensor values
+
+        Raises:
+            RuntimeError: If aggregation times out or max retries exceeded
+        """
+        print(
+            f"Waiting for server to aggregate models (timeout={self.client_timeout}s)"
+        )
+
+        start_time = time.time()
+        poll_count = 0
+        error_count = 0
+
+        while True:
+            elapsed = time.time() - start_time
+            if elapsed > self.client_timeout:
+                raise RuntimeError(f"Aggregation timeout ({self.client_timeout}s)")
+            try:
+                request = grpc_pb2.ClientInfo(
+                    client_id=self.client_id, shared_memory=self.use_shared_memory
+                )
+                _, tensordict = await self._fetch_tensordict(
+                    self.stub.GetAggregationResult,
+                    self.stub.GetAggregationResultStream,
+                    request,
+                )
+                if tensordict is not None:
+                    print(
+                        f"Received {get_msg_info(tensordict)} (waited {elapsed:.1f}s)"
+                    )
+                    return tensordict
+                poll_count += 1
+                remaining = self.client_timeout - elapsed
+                print(f"Waiting | poll {poll_count} | {remaining:.1f}s remaining")
+                await asyncio.sleep(min(self.retry_delay, remaining))
+
+            except grpc.RpcError as e:
+                error_count += 1
+                if error_count > self.max_retries:
+                    raise RuntimeError(
+                        f"Failed to get aggregation result after {self.max_retries} retries"
+                    ) from e
+                print(
+                    f"Aggregation fetch | error {error_count}/{self.max_retries} | retry in {self.retry_delay}s"
+                )
+                await asyncio.sleep(self.retry_delay)
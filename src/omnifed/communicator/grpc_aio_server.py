@@ -0,0 +1,312 @@
+# Copyright (c) 2025, Oak Ridge National Laboratory.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import warnings
+from typing import Any, Dict
+
+import rich.repr
+import torch
+
+from ..utils import print
+from . import grpc_pb2
+from .grpc_server import GrpcServer
+
+
+def _resolve_waiter(waiter: asyncio.Future):
+    """Wake an awaiting handler (skipped if its RPC was already cancelled)."""
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+@rich.repr.auto
+class GrpcAioServer(GrpcServer):
+    """
+    asyncio (grpc.aio) variant of the federated learning gRPC server.
+
+    Clients waiting for an aggregation result await a future instead of
+    blocking a worker thread, so any number of clients can wait concurrently.
+    Decoding, folding and encoding still run on the loop's default executor
+    to keep the event loop responsive.
+
+    Session state and aggregation logic are shared with GrpcServer, so the
+    server rank can keep submitting and waiting synchronously from its own thread.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """
+        Initialize asyncio gRPC server (arguments as for GrpcServer).
+        """
+        super().__init__(*args, **kwargs)
+        self._broadcast_waiters = []
+
+    def set_broadcast_state(self, tensordict: Dict[str, torch.Tensor]):
+        """
+        Publish broadcast state as a new version and wake awaiting handlers.
+
+        Args:
+            tensordict: Tensors to broadcast (typically global model)
+
+        Returns:
+            Version number of the published state
+        """
+        version = super().set_broadcast_state(tensordict)
+        with self.lock:
+            waiters, self._broadcast_waiters = self._broadcast_waiters, []
+        for waiter in waiters:
+            waiter.get_loop().call_soon_threadsafe(_resolve_waiter, waiter)
+        return version
+
+    async def _await_broadcast(self, after_version: int):
+        """
+        Await a broadcast version newer than after_version (bounded by the long-poll timeout).
+
+        Args:
+            after_version: Last version the client has seen
+        """
+        with self.lock:
+            if self._broadcast_version > after_version:
+                return
+            waiter = asyncio.get_running_loop().create_future()
+            self._broadcast_waiters.append(waiter)
+
+        try:
+            await asyncio.wait_for(waiter, timeout=self.long_poll_timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    def perform_aggregation_if_ready(
+        self, session_state: Dict, current_session: int
+    ) -> bool:
+        """
+        Finalize aggregation when ready and wake all awaiting handlers.
+
+        Args:
+            session_state: Current aggregation session data
+            current_session: Session identifier
+
+        Returns:
+            True if aggregation was performed, False if still waiting
+        """
+        completed = super().perform_aggregation_if_ready(session_state, current_session)
+        if completed:
+            with session_state["lock"]:
+                waiters = session_state.pop("waiters", [])
+            # May run on any thread (e.g. the server rank), so hop onto each waiter's loop
+            for waiter in waiters:
+                waiter.get_loop().call_soon_threadsafe(_resolve_waiter, waiter)
+        return completed
+
+    async def _await_result_payload(self, client_id: str):
+        """
+        Await the result of the latest session the client submitted to.
+
+        Args:
+            client_id: Client identifier
+
+        Returns:
+            Encoded session result, or None if the client has no submitted data
+        """
+        with self.lock:
+            session_state = self._find_client_session(client_id)
+        if session_state is None:
+            return None
+
+        waiter = None
+        with session_state["lock"]:
+            if session_state["payload"] is None:
+                waiter = asyncio.get_running_loop().create_future()
+                session_state.setdefault("waiters", []).append(waiter)
+
+        print(f"Client {client_id} requesting aggregation result")
+
+        if waiter is not None:
+            print(f"Client {client_id} waiting for aggregation to complete")
+            await waiter
+            print(f"Aggregation complete for client {client_id}")
+
+        # Published before waiters are woken and never modified afterwards
+        payload = session_state["payload"]
+        self.release_result(session_state, client_id)
+        return payload
+
+    async def GetBroadcastState(self, request, context):
+        """
+        gRPC endpoint: Send broadcast state to requesting client.
+
+        Long-polls without holding a thread until a version newer than
+        request.after_version is published.
+
+        Args:
+            request: ClientInfo with client identifier and last seen version
+            context: gRPC context (unused)
+
+        Returns:
+            OperationResponse with tensor data or not-ready status on timeout
+        """
+        print(f"request.client_id={request.client_id}")
+
+        await self._await_broadcast(request.after_version)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            self._create_broadcast_response,
+            request.after_version,
+            request.shared_memory,
+        )
+
+    async def GetBroadcastStateStream(self, request, context):
+        """
+        gRPC endpoint: Stream broadcast state to requesting client in chunks.
+
+        Args:
+            request: ClientInfo with client identifier and last seen version
+            context: gRPC context (unused)
+
+        Yields:
+            TensorChunk messages (single not-ready chunk on timeout)
+        """
+        print(f"request.client_id={request.client_id}")
+
+        await self._await_broadcast(request.after_version)
+        loop = asyncio.get_running_loop()
+        chunks = await loop.run_in_executor(
+            None, self._broadcast_chunks, request.after_version
+        )
+        for chunk in chunks:
+            yield chunk
+
+    async def SubmitForAggregation(self, request, context):
+        """
+        gRPC endpoint: Receive client tensors for distributed aggregation.
+
+        Args:
+            request: AggregationRequest with client data and reduction type
+            context: gRPC context (unused)
+
+        Returns:
+            StatusResponse indicating success or failure
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, super().SubmitForAggregation, request, context
+        )
+
+    async def SubmitForAggregationStream(self, request_iterator, context):
+        """
+        gRPC endpoint: Receive chunked client tensors for aggregation.
+
+        Args:
+            request_iterator: Async TensorChunk stream (first chunk carries metadata)
+            context: gRPC context (unused)
+
+        Returns:
+            StatusResponse indicating success or failure
+        """
+        loop = asyncio.get_running_loop()
+        stream: Dict[str, Any] = {}
+        try:
+            async for chunk in request_iterator:
+                await loop.run_in_executor(None, self._receive_chunk, stream, chunk)
+            await loop.run_in_executor(None, self._finish_stream, stream)
+            return grpc_pb2.StatusResponse(success=True)
+
+        except Exception as e:
+            client_id = stream["header"].client_id if "header" in stream else None
+            warnings.warn(
+                f"Failed to process aggregation stream from client {client_id} | {e}",
+                RuntimeWarning,
+            )
+            return grpc_pb2.StatusResponse(success=False)
+
+    async def GetAggregationResult(self, request, context):
+        """
+        gRPC endpoint: Send aggregation result to requesting client.
+
+        Awaits session completion without holding a thread; the shared
+        encoded response is built once on the executor.
+
+        Args:
+            request: ClientInfo with client identifier
+            context: gRPC context (unused)
+
+        Returns:
+            OperationResponse with aggregated tensors or error status
+        """
+        client_id = request.client_id
+
+        try:
+            payload = await self._await_result_payload(client_id)
+            if payload is None:
+                return grpc_pb2.OperationResponse(is_ready=False)
+
+            print(f"Sending aggregated model to client {client_id}")
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                None, payload.response, request.shared_memory
+            )
+
+        except Exception as e:
+            warnings.warn(
+                f"Failed to get aggregation result for client {client_id} | {e}",
+                RuntimeWarning,
+            )
+            return grpc_pb2.OperationResponse(is_ready=False)
+
+    async def GetAggregationResultStream(self, request, context):
+        """
+        gRPC endpoint: Stream aggregation result to requesting client in chunks.
+
+        Args:
+            request: ClientInfo with client identifier
+            context: gRPC context (unused)
+
+        Yields:
+            TensorChunk messages (single not-ready chunk on failure)
+        """
+        client_id = request.client_id
+
+        try:
+            payload = await self._await_result_payload(client_id)
+            chunks = None
+            if payload is not None:
+                loop = asyncio.get_running_loop()
+                chunks = await loop.run_in_executor(None, payload.chunks)
+        except Exception as e:
+            warnings.warn(
+                f"Failed to get aggregation result for client {client_id} | {e}",
+                RuntimeWarning,
+            )
+            chunks = None
+
+        if chunks is None:
+            yield grpc_pb2.TensorChunk(is_ready=False)
+            return
+
+        print(f"Streaming aggregated model to client {client_id}")
+        for chunk in chunks:
+            yield chunk
+
+    async def RegisterClient(self, request, context):
+        """
+        gRPC endpoint: Register client connection and track participant count.
+
+        Args:
+            request: ClientInfo with unique client identifier
+            context: gRPC context (unused)
+
+        Returns:
+            StatusResponse confirming successful registration
+        """
+        return super().RegisterClient(request, context)
@@ -13,7 +13,7 @@
 # limitations under the License.
 
 import time
-from typing import Dict
+from typing import Dict, Optional, Tuple
 import warnings
 
 import grpc
@@ -22,7 +22,15 @@ import torch
 
 from ..utils import print
 from . import AggregationOp, grpc_pb2, grpc_pb2_grpc
-from .utils import get_msg_info, proto_to_tensordict, tensordict_to_proto
+from .shm import can_attach, release_segment, write_tensordict
+from .utils import (
+    SerializationMode,
+    chunks_to_tensordict,
+    get_msg_info,
+    proto_to_tensordict,
+    tensordict_to_chunks,
+    tensordict_to_proto,
+)
 
 
 @rich.repr.auto
@@ -47,6 +55,10 @@ class GrpcClient:
         retry_delay: float = 5.0,
         max_retries: int = 3,
         client_timeout: float = 60,
+        serialization: SerializationMode = SerializationMode.FLAT,
+        streaming: bool = False,
+        stream_chunk_size: int = 4194304,  # 4 MB
+        shared_memory: bool = False,
     ):
         """
         Initialize gRPC client with connection and retry settings.
@@ -60,6 +72,11 @@ class GrpcClient:
             retry_delay: Seconds between connection retry attempts
             max_retries: Maximum connection retry attempts
             client_timeout: Seconds to wait for server responses
+            serialization: Tensor wire format used for submitted tensors
+            streaming: Use chunked streaming RPCs instead of unary messages
+            stream_chunk_size: Chunk payload size in bytes for streamed submissions
+            shared_memory: Exchange tensor data through shared memory when the
+                server runs on the same host (detected at registration)
         """
         print(f"addr={master_addr}:{master_port}")
 
@@ -72,6 +89,17 @@ class GrpcClient:
         self.retry_delay = retry_delay
         self.max_retries = max_retries
         self.client_timeout = client_timeout
+        self.serialization = serialization
+        self.streaming = streaming
+        self.stream_chunk_size = stream_chunk_size
+        self.shared_memory = shared_memory
+
+        # Shared-memory transport state (enabled once co-location is confirmed)
+        self.use_shared_memory = False
+        self._submit_segment = None
+
+        # Last broadcast version received (long-poll cursor)
+        self.broadcast_version = 0
 
         # Initialize connection state
         self.channel = None
@@ -101,7 +129,12 @@ class GrpcClient:
                 response = self.stub.RegisterClient(
                     grpc_pb2.ClientInfo(client_id=self.client_id),
                 )
-                print(f"Register | success={response.success}")
+                self.use_shared_memory = self.shared_memory and can_attach(
+                    response.shm_probe
+                )
+                print(
+                    f"Register | success={response.success} | shared_memory={self.use_shared_memory}"
+                )
                 return
 
             except grpc.RpcError as e:
@@ -113,12 +146,45 @@ class GrpcClient:
                 print(f"Retry {attempt}/{self.max_retries} | {self.retry_delay}s delay")
                 time.sleep(self.retry_delay)
 
+    def close(self):
+        """Close the channel and release the shared-memory submission segment."""
+        if self.channel is not None:
+            self.channel.close()
+        if self._submit_segment is not None:
+            release_segment(self._submit_segment)
+            self._submit_segment = None
+
+    def _fetch_tensordict(
+        self, unary_rpc, stream_rpc, request
+    ) -> Tuple[int, Optional[Dict[str, torch.Tensor]]]:
+        """
+        Call a tensor-returning endpoint in unary or streaming form.
+
+        Args:
+            unary_rpc: Stub method returning an OperationResponse
+            stream_rpc: Stub method returning a TensorChunk stream
+            request: ClientInfo request
+
+        Returns:
+            Tuple of (broadcast version, received tensors or None if not ready yet)
+        """
+        if self.streaming and not self.use_shared_memory:
+            header, tensordict = chunks_to_tensordict(stream_rpc(request))
+            if header is None or not header.is_ready:
+                return 0, None
+            return header.version, tensordict
+
+        response = unary_rpc(request)
+        if not response.is_ready:
+            return response.version, None
+        return response.version, proto_to_tensordict(response.tensor_dict)
+
     def get_broadcast_state(self) -> Dict[str, torch.Tensor]:
         """
-        Retrieve broadcast state from server with polling and retry logic.
+        Retrieve the next broadcast state from the server via long-polling.
 
-        Continuously polls server until broadcast state is available.
-        Used during broadcast operations to receive global model.
+        Each request waits on the server until a version newer than the last
+        one received is published, so the model arrives as soon as it exists.
 
         Returns:
             Dictionary mapping parameter names to tensor values
@@ -130,15 +196,25 @@ class GrpcClient:
 
         while True:
             try:
-                request = grpc_pb2.ClientInfo(client_id=self.client_id)
-                response = self.stub.GetBroadcastState(request)
-                if response.is_ready:
-                    tensordict = proto_to_tensordict(response.tensor_dict)
-                    print(f"Received {get_msg_info(tensordict)}")
+                request = grpc_pb2.ClientInfo(
+                    client_id=self.client_id,
+                    after_version=self.broadcast_version,
+                    shared_memory=self.use_shared_memory,
+                )
+                version, tensordict = self._fetch_tensordict(
+                    self.stub.GetBroadcastState,
+                    self.stub.GetBroadcastStateStream,
+                    request,
+                )
+                if tensordict is not None:
+                    self.broadcast_version = version
+                    print(f"Received version={version} | {get_msg_info(tensordict)}")
                     return tensordict
+                # Server long-poll expired without a new version; ask again
                 poll_count += 1
-                print(f"Polling | {poll_count} total | {self.retry_delay}s delay")
-                time.sleep(self.retry_delay)
+                print(
+                    f"Long-poll | {poll_count} total | version={self.broadcast_version}"
+                )
 
             except grpc.RpcError as e:
                 error_count += 1
@@ -162,13 +238,30 @@ class GrpcClient:
             reduction_type: SUM, MEAN, or MAX aggregation operation
         """
         try:
-            proto_tensordict = tensordict_to_proto(tensordict)
-            request = grpc_pb2.AggregationRequest(
-                client_id=self.client_id,
-                tensor_dict=proto_tensordict,
-                reduction_type=reduction_type.value,
-            )
-            response = self.stub.SubmitForAggregation(request)
+            if self.streaming and not self.use_shared_memory:
+                chunks = tensordict_to_chunks(
+                    tensordict,
+                    self.stream_chunk_size,
+                    client_id=self.client_id,
+                    reduction_type=reduction_type.value,
+                )
+                response = self.stub.SubmitForAggregationStream(chunks)
+            else:
+                if self.use_shared_memory:
+                    # Reused every round: the server has copied it out once the call returns
+                    self._submit_segment, proto_tensordict = write_tensordict(
+                        tensordict, self._submit_segment
+                    )
+                else:
+                    proto_tensordict = tensordict_to_proto(
+                        tensordict, self.serialization
+                    )
+                request = grpc_pb2.AggregationRequest(
+                    client_id=self.client_id,
+                    tensor_dict=proto_tensordict,
+                    reduction_type=reduction_type.value,
+                )
+                response = self.stub.SubmitForAggregation(request)
             if response.success:
                 print("Successfully sent local model to server")
             else:
@@ -202,10 +295,15 @@ class GrpcClient:
             if elapsed > self.client_timeout:
                 raise RuntimeError(f"Aggregation timeout ({self.client_timeout}s)")
             try:
-                request = grpc_pb2.ClientInfo(client_id=self.client_id)
-                response = self.stub.GetAggregationResult(request)
-                if response.is_ready:
-                    tensordict = proto_to_tensordict(response.tensor_dict)
+                request = grpc_pb2.ClientInfo(
+                    client_id=self.client_id, shared_memory=self.use_shared_memory
+                )
+                _, tensordict = self._fetch_tensordict(
+                    self.stub.GetAggregationResult,
+                    self.stub.GetAggregationResultStream,
+                    request,
+                )
+                if tensordict is not None:
                     print(
                         f"Received {get_msg_info(tensordict)} (waited {elapsed:.1f}s)"
                     )
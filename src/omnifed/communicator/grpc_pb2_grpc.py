@@ -55,6 +55,21 @@ class GrpcServerStub(object):
                 request_serializer=src_dot_omnifed_dot_communicator_dot_grpc__pb2.ClientInfo.SerializeToString,
                 response_deserializer=src_dot_omnifed_dot_communicator_dot_grpc__pb2.StatusResponse.FromString,
                 _registered_method=True)
+        self.GetBroadcastStateStream = channel.unary_stream(
+                '/src.omnifed.communicator.GrpcServer/GetBroadcastStateStream',
+                request_serializer=src_dot_omnifed_dot_communicator_dot_grpc__pb2.ClientInfo.SerializeToString,
+                response_deserializer=src_dot_omnifed_dot_communicator_dot_grpc__pb2.TensorChunk.FromString,
+                _registered_method=True)
+        self.SubmitForAggregationStream = channel.stream_unary(
+                '/src.omnifed.communicator.GrpcServer/SubmitForAggregationStream',
+                request_serializer=src_dot_omnifed_dot_communicator_dot_grpc__pb2.TensorChunk.SerializeToString,
+                response_deserializer=src_dot_omnifed_dot_communicator_dot_grpc__pb2.StatusResponse.FromString,
+                _registered_method=True)
+        self.GetAggregationResultStream = channel.unary_stream(
+                '/src.omnifed.communicator.GrpcServer/GetAggregationResultStream',
+                request_serializer=src_dot_omnifed_dot_communicator_dot_grpc__pb2.ClientInfo.SerializeToString,
+                response_deserializer=src_dot_omnifed_dot_communicator_dot_grpc__pb2.TensorChunk.FromString,
+                _registered_method=True)
 
 
 class GrpcServerServicer(object):
@@ -89,6 +104,25 @@ class GrpcServerServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetBroadcastStateStream(self, request, context):
+        """Streaming variants: tensors are sent as fixed-size chunks of a flat buffer
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def SubmitForAggregationStream(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetAggregationResultStream(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_GrpcServerServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -112,6 +146,21 @@ def add_GrpcServerServicer_to_server(servicer, server):
                     request_deserializer=src_dot_omnifed_dot_communicator_dot_grpc__pb2.ClientInfo.FromString,
                     response_serializer=src_dot_omnifed_dot_communicator_dot_grpc__pb2.StatusResponse.SerializeToString,
             ),
+            'GetBroadcastStateStream': grpc.unary_stream_rpc_method_handler(
+                    servicer.GetBroadcastStateStream,
+                    request_deserializer=src_dot_omnifed_dot_communicator_dot_grpc__pb2.ClientInfo.FromString,
+                    response_serializer=src_dot_omnifed_dot_communicator_dot_grpc__pb2.TensorChunk.SerializeToString,
+            ),
+            'SubmitForAggregationStream': grpc.stream_unary_rpc_method_handler(
+                    servicer.SubmitForAggregationStream,
+                    request_deserializer=src_dot_omnifed_dot_communicator_dot_grpc__pb2.TensorChunk.FromString,
+                    response_serializer=src_dot_omnifed_dot_communicator_dot_grpc__pb2.StatusResponse.SerializeToString,
+            ),
+            'GetAggregationResultStream': grpc.unary_stream_rpc_method_handler(
+                    servicer.GetAggregationResultStream,
+                    request_deserializer=src_dot_omnifed_dot_communicator_dot_grpc__pb2.ClientInfo.FromString,
+                    response_serializer=src_dot_omnifed_dot_communicator_dot_grpc__pb2.TensorChunk.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'src.omnifed.communicator.GrpcServer', rpc_method_handlers)
@@ -231,3 +280,160 @@ class GrpcServer(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def GetBroadcastStateStream(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/src.omnifed.communicator.GrpcServer/GetBroadcastStateStream',
+            src_dot_omnifed_dot_communicator_dot_grpc__pb2.ClientInfo.SerializeToString,
+            src_dot_omnifed_dot_communicator_dot_grpc__pb2.TensorChunk.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def SubmitForAggregationStream(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            '/src.omnifed.communicator.GrpcServer/SubmitForAggregationStream',
+            src_dot_omnifed_dot_communicator_dot_grpc__pb2.TensorChunk.SerializeToString,
+            src_dot_omnifed_dot_communicator_dot_grpc__pb2.StatusResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetAggregationResultStream(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/src.omnifed.communicator.GrpcServer/GetAggregationResultStream',
+            src_dot_omnifed_dot_communicator_dot_grpc__pb2.ClientInfo.SerializeToString,
+            src_dot_omnifed_dot_communicator_dot_grpc__pb2.TensorChunk.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+
+class GrpcPeerStub(object):
+    """Service every rank runs for peer-to-peer (ring/tree) collectives
+    """
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.Deliver = channel.stream_unary(
+                '/src.omnifed.communicator.GrpcPeer/Deliver',
+                request_serializer=src_dot_omnifed_dot_communicator_dot_grpc__pb2.TensorChunk.SerializeToString,
+                response_deserializer=src_dot_omnifed_dot_communicator_dot_grpc__pb2.StatusResponse.FromString,
+                _registered_method=True)
+
+
+class GrpcPeerServicer(object):
+    """Service every rank runs for peer-to-peer (ring/tree) collectives
+    """
+
+    def Deliver(self, request_iterator, context):
+        """Deliver a chunked tensor message into this peer's mailbox
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_GrpcPeerServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'Deliver': grpc.stream_unary_rpc_method_handler(
+                    servicer.Deliver,
+                    request_deserializer=src_dot_omnifed_dot_communicator_dot_grpc__pb2.TensorChunk.FromString,
+                    response_serializer=src_dot_omnifed_dot_communicator_dot_grpc__pb2.StatusResponse.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'src.omnifed.communicator.GrpcPeer', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('src.omnifed.communicator.GrpcPeer', rpc_method_handlers)
+
+
+ # This class is part of an EXPERIMENTAL API.
+class GrpcPeer(object):
+    """Service every rank runs for peer-to-peer (ring/tree) collectives
+    """
+
+    @staticmethod
+    def Deliver(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            '/src.omnifed.communicator.GrpcPeer/Deliver',
+            src_dot_omnifed_dot_communicator_dot_grpc__pb2.TensorChunk.SerializeToString,
+            src_dot_omnifed_dot_communicator_dot_grpc__pb2.StatusResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -0,0 +1,647 @@
+# Copyright (c) 2025, Oak Ridge National Laboratory.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import queue
+import socket
+import threading
+from concurrent import futures
+from enum import Enum
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import grpc
+import ray
+import rich.repr
+import torch
+
+from ..utils import print
+from . import grpc_pb2, grpc_pb2_grpc
+from .base import AggregationOp
+from .utils import ChunkAssembler, tensordict_to_chunks
+
+# Width of one rank's row in the address rendezvous tensor (bytes of "host:port")
+ADDRESS_WIDTH = 128
+
+# Chunks buffered per child while relaying a broadcast (bounds relay memory)
+RELAY_DEPTH = 8
+
+
+class PeerCollective(str, Enum):
+    """Collective algorithm used by GrpcCommunicator."""
+
+    STAR = "star"  # Rank 0 server receives and returns every payload
+    RING = "ring"  # Ring all-reduce (reduce-scatter + all-gather), tree broadcast
+    TREE = "tree"  # Binary-tree reduce to rank 0, then tree broadcast
+
+
+class PeerBroadcast(str, Enum):
+    """Relay topology of pipelined peer broadcasts."""
+
+    TREE = "tree"  # Binary tree: ~2x model/bandwidth + O(log N) chunk latency
+    CHAIN = "chain"  # Chain: ~1x model/bandwidth + O(N) chunk latency
+
+
+def peer_host() -> str:
+    """
+    Address other ranks use to reach this process.
+
+    Uses the Ray node IP inside Ray actors and the IP the hostname resolves
+    to otherwise (loopback if it does not resolve).
+
+    Returns:
+        Host address
+    """
+    if ray.is_initialized():
+        return ray.util.get_node_ip_address()
+    try:
+        return socket.gethostbyname(socket.gethostname())
+    except OSError:
+        return "127.0.0.1"
+
+
+def encode_address(address: str, rank: int, world_size: int) -> torch.Tensor:
+    """
+    Place an address in this rank's row of a rendezvous tensor.
+
+    Summing every rank's tensor yields the full address table, so a single
+    SUM aggregation doubles as an all-gather of addresses.
+
+    Args:
+        address: "host:port" string
+        rank: Row to fill
+        world_size: Number of rows
+
+    Returns:
+        int64 tensor of shape (world_size, ADDRESS_WIDTH)
+
+    Raises:
+        ValueError: If the address does not fit in one row
+    """
+    data = address.encode()
+    if len(data) > ADDRESS_WIDTH:
+        raise ValueError(f"Peer address longer than {ADDRESS_WIDTH} bytes: {address}")
+    table = torch.zeros(world_size, ADDRESS_WIDTH, dtype=torch.int64)
+    table[rank, : len(data)] = torch.tensor(list(data), dtype=torch.int64)
+    return table
+
+
+def decode_addresses(table: torch.Tensor) -> List[str]:
+    """
+    Read the address table produced by summing encode_address() tensors.
+
+    Args:
+        table: int64 tensor of shape (world_size, ADDRESS_WIDTH)
+
+    Returns:
+        "host:port" string per rank
+    """
+    return [bytes(b for b in row.tolist() if b).decode() for row in table]
+
+
+def _flatten_by_dtype(
+    tensordict: Dict[str, torch.Tensor],
+) -> Tuple[Dict[str, torch.Tensor], List[Tuple[str, str, torch.Size]]]:
+    """
+    Concatenate tensors of equal dtype into one flat buffer each.
+
+    Args:
+        tensordict: Tensors to flatten
+
+    Returns:
+        Tuple of (flat buffer per dtype name, layout for _unflatten_by_dtype)
+    """
+    groups: Dict[str, List[torch.Tensor]] = {}
+    layout = []
+    for name, tensor in tensordict.items():
+        dtype = str(tensor.dtype)
+        groups.setdefault(dtype, []).append(tensor.detach().cpu().reshape(-1))
+        layout.append((name, dtype, tensor.shape))
+    flats = {dtype: torch.cat(tensors) for dtype, tensors in groups.items()}
+    return flats, layout
+
+
+def _unflatten_by_dtype(
+    flats: Dict[str, torch.Tensor], layout: List[Tuple[str, str, torch.Size]]
+) -> Dict[str, torch.Tensor]:
+    """
+    Split flat buffers back into named tensors.
+
+    Args:
+        flats: Flat buffer per dtype name
+        layout: Layout returned by _flatten_by_dtype
+
+    Returns:
+        Tensors by name (views into the flat buffers)
+    """
+    offsets = dict.fromkeys(flats, 0)
+    tensordict = {}
+    for name, dtype, shape in layout:
+        numel = shape.numel()
+        start = offsets[dtype]
+        tensordict[name] = flats[dtype][start : start + numel].view(shape)
+        offsets[dtype] = start + numel
+    return tensordict
+
+
+def _reduce_into(
+    target: torch.Tensor, value: torch.Tensor, reduction: AggregationOp
+) -> None:
+    """
+    Fold value into target in place (MEAN is summed and divided at the end).
+
+    Args:
+        target: Accumulator
+        value: Contribution of another rank
+        reduction: SUM, MEAN, or MAX
+    """
+    if reduction == AggregationOp.MAX:
+        torch.maximum(target, value, out=target)
+    else:
+        target.add_(value)
+
+
+def _finish_mean(tensor: torch.Tensor, world_size: int) -> None:
+    """Turn a summed tensor into the mean over world_size ranks in place."""
+    if tensor.is_floating_point():
+        tensor.div_(world_size)
+    else:
+        tensor.floor_divide_(world_size)
+
+
+@rich.repr.auto
+class GrpcPeerServer(grpc_pb2_grpc.GrpcPeerServicer):
+    """
+    Mailbox for tensor messages pushed by neighbouring ranks.
+
+    Each message is tagged with the collective step it belongs to; a rank
+    waits for exactly the tags its algorithm expects, so messages may
+    arrive before they are needed. Chunks are handed to the reader while
+    the message is still arriving, which lets relays forward them early.
+
+    Used by: GrpcPeerGroup on every rank
+    """
+
+    def __init__(self):
+        """Initialize an empty mailbox."""
+        self._streams: Dict[str, queue.Queue] = {}
+        self._cond = threading.Condition()
+
+    def Deliver(self, request_iterator, context):
+        """
+        gRPC endpoint: Receive one chunked tensor message from a peer.
+
+        Args:
+            request_iterator: TensorChunk stream (first chunk carries tag and layout)
+            context: gRPC context (unused)
+
+        Returns:
+            StatusResponse confirming delivery
+        """
+        stream = None
+        for chunk in request_iterator:
+            if stream is None:
+                with self._cond:
+                    stream = self._streams.setdefault(chunk.tag, queue.Queue())
+                    self._cond.notify_all()
+            stream.put(chunk)
+        if stream is not None:
+            stream.put(None)  # End of message
+        return grpc_pb2.StatusResponse(success=True)
+
+    def stream(self, tag: str, timeout: float) -> Iterator[grpc_pb2.TensorChunk]:
+        """
+        Iterate over the chunks of the message with the given tag as they arrive.
+
+        Args:
+            tag: Collective step identifier
+            timeout: Seconds to wait for the message and for each chunk
+
+        Yields:
+            TensorChunk messages in order (the first carries the layout)
+
+        Raises:
+            RuntimeError: If the message or one of its chunks does not arrive in time
+        """
+        with self._cond:
+            if not self._cond.wait_for(lambda: tag in self._streams, timeout):
+                raise RuntimeError(f"Peer message '{tag}' not received ({timeout}s)")
+            stream = self._streams.pop(tag)
+        while True:
+            try:
+                chunk = stream.get(timeout=timeout)
+            except queue.Empty:
+                raise RuntimeError(f"Peer message '{tag}' stalled ({timeout}s)")
+            if chunk is None:
+                return
+            yield chunk
+
+    def receive(self, tag: str, timeout: float) -> Dict[str, torch.Tensor]:
+        """
+        Wait for and remove the message with the given tag.
+
+        Args:
+            tag: Collective step identifier
+            timeout: Seconds to wait
+
+        Returns:
+            Received tensors
+
+        Raises:
+            RuntimeError: If the message does not arrive in time
+        """
+        assembler = ChunkAssembler()
+        for chunk in self.stream(tag, timeout):
+            assembler.add(chunk)
+        return assembler.tensordict()
+
+
+@rich.repr.auto
+class GrpcPeerGroup:
+    """
+    Peer-to-peer collectives over gRPC without a central data path.
+
+    Every rank runs a GrpcPeerServer and pushes tensor messages straight to
+    its neighbours. Ring all-reduce moves about 2x the payload through each
+    rank regardless of world size; binary-tree reduce and broadcast finish
+    in O(log N) steps, which suits small (latency-bound) payloads.
+    Broadcasts are pipelined: relays forward each chunk as soon as it
+    arrives instead of waiting for the whole message.
+
+    Collectives must be called in the same order on every rank.
+
+    Used by: GrpcCommunicator (collective="ring" or "tree")
+    """
+
+    def __init__(
+        self,
+        rank: int,
+        world_size: int,
+        max_workers: int = 10,
+        max_send_message_length: int = 104857600,  # 100 MB
+        max_receive_message_length: int = 104857600,  # 100 MB
+        stream_chunk_size: int = 4194304,  # 4 MB
+        timeout: float = 600.0,
+    ):
+        """
+        Initialize peer group settings (call start() to begin serving).
+
+        Args:
+            rank: This rank
+            world_size: Number of ranks in the group
+            max_workers: Thread pool size for the peer server
+            max_send_message_length: Maximum outbound message size in bytes
+            max_receive_message_length: Maximum inbound message size in bytes
+            stream_chunk_size: Chunk payload size in bytes for peer messages
+            timeout: Seconds to wait for a message from a peer
+        """
+        self.rank = rank
+        self.world_size = world_size
+        self.max_workers = max_workers
+        self.stream_chunk_size = stream_chunk_size
+        self.timeout = timeout
+        self.options = [
+            ("grpc.max_send_message_length", max_send_message_length),
+            ("grpc.max_receive_message_length", max_receive_message_length),
+        ]
+
+        self.addresses: List[str] = []
+        self._servicer = GrpcPeerServer()
+        self._server = None
+        self._channels: Dict[int, grpc.Channel] = {}
+        self._stubs: Dict[int, grpc_pb2_grpc.GrpcPeerStub] = {}
+        self._relay_executor = None  # Feeds relayed chunks to child ranks
+        self._seq = 0  # Collective counter, keeps tags unique across calls
+
+    def start(self) -> int:
+        """
+        Start the peer server on an ephemeral port.
+
+        Returns:
+            Port the server listens on
+        """
+        self._server = grpc.server(
+            futures.ThreadPoolExecutor(max_workers=self.max_workers),
+            options=self.options,
+        )
+        grpc_pb2_grpc.add_GrpcPeerServicer_to_server(self._servicer, self._server)
+        port = self._server.add_insecure_port("[::]:0")
+        self._server.start()
+        self._relay_executor = futures.ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="grpc-peer-relay"
+        )
+        print(f"Peer server listening on port {port}")
+        return port
+
+    def connect(self, addresses: List[str]):
+        """
+        Record every rank's peer address (channels open lazily).
+
+        Args:
+            addresses: "host:port" per rank
+        """
+        self.addresses = list(addresses)
+
+    def close(self):
+        """Close peer channels and stop the peer server."""
+        for channel in self._channels.values():
+            channel.close()
+        self._channels.clear()
+        self._stubs.clear()
+        if self._relay_executor is not None:
+            self._relay_executor.shutdown(wait=True)
+            self._relay_executor = None
+        if self._server is not None:
+            self._server.stop(grace=5)
+            self._server = None
+
+    def _stub(self, peer: int) -> grpc_pb2_grpc.GrpcPeerStub:
+        """Get (or open) the stub for a peer rank."""
+        if peer not in self._stubs:
+            channel = grpc.insecure_channel(self.addresses[peer], options=self.options)
+            self._channels[peer] = channel
+            self._stubs[peer] = grpc_pb2_grpc.GrpcPeerStub(channel)
+        return self._stubs[peer]
+
+    def _deliver(self, peer: int, chunks: Iterable[grpc_pb2.TensorChunk]):
+        """
+        Stream chunks into a peer's mailbox.
+
+        Args:
+            peer: Destination rank
+            chunks: TensorChunk stream (first chunk carries tag and layout)
+
+        Raises:
+            RuntimeError: If the peer rejects the message
+        """
+        response = self._stub(peer).Deliver(
+            chunks, timeout=self.timeout, wait_for_ready=True
+        )
+        if not response.success:
+            raise RuntimeError(f"Peer {peer} rejected a message")
+
+    def _send(self, peer: int, tag: str, tensordict: Dict[str, torch.Tensor]):
+        """
+        Push a tagged message into a peer's mailbox.
+
+        Args:
+            peer: Destination rank
+            tag: Collective step identifier
+            tensordict: Tensors to send
+        """
+        chunks = tensordict_to_chunks(
+            tensordict, self.stream_chunk_size, client_id=str(self.rank), tag=tag
+        )
+        self._deliver(peer, chunks)
+
+    def _drain(self, pending: queue.Queue) -> Iterator[grpc_pb2.TensorChunk]:
+        """Yield chunks queued for a child rank until the end marker."""
+        while True:
+            try:
+                chunk = pending.get(timeout=self.timeout)
+            except queue.Empty:
+                raise RuntimeError(f"Peer relay stalled ({self.timeout}s)")
+            if chunk is None:
+                return
+            yield chunk
+
+    def _recv(self, tag: str) -> Dict[str, torch.Tensor]:
+        """Wait for a tagged message from a peer."""
+        return self._servicer.receive(tag, self.timeout)
+
+    def _next_tag(self, name: str) -> Callable[..., str]:
+        """
+        Start a collective and return its tag builder.
+
+        Args:
+            name: Collective name
+
+        Returns:
+            Function mapping step identifiers to unique tags
+        """
+        self._seq += 1
+        seq = self._seq
+        return lambda *step: "/".join(map(str, (seq, name, *step)))
+
+    # =============================================================================
+    # COLLECTIVES
+    # =============================================================================
+
+    def all_reduce(
+        self,
+        tensordict: Dict[str, torch.Tensor],
+        reduction: AggregationOp,
+        collective: PeerCollective,
+    ) -> Dict[str, torch.Tensor]:
+        """
+        Reduce tensors across all ranks; every rank receives the result.
+
+        Args:
+            tensordict: Local tensors (same keys, shapes and dtypes on every rank)
+            reduction: SUM, MEAN, or MAX
+            collective: RING or TREE
+
+        Returns:
+            Reduced tensors (new CPU tensors; the input is not modified)
+        """
+        if self.world_size == 1:
+            return {name: tensor.clone() for name, tensor in tensordict.items()}
+
+        flats, layout = _flatten_by_dtype(tensordict)
+        if collective == PeerCollective.RING:
+            self._ring_all_reduce(flats, reduction)
+        else:
+            flats = self._tree_reduce(flats, reduction)
+            flats = self._pipelined_broadcast(
+                flats if self.rank == 0 else None, 0, PeerBroadcast.TREE
+            )
+        if reduction == AggregationOp.MEAN:
+            for flat in flats.values():
+                _finish_mean(flat, self.world_size)
+        return _unflatten_by_dtype(flats, layout)
+
+    def broadcast(
+        self,
+        tensordict: Optional[Dict[str, torch.Tensor]],
+        src: int = 0,
+        topology: PeerBroadcast = PeerBroadcast.TREE,
+    ) -> Dict[str, torch.Tensor]:
+        """
+        Send the source rank's tensors to every rank, relaying chunk by chunk.
+
+        Args:
+            tensordict: Tensors to send (only read on src)
+            src: Source rank
+            topology: Relay tree (TREE) or chain (CHAIN)
+
+        Returns:
+            The source rank's tensors
+        """
+        if self.world_size == 1:
+            return tensordict
+        return self._pipelined_broadcast(tensordict, src, PeerBroadcast(topology))
+
+    def all_gather(
+        self, tensordict: Dict[str, torch.Tensor]
+    ) -> List[Dict[str, torch.Tensor]]:
+        """
+        Collect every rank's tensors around the ring.
+
+        Payloads may differ in keys and shapes (e.g. compressed parts).
+
+        Args:
+            tensordict: Local tensors
+
+        Returns:
+            Tensors of each rank, indexed by rank
+        """
+        items: List[Optional[Dict[str, torch.Tensor]]] = [None] * self.world_size
+        items[self.rank] = tensordict
+        tag = self._next_tag("all_gather")
+        right = (self.rank + 1) % self.world_size
+        for step in range(self.world_size - 1):
+            send_idx = (self.rank - step) % self.world_size
+            recv_idx = (self.rank - step - 1) % self.world_size
+            self._send(right, tag(step), items[send_idx])
+            items[recv_idx] = self._recv(tag(step))
+        return items
+
+    def _ring_all_reduce(
+        self, flats: Dict[str, torch.Tensor], reduction: AggregationOp
+    ) -> None:
+        """
+        Ring all-reduce of flat buffers in place.
+
+        Each buffer is split into world_size segments. In N-1 reduce-scatter
+        steps every rank forwards one partially reduced segment to its right
+        neighbour, ending up owning one fully reduced segment; N-1 all-gather
+        steps then circulate the reduced segments.
+
+        Args:
+            flats: Flat buffer per dtype name (updated in place)
+            reduction: SUM, MEAN, or MAX
+        """
+        n = self.world_size
+        segments = {dtype: torch.tensor_split(flat, n) for dtype, flat in flats.items()}
+        tag = self._next_tag("ring")
+        right = (self.rank + 1) % n
+
+        def exchange(phase: str, step: int, send_idx: int, recv_idx: int):
+            self._send(
+                right,
+                tag(phase, step),
+                {dtype: segs[send_idx] for dtype, segs in segments.items()},
+            )
+            received = self._recv(tag(phase, step))
+            for dtype, segs in segments.items():
+                if phase == "reduce_scatter":
+                    _reduce_into(segs[recv_idx], received[dtype], reduction)
+                else:
+                    segs[recv_idx].copy_(received[dtype])
+
+        rank = self.rank
+        for step in range(n - 1):
+            exchange("reduce_scatter", step, (rank - step) % n, (rank - step - 1) % n)
+        for step in range(n - 1):
+            exchange("all_gather", step, (rank - step + 1) % n, (rank - step) % n)
+
+    def _tree_reduce(
+        self, flats: Dict[str, torch.Tensor], reduction: AggregationOp
+    ) -> Dict[str, torch.Tensor]:
+        """
+        Reduce flat buffers up a binary tree rooted at rank 0.
+
+        Args:
+            flats: Flat buffer per dtype name (updated in place)
+            reduction: SUM, MEAN, or MAX
+
+        Returns:
+            The reduced buffers (complete on rank 0 only)
+        """
+        tag = self._next_tag("tree_reduce")
+        for child in (2 * self.rank + 1, 2 * self.rank + 2):
+            if child < self.world_size:
+                received = self._recv(tag(child))
+                for dtype, flat in flats.items():
+                    _reduce_into(flat, received[dtype], reduction)
+        if self.rank > 0:
+            self._send((self.rank - 1) // 2, tag(self.rank), flats)
+        return flats
+
+    def _pipelined_broadcast(
+        self,
+        tensordict: Optional[Dict[str, torch.Tensor]],
+        src: int,
+        topology: PeerBroadcast,
+    ) -> Dict[str, torch.Tensor]:
+        """
+        Broadcast along a tree or chain rooted at src, forwarding chunks as they arrive.
+
+        Each child is fed by a relay thread through a bounded queue, so a
+        chunk leaves a rank while the next one is still being received and
+        the total time approaches one model transfer plus per-hop latency.
+
+        Args:
+            tensordict: Tensors to send (only read on src)
+            src: Root rank
+            topology: Relay tree (TREE) or chain (CHAIN)
+
+        Returns:
+            The root's tensors
+
+        Raises:
+            RuntimeError: If a chunk cannot be received or forwarded in time
+        """
+        n = self.world_size
+        tag = self._next_tag("broadcast")
+        vrank = (self.rank - src) % n  # Position in the topology rooted at src
+        if topology == PeerBroadcast.CHAIN:
+            vchildren = [vrank + 1]
+        else:
+            vchildren = [2 * vrank + 1, 2 * vrank + 2]
+        children = {(v + src) % n: tag(v) for v in vchildren if v < n}
+
+        if vrank == 0:
+            assembler = None
+            chunks = tensordict_to_chunks(
+                tensordict, self.stream_chunk_size, client_id=str(self.rank)
+            )
+        else:
+            assembler = ChunkAssembler()
+            chunks = self._servicer.stream(tag(vrank), self.timeout)
+
+        pending = {child: queue.Queue(maxsize=RELAY_DEPTH) for child in children}
+        sends = [
+            self._relay_executor.submit(self._deliver, child, self._drain(chunks_out))
+            for child, chunks_out in pending.items()
+        ]
+        try:
+            for index, chunk in enumerate(chunks):
+                if assembler is not None:
+                    assembler.add(chunk)
+                for child, chunks_out in pending.items():
+                    if index == 0:
+                        # The header names the step each child waits for
+                        header = grpc_pb2.TensorChunk()
+                        header.CopyFrom(chunk)
+                        header.tag = children[child]
+                        chunks_out.put(header, timeout=self.timeout)
+                    else:
+                        chunks_out.put(chunk, timeout=self.timeout)
+            for chunks_out in pending.values():
+                chunks_out.put(None, timeout=self.timeout)
+        except queue.Full:
+            raise RuntimeError(f"Peer relay stalled ({self.timeout}s)")
+        for send in sends:
+            send.result()
+
+        return tensordict if assembler is None else assembler.tensordict()
@@ -13,8 +13,7 @@
 # limitations under the License.
 
 import threading
-from collections import defaultdict
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 import warnings
 
 import rich.repr
@@ -22,8 +21,116 @@ import torch
 
 from ..utils import print
 from . import grpc_pb2, grpc_pb2_grpc
-from .base import AggregationOp
-from .utils import get_msg_info, proto_to_tensordict, tensordict_to_proto
+from .aggregation import IncrementalAggregator
+from .compression import BaseCompressor
+from .shm import SharedMemoryRing
+from .utils import (
+    WIRE_DTYPES,
+    ChunkAssembler,
+    SerializationMode,
+    chunk_tensor_slices,
+    get_msg_info,
+    proto_to_tensordict,
+    tensordict_to_chunks,
+    tensordict_to_proto,
+)
+
+
+@rich.repr.auto
+class EncodedPayload:
+    """
+    Encode-once wire forms of a published tensor dictionary.
+
+    The payload takes ownership of its tensors, which must not be modified
+    afterwards, so every form of a version carries the same values; callers
+    that keep updating their tensors in place pass a copy. Each form (unary response or chunk list) is built
+    by the first responder that needs it and then shared immutably by every
+    other responder, so the server serializes a model once per version
+    instead of once per client.
+    Co-located clients get a shared-memory form that carries only the layout.
+    Dropping the payload evicts the cached encodings.
+    """
+
+    def __init__(
+        self,
+        tensordict: Dict[str, torch.Tensor],
+        serialization: SerializationMode,
+        stream_chunk_size: int,
+        version: int = 0,
+        shm_ring: Optional[SharedMemoryRing] = None,
+        shm_channel: str = "result",
+    ):
+        """
+        Take ownership of the tensors without encoding anything yet.
+
+        Args:
+            tensordict: Tensors to encode (not copied, must not be modified later)
+            serialization: Tensor wire format for unary responses
+            stream_chunk_size: Chunk payload size in bytes for streamed responses
+            version: Broadcast version stamped on responses (0 for aggregation results)
+            shm_ring: Shared-memory store for co-located clients (None disables)
+            shm_channel: Ring channel the shared-memory form is published on
+        """
+        self.tensordict = tensordict
+        self.serialization = serialization
+        self.stream_chunk_size = stream_chunk_size
+        self.version = version
+        self.shm_ring = shm_ring
+        self.shm_channel = shm_channel
+        self._lock = threading.Lock()
+        self._response = None
+        self._shm_response = None
+        self._chunks = None
+
+    def response(self, shared_memory: bool = False) -> grpc_pb2.OperationResponse:
+        """
+        Get the unary response, encoding it on first use.
+
+        Args:
+            shared_memory: Return the shared-memory form (if the server has a ring)
+
+        Returns:
+            Shared OperationResponse (must not be modified)
+        """
+        with self._lock:
+            if shared_memory and self.shm_ring is not None:
+                if self._shm_response is None:
+                    self._shm_response = grpc_pb2.OperationResponse(
+                        tensor_dict=self.shm_ring.publish(
+                            self.shm_channel, self.tensordict
+                        ),
+                        is_ready=True,
+                        version=self.version,
+                    )
+                return self._shm_response
+
+            if self._response is None:
+                proto_tensordict = tensordict_to_proto(
+                    self.tensordict, self.serialization
+                )
+                self._response = grpc_pb2.OperationResponse(
+                    tensor_dict=proto_tensordict, is_ready=True, version=self.version
+                )
+            return self._response
+
+    def chunks(self) -> List[grpc_pb2.TensorChunk]:
+        """
+        Get the streamed form, encoding it on first use.
+
+        Returns:
+            Shared list of TensorChunk messages (must not be modified)
+        """
+        with self._lock:
+            if self._chunks is None:
+                self._chunks = list(
+                    tensordict_to_chunks(
+                        self.tensordict,
+                        self.stream_chunk_size,
+                        is_ready=True,
+                        version=self.version,
+                    )
+                )
+            return self._chunks
 
 
 @rich.repr.auto
@@ -39,33 +146,51 @@ class GrpcServer(grpc_pb2_grpc.GrpcServerServicer):
     def __init__(
         self,
         world_size: int,
+        serialization: SerializationMode = SerializationMode.FLAT,
+        stream_chunk_size: int = 4194304,  # 4 MB
+        long_poll_timeout: float = 30.0,
+        shared_memory: bool = False,
+        compression: Optional[BaseCompressor] = None,
     ):
         """
         Initialize gRPC server for federated learning coordination.
 
         Args:
             world_size: Total number of FL participants (including server)
+            serialization: Tensor wire format used for broadcast and aggregation responses
+            stream_chunk_size: Chunk payload size in bytes for streaming responses
+            long_poll_timeout: Max seconds a broadcast request waits for a new version
+            shared_memory: Serve co-located clients through shared memory
+            compression: Compressor clients apply to submissions (decompressed here)
         """
         print(f"world_size={world_size}")
 
         # Core configuration
         self.world_size = world_size
+        self.serialization = serialization
+        self.stream_chunk_size = stream_chunk_size
+        self.long_poll_timeout = long_poll_timeout
         self.registered_clients = set()
+        self.shm_ring = SharedMemoryRing() if shared_memory else None
+        self.compression = compression
+
+        # Global lock: session index, registration and broadcast state only.
+        # Each session has its own lock and tensor folds use per-tensor locks,
+        # so payload decoding and aggregation math never run under this lock.
         self.lock = threading.Lock()
 
-        # Aggregation session management
+        # Aggregation session management. Finished sessions are freed once
+        # every participant has fetched the result, so only in-flight rounds
+        # stay resident; client_sessions maps each client to its latest session.
         self.current_aggregation_session = 0
-        self.aggregation_state: dict[int, dict[str, Any]] = defaultdict(
-            lambda: {
-                "data": {},
-                "result": None,
-                "event": threading.Event(),
-                "reduction_type": None,
-            }
-        )
+        self.aggregation_state: dict[int, dict[str, Any]] = {}
+        self.client_sessions: dict[str, int] = {}
 
-        # Broadcast state storage
+        # Broadcast state storage (version increases on every publish)
         self._broadcast_state = {}
+        self._broadcast_version = 0
+        self._broadcast_payload: Optional[EncodedPayload] = None
+        self._broadcast_published = threading.Condition(self.lock)
 
     def get_broadcast_state(self) -> Dict[str, torch.Tensor]:
         """
@@ -81,20 +206,211 @@ class GrpcServer(grpc_pb2_grpc.GrpcServerServicer):
 
     def set_broadcast_state(self, tensordict: Dict[str, torch.Tensor]):
         """
-        Store broadcast state for distribution to clients.
+        Publish broadcast state as a new version and wake long-polling clients.
 
         Args:
             tensordict: Tensors to broadcast (typically global model)
+
+        Returns:
+            Version number of the published state
         """
+        # Snapshot outside the lock: the caller keeps training on these tensors
+        payload = EncodedPayload(
+            {key: tensor.detach().clone() for key, tensor in tensordict.items()},
+            self.serialization,
+            self.stream_chunk_size,
+            shm_ring=self.shm_ring,
+            shm_channel="broadcast",
+        )
         with self.lock:
-            self._broadcast_state = tensordict
-        print(get_msg_info(tensordict))
+            self._broadcast_version += 1
+            version = self._broadcast_version
+            payload.version = version
+            self._broadcast_state = payload.tensordict
+            # Replacing the payload evicts the previous version's encodings
+            self._broadcast_payload = payload
+            self._broadcast_published.notify_all()
+        print(f"version={version} | {get_msg_info(tensordict)}")
+        return version
+
+    def _wait_for_broadcast(self, after_version: int) -> bool:
+        """
+        Block until a broadcast version newer than after_version is published.
+
+        Args:
+            after_version: Last version the client has seen
+
+        Returns:
+            True if a newer version is available, False on long-poll timeout
+        """
+        with self._broadcast_published:
+            return self._broadcast_published.wait_for(
+                lambda: self._broadcast_version > after_version,
+                timeout=self.long_poll_timeout,
+            )
+
+    def _broadcast_snapshot(self, after_version: int):
+        """
+        Get the current broadcast payload if it is newer than after_version.
+
+        Args:
+            after_version: Last version the client has seen
+
+        Returns:
+            Tuple of (version, EncodedPayload or None if nothing newer is available)
+        """
+        with self.lock:
+            if self._broadcast_version > after_version:
+                return self._broadcast_version, self._broadcast_payload
+            return self._broadcast_version, None
+
+    def _fold_chunk(self, session_state: Dict, entries, chunk):
+        """
+        Fold one streamed chunk into the session's running aggregate.
+
+        Args:
+            session_state: Aggregation session data
+            entries: Layout entries from the first chunk of the stream
+            chunk: TensorChunk with a slice of the flat buffer
+        """
+        aggregator = session_state["aggregator"]
+        if chunk.entries:
+            # Stream header: make sure every announced tensor has an accumulator
+            for entry in entries:
+                aggregator.ensure(entry.key, entry.shape, WIRE_DTYPES[entry.dtype])
+
+        for entry, start, values in chunk_tensor_slices(entries, chunk):
+            aggregator.fold_slice(entry.key, start, values)
+
+    def _open_session(self, reduction_type: str) -> int:
+        """
+        Join the current aggregation session, validating the reduction type.
+
+        Caller must hold self.lock.
+
+        Args:
+            reduction_type: SUM, MEAN, or MAX aggregation operation
+
+        Returns:
+            Session ID the submission belongs to
+
+        Raises:
+            ValueError: If the reduction type differs from the session's
+        """
+        current_session = self.current_aggregation_session
+        session_state = self.aggregation_state.get(current_session)
+        if session_state is None:
+            session_state = {
+                "session_id": current_session,
+                "lock": threading.Lock(),
+                "aggregator": None,
+                "claimed": set(),
+                "submitted": set(),
+                "readers": set(),
+                "finalized": False,
+                "payload": None,
+                "event": threading.Event(),
+                "reduction_type": None,
+            }
+            self.aggregation_state[current_session] = session_state
+
+        if session_state["reduction_type"] is None:
+            session_state["aggregator"] = IncrementalAggregator(reduction_type)
+            session_state["reduction_type"] = reduction_type
+
+        if session_state["reduction_type"] != reduction_type:
+            raise ValueError(
+                f"Reduction mismatch | expected={session_state['reduction_type']} got={reduction_type}"
+            )
+        return current_session
+
+    def _claim_submission(self, session_state: Dict, client_id: str) -> bool:
+        """
+        Reserve the client's slot in a session before folding its contribution.
+
+        Contributions are folded on arrival and cannot be taken back, so a
+        retried or repeated submission must not reach the aggregator.
+
+        Args:
+            session_state: Aggregation session data
+            client_id: Submitting client identifier
+
+        Returns:
+            True if this is the client's first submission to the session
+        """
+        with session_state["lock"]:
+            if client_id in session_state["claimed"]:
+                duplicate = True
+            else:
+                session_state["claimed"].add(client_id)
+                duplicate = False
+        if duplicate:
+            warnings.warn(
+                f"Ignoring duplicate submission from client {client_id} to session {session_state['session_id']}",
+                RuntimeWarning,
+            )
+        return not duplicate
+
+    def submit_tensordict(
+        self, client_id: str, tensordict: Dict[str, torch.Tensor], reduction_type: str
+    ) -> int:
+        """
+        Fold a complete client contribution and finalize if all are present.
+
+        The contribution is not retained after folding. Repeated submissions
+        from a client to the same session are ignored.
+
+        Args:
+            client_id: Submitting client identifier
+            tensordict: Client tensors
+            reduction_type: SUM, MEAN, or MAX aggregation operation
+
+        Returns:
+            Session ID the submission belongs to
+        """
+        with self.lock:
+            current_session = self._open_session(reduction_type)
+            session_state = self.aggregation_state[current_session]
+        if not self._claim_submission(session_state, client_id):
+            return current_session
+
+        # Fold outside the global lock; the aggregator locks per tensor
+        session_state["aggregator"].fold(tensordict)
+        self._add_submission(session_state, current_session, client_id)
+        return current_session
+
+    def _add_submission(
+        self, session_state: Dict, current_session: int, client_id: str
+    ):
+        """
+        Record a completely folded contribution and finalize if all are present.
+
+        Args:
+            session_state: Aggregation session data
+            current_session: Session identifier
+            client_id: Submitting client identifier
+        """
+        with session_state["lock"]:
+            session_state["submitted"].add(client_id)
+            data_count = len(session_state["submitted"])
+        with self.lock:
+            self.client_sessions[client_id] = current_session
+        print(
+            f"Received from client {client_id} ({data_count}/{self.world_size} ready)"
+        )
+
+        self.perform_aggregation_if_ready(session_state, current_session)
 
     def perform_aggregation_if_ready(
         self, session_state: Dict, current_session: int
     ) -> bool:
         """
-        Execute aggregation when all clients have submitted data.
+        Finalize aggregation when all clients have submitted data.
+
+        Contributions are folded into the session aggregator on arrival,
+        so only finalization (the divide for MEAN) is left here. Exactly one
+        caller finalizes; the result is published before the session event
+        is set, so readers of finished sessions never need a lock.
 
         Args:
             session_state: Current aggregation session data
@@ -103,109 +419,120 @@ class GrpcServer(grpc_pb2_grpc.GrpcServerServicer):
         Returns:
             True if aggregation was performed, False if still waiting
         """
-        submitted_count = len(session_state["data"])
+        with session_state["lock"]:
+            submitted_count = len(session_state["submitted"])
+            ready = (
+                submitted_count == self.world_size and not session_state["finalized"]
+            )
+            if ready:
+                session_state["finalized"] = True
+                # Every participant holds a reference until it fetches the result
+                session_state["readers"] = set(session_state["submitted"])
 
         print(f"Waiting for clients ({submitted_count}/{self.world_size} ready)")
 
-        if submitted_count == self.world_size:
-            print(f"All {self.world_size} clients ready - beginning aggregation")
+        if not ready:
+            return False
 
-            first_data = next(iter(session_state["data"].values()))
-            aggregated_tensors = {}
+        print(f"All {self.world_size} clients ready - finalizing aggregation")
 
-            with torch.no_grad():
-                reduction_type = session_state["reduction_type"]
-                if reduction_type is None:
-                    raise ValueError(
-                        f"No reduction type set for session {current_session}"
-                    )
+        reduction_type = session_state["reduction_type"]
+        if reduction_type is None:
+            raise ValueError(f"No reduction type set for session {current_session}")
 
-                # Initialize aggregated tensors for each key
-                aggregated_tensors = {}
-
-                if reduction_type == AggregationOp.MAX.value:
-                    # MAX reduction: element-wise maximum
-                    for key, tensor in first_data.items():
-                        all_tensors = [
-                            client_data[key]
-                            for client_data in session_state["data"].values()
-                        ]
-                        aggregated_tensors[key] = torch.max(
-                            torch.stack(all_tensors), dim=0
-                        )[0]
-
-                elif reduction_type in (
-                    AggregationOp.SUM.value,
-                    AggregationOp.MEAN.value,
-                ):
-                    # SUM/MEAN reduction: sum all contributions
-                    for key, tensor in first_data.items():
-                        aggregated_tensors[key] = torch.zeros_like(tensor)
-
-                    # Sum all client contributions
-                    for client_data in session_state["data"].values():
-                        for key, tensor in client_data.items():
-                            if key in aggregated_tensors:
-                                aggregated_tensors[key] += tensor
-
-                    # Convert sum to mean if needed
-                    if reduction_type == AggregationOp.MEAN.value:
-                        for tensor in aggregated_tensors.values():
-                            tensor /= self.world_size
-
-                else:
-                    raise ValueError(f"Unknown reduction type: {reduction_type}")
-
-            session_state["result"] = aggregated_tensors
-            session_state["event"].set()
-            print(
-                f"Aggregated {len(aggregated_tensors)} tensors using {reduction_type}"
+        # Route new submissions to the next session before anyone can see this result
+        with self.lock:
+            self.current_aggregation_session = max(
+                self.current_aggregation_session, current_session + 1
             )
-            self.current_aggregation_session += 1
-            return True
-        return False
+
+        # The finalized tensors belong to the session alone, so no copy is needed
+        aggregated_tensors = session_state["aggregator"].finalize(self.world_size)
+        payload = EncodedPayload(
+            aggregated_tensors,
+            self.serialization,
+            self.stream_chunk_size,
+            shm_ring=self.shm_ring,
+        )
+
+        with session_state["lock"]:
+            session_state["aggregator"] = None
+            session_state["payload"] = payload
+        session_state["event"].set()
+        print(f"Aggregated {len(aggregated_tensors)} tensors using {reduction_type}")
+        return True
+
+    def _create_broadcast_response(
+        self, after_version: int, shared_memory: bool = False
+    ):
+        """
+        Get the cached gRPC response containing the broadcast state.
+
+        Args:
+            after_version: Last version the client has seen
+            shared_memory: Return the shared-memory form for a co-located client
+
+        Returns:
+            OperationResponse with tensor data or not-ready status
+        """
+        version, payload = self._broadcast_snapshot(after_version)
+        if payload is None:
+            return grpc_pb2.OperationResponse(is_ready=False, version=version)
+        return payload.response(shared_memory)
+
+    def _broadcast_chunks(self, after_version: int) -> List[grpc_pb2.TensorChunk]:
+        """
+        Get the cached chunks of the broadcast state.
+
+        Args:
+            after_version: Last version the client has seen
+
+        Returns:
+            TensorChunk messages (single not-ready chunk if nothing newer)
+        """
+        version, payload = self._broadcast_snapshot(after_version)
+        if payload is None:
+            return [grpc_pb2.TensorChunk(is_ready=False, version=version)]
+        return payload.chunks()
 
     def GetBroadcastState(self, request, context):
         """
         gRPC endpoint: Send broadcast state to requesting client.
 
+        Long-polls until a version newer than request.after_version is
+        published, so clients receive new models as soon as they exist.
+
         Args:
-            request: ClientInfo with client identifier
+            request: ClientInfo with client identifier and last seen version
             context: gRPC context (unused)
 
         Returns:
-            OperationResponse with tensor data or not-ready status
+            OperationResponse with tensor data or not-ready status on timeout
         """
         print(f"request.client_id={request.client_id}")
 
-        with self.lock:
-            if self._broadcast_state:
-                proto_tensordict = tensordict_to_proto(self._broadcast_state)
-                return grpc_pb2.OperationResponse(
-                    tensor_dict=proto_tensordict, is_ready=True
-                )
-            else:
-                return grpc_pb2.OperationResponse(is_ready=False)
+        self._wait_for_broadcast(request.after_version)
+        return self._create_broadcast_response(
+            request.after_version, request.shared_memory
+        )
 
-    def _create_aggregation_result_response(self, session_id: int):
+    def GetBroadcastStateStream(self, request, context):
         """
-        Create gRPC response containing aggregated tensor results.
+        gRPC endpoint: Stream broadcast state to requesting client in chunks.
+
+        Long-polls like GetBroadcastState.
 
         Args:
-            session_id: Aggregation session identifier
+            request: ClientInfo with client identifier and last seen version
+            context: gRPC context (unused)
 
-        Returns:
-            OperationResponse with aggregated tensors or not-ready status
-        """
-        if session_id in self.aggregation_state:
-            session_state = self.aggregation_state[session_id]
-            if session_state["result"] is not None:
-                aggregated_tensors = session_state["result"]
-                proto_tensordict = tensordict_to_proto(aggregated_tensors)
-                return grpc_pb2.OperationResponse(
-                    tensor_dict=proto_tensordict, is_ready=True
-                )
-        return grpc_pb2.OperationResponse(is_ready=False)
+        Yields:
+            TensorChunk messages (single not-ready chunk on timeout)
+        """
+        print(f"request.client_id={request.client_id}")
+
+        self._wait_for_broadcast(request.after_version)
+        yield from self._broadcast_chunks(request.after_version)
 
     def SubmitForAggregation(self, request, context):
         """
@@ -221,41 +548,197 @@ class GrpcServer(grpc_pb2_grpc.GrpcServerServicer):
         Returns:
             StatusResponse indicating success or failure
         """
-        with self.lock:
-            client_id = request.client_id
-            current_session = self.current_aggregation_session
+        client_id = request.client_id
+        print(
+            f"Client {client_id} submitting {len(request.tensor_dict.entries)} tensors"
+        )
+
+        try:
+            # Deserialize tensors (will be on CPU for consistent aggregation)
+            data = proto_to_tensordict(request.tensor_dict)
+            if self.compression is not None:
+                data = self.compression.decompress(data)
+            self.submit_tensordict(client_id, data, request.reduction_type)
+            return grpc_pb2.StatusResponse(success=True)
+
+        except Exception as e:
+            warnings.warn(
+                f"Failed to process aggregation submission from client {client_id} | {e}",
+                RuntimeWarning,
+            )
+            return grpc_pb2.StatusResponse(success=False)
+
+    def _receive_chunk(self, stream: Dict[str, Any], chunk):
+        """
+        Fold one chunk of a client's aggregation stream.
+
+        The first chunk (header) joins the current session; the stream dict
+        carries the header and session between calls. Compressed streams
+        cannot be folded slice by slice, so they are reassembled instead.
+        Chunks of a repeated submission to the same session are dropped.
+
+        Args:
+            stream: Per-stream state, empty before the first chunk
+            chunk: TensorChunk received from the client
+        """
+        if "header" not in stream:
             print(
-                f"Client {client_id} submitting {len(request.tensor_dict.entries)} tensors"
+                f"Client {chunk.client_id} streaming {len(chunk.entries)} tensors ({chunk.total_size} bytes)"
             )
+            if self.compression is not None:
+                stream["assembler"] = ChunkAssembler()
+            else:
+                with self.lock:
+                    stream["session_id"] = self._open_session(chunk.reduction_type)
+                    stream["session_state"] = self.aggregation_state[
+                        stream["session_id"]
+                    ]
+                stream["duplicate"] = not self._claim_submission(
+                    stream["session_state"], chunk.client_id
+                )
+            stream["header"] = chunk
 
-            try:
-                # Deserialize tensors (will be on CPU for consistent aggregation)
-                data = proto_to_tensordict(request.tensor_dict)
-                session_state = self.aggregation_state[current_session]
+        if stream.get("duplicate"):
+            return
+        if "assembler" in stream:
+            stream["assembler"].add(chunk)
+            return
 
-                if session_state["reduction_type"] is None:
-                    session_state["reduction_type"] = request.reduction_type
+        # Fold outside the global lock; the aggregator locks per tensor
+        self._fold_chunk(stream["session_state"], stream["header"].entries, chunk)
 
-                if session_state["reduction_type"] != request.reduction_type:
-                    raise ValueError(
-                        f"Reduction mismatch | expected={session_state['reduction_type']} got={request.reduction_type}"
-                    )
+    def _finish_stream(self, stream: Dict[str, Any]):
+        """
+        Register a completely received stream and finalize if all are present.
 
-                session_state["data"][client_id] = data
-                data_count = len(session_state["data"])
-                print(
-                    f"Received from client {client_id} ({data_count}/{self.world_size} ready)"
-                )
+        Args:
+            stream: Per-stream state filled by _receive_chunk
 
-                self.perform_aggregation_if_ready(session_state, current_session)
-                return grpc_pb2.StatusResponse(success=True)
+        Raises:
+            ValueError: If the stream contained no chunks
+        """
+        if "header" not in stream:
+            raise ValueError("Empty aggregation stream")
+
+        header = stream["header"]
+        if "assembler" in stream:
+            data = self.compression.decompress(stream["assembler"].tensordict())
+            self.submit_tensordict(header.client_id, data, header.reduction_type)
+            return
+
+        if stream["duplicate"]:
+            return
+        session_state = stream["session_state"]
+        session_state["aggregator"].mark_folded()
+        self._add_submission(
+            session_state, stream["session_id"], stream["header"].client_id
+        )
 
-            except Exception as e:
-                warnings.warn(
-                    f"Failed to process aggregation submission from client {client_id} | {e}",
-                    RuntimeWarning,
-                )
-                return grpc_pb2.StatusResponse(success=False)
+    def SubmitForAggregationStream(self, request_iterator, context):
+        """
+        gRPC endpoint: Receive chunked client tensors for aggregation.
+
+        Each chunk is folded into the session's running aggregate on arrival,
+        so server memory stays bounded by one model regardless of world size.
+
+        Args:
+            request_iterator: TensorChunk stream (first chunk carries metadata)
+            context: gRPC context (unused)
+
+        Returns:
+            StatusResponse indicating success or failure
+        """
+        stream: Dict[str, Any] = {}
+        try:
+            for chunk in request_iterator:
+                self._receive_chunk(stream, chunk)
+            self._finish_stream(stream)
+            return grpc_pb2.StatusResponse(success=True)
+
+        except Exception as e:
+            client_id = stream["header"].client_id if "header" in stream else None
+            warnings.warn(
+                f"Failed to process aggregation stream from client {client_id} | {e}",
+                RuntimeWarning,
+            )
+            return grpc_pb2.StatusResponse(success=False)
+
+    def _find_client_session(self, client_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Find the latest session the client submitted to.
+
+        Caller must hold self.lock.
+
+        Args:
+            client_id: Client identifier
+
+        Returns:
+            Session state, or None if the client has no submitted data
+            (or its last result was already fetched and freed)
+        """
+        session_id = self.client_sessions.get(client_id)
+        if session_id is not None and session_id in self.aggregation_state:
+            return self.aggregation_state[session_id]
+
+        warnings.warn(
+            f"Client {client_id} has no data submitted for aggregation",
+            RuntimeWarning,
+        )
+        return None
+
+    def release_result(self, session_state: Dict[str, Any], client_id: str):
+        """
+        Drop a participant's reference to a finished session's result.
+
+        The session (aggregated tensors and encoded payloads) is freed once
+        every participant has released it. Handlers still sending the payload
+        keep their own reference until they finish.
+
+        Args:
+            session_state: Finished aggregation session data
+            client_id: Participant that has received the result
+        """
+        with session_state["lock"]:
+            session_state["readers"].discard(client_id)
+            if session_state["readers"]:
+                return
+            participants = session_state["submitted"]
+
+        session_id = session_state["session_id"]
+        with self.lock:
+            if self.aggregation_state.pop(session_id, None) is None:
+                return
+            for participant in participants:
+                if self.client_sessions.get(participant) == session_id:
+                    del self.client_sessions[participant]
+        print(f"Freed session {session_id} | {len(self.aggregation_state)} active")
+
+    def _wait_for_result_payload(self, client_id: str) -> Optional[EncodedPayload]:
+        """
+        Wait for the result of the latest session the client submitted to.
+
+        Args:
+            client_id: Client identifier
+
+        Returns:
+            Encoded session result, or None if the client has no submitted data
+        """
+        with self.lock:
+            session_state = self._find_client_session(client_id)
+        if session_state is None:
+            return None
+
+        print(f"Client {client_id} requesting aggregation result")
+
+        if not session_state["event"].is_set():
+            print(f"Client {client_id} waiting for aggregation to complete")
+            session_state["event"].wait()
+            print(f"Aggregation complete for client {client_id}")
+
+        # Published before the event is set and never modified afterwards
+        payload = session_state["payload"]
+        self.release_result(session_state, client_id)
+        return payload
 
     def GetAggregationResult(self, request, context):
         """
@@ -273,43 +756,49 @@ class GrpcServer(grpc_pb2_grpc.GrpcServerServicer):
         """
         client_id = request.client_id
 
-        with self.lock:
-            target_session = None
-            for session_id in sorted(self.aggregation_state.keys(), reverse=True):
-                if client_id in self.aggregation_state[session_id]["data"]:
-                    target_session = session_id
-                    break
-            if target_session is None:
-                warnings.warn(
-                    f"Client {client_id} has no data submitted for aggregation",
-                    RuntimeWarning,
-                )
+        try:
+            payload = self._wait_for_result_payload(client_id)
+            if payload is None:
                 return grpc_pb2.OperationResponse(is_ready=False)
 
-        print(f"Client {client_id} requesting aggregation result")
-
-        try:
-            session_state = self.aggregation_state[target_session]
-            with self.lock:
-                if session_state["result"] is not None:
-                    print(f"Sending aggregated model to client {client_id}")
-                    return self._create_aggregation_result_response(target_session)
+            print(f"Sending aggregated model to client {client_id}")
+            return payload.response(request.shared_memory)
 
-            print(f"Client {client_id} waiting for aggregation to complete")
-            session_state["event"].wait()
-            print(f"Aggregation complete for client {client_id}")
-            with self.lock:
-                if session_state["result"] is not None:
-                    print(f"Sending aggregated model to client {client_id}")
-                    return self._create_aggregation_result_response(target_session)
+        except Exception as e:
+            warnings.warn(
+                f"Failed to get aggregation result for client {client_id} | {e}",
+                RuntimeWarning,
+            )
             return grpc_pb2.OperationResponse(is_ready=False)
 
+    def GetAggregationResultStream(self, request, context):
+        """
+        gRPC endpoint: Stream aggregation result to requesting client in chunks.
+
+        Args:
+            request: ClientInfo with client identifier
+            context: gRPC context (unused)
+
+        Yields:
+            TensorChunk messages (single not-ready chunk on failure)
+        """
+        client_id = request.client_id
+
+        try:
+            payload = self._wait_for_result_payload(client_id)
         except Exception as e:
             warnings.warn(
                 f"Failed to get aggregation result for client {client_id} | {e}",
                 RuntimeWarning,
             )
-            return grpc_pb2.OperationResponse(is_ready=False)
+            payload = None
+
+        if payload is None:
+            yield grpc_pb2.TensorChunk(is_ready=False)
+            return
+
+        print(f"Streaming aggregated model to client {client_id}")
+        yield from payload.chunks()
 
     def RegisterClient(self, request, context):
         """
@@ -326,4 +815,10 @@ class GrpcServer(grpc_pb2_grpc.GrpcServerServicer):
             self.registered_clients.add(request.client_id)
             total_clients = len(self.registered_clients)
             print(f"{total_clients}/{self.world_size} total")
-            return grpc_pb2.StatusResponse(success=True)
+            shm_probe = self.shm_ring.probe_name if self.shm_ring is not None else ""
+            return grpc_pb2.StatusResponse(success=True, shm_probe=shm_probe)
+
+    def close(self):
+        """Release shared-memory segments (call after the gRPC server has stopped)."""
+        if self.shm_ring is not None:
+            self.shm_ring.close()
@@ -0,0 +1,232 @@
+# Copyright (c) 2025, Oak Ridge National Laboratory.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import uuid
+from collections import defaultdict, deque
+from multiprocessing import resource_tracker, shared_memory
+from typing import Deque, Dict, Optional, Tuple
+
+import rich.repr
+import torch
+
+from . import grpc_pb2
+from .utils import _flat_buffer_to_tensordict, _flat_layout, _pack_flat
+
+# Segments created by this process (attaching to these must not untrack them)
+_OWNED_SEGMENTS = set()
+
+
+def _segment_name(prefix: str) -> str:
+    """Generate a unique segment name (kept short for macOS' 31-char limit)."""
+    return f"{prefix}_{uuid.uuid4().hex[:16]}"
+
+
+def create_segment(size: int, prefix: str = "omnifed") -> shared_memory.SharedMemory:
+    """
+    Create a new shared-memory segment owned by this process.
+
+    Args:
+        size: Segment size in bytes
+        prefix: Segment name prefix
+
+    Returns:
+        Created SharedMemory segment (caller must close and unlink it)
+    """
+    segment = shared_memory.SharedMemory(
+        name=_segment_name(prefix), create=True, size=max(1, size)
+    )
+    _OWNED_SEGMENTS.add(segment.name)
+    return segment
+
+
+def release_segment(segment: shared_memory.SharedMemory):
+    """
+    Close and unlink a segment created with create_segment.
+
+    Args:
+        segment: Segment to release
+    """
+    _OWNED_SEGMENTS.discard(segment.name)
+    segment.close()
+    try:
+        segment.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def attach_segment(name: str) -> shared_memory.SharedMemory:
+    """
+    Attach to an existing segment created by another process.
+
+    Readers must not register the segment with their resource tracker,
+    otherwise it would be unlinked when the reader exits.
+
+    Args:
+        name: Segment name
+
+    Returns:
+        Attached SharedMemory segment (caller must close it)
+
+    Raises:
+        FileNotFoundError: If no segment with this name exists on this host
+    """
+    segment = shared_memory.SharedMemory(name=name)
+    if name not in _OWNED_SEGMENTS:
+        resource_tracker.unregister(segment._name, "shared_memory")
+    return segment
+
+
+def can_attach(name: str) -> bool:
+    """
+    Check whether a segment is reachable (i.e. the creator shares this host).
+
+    Args:
+        name: Segment name
+
+    Returns:
+        True if the segment could be attached
+    """
+    if not name:
+        return False
+    try:
+        attach_segment(name).close()
+        return True
+    except (FileNotFoundError, OSError):
+        return False
+
+
+def write_tensordict(
+    tensordict: Dict[str, torch.Tensor],
+    segment: Optional[shared_memory.SharedMemory] = None,
+) -> Tuple[shared_memory.SharedMemory, grpc_pb2.TensorDict]:
+    """
+    Pack a tensor dictionary into a shared-memory segment.
+
+    Args:
+        tensordict: Dictionary mapping parameter names to tensor values
+        segment: Segment to reuse if large enough (a new one is created otherwise)
+
+    Returns:
+        Tuple of (segment holding the data, TensorDict proto with layout and shm_name)
+    """
+    entries, total_bytes = _flat_layout(tensordict)
+    if segment is None or segment.size < total_bytes:
+        if segment is not None:
+            release_segment(segment)
+        segment = create_segment(total_bytes)
+
+    if total_bytes > 0:
+        flat_buffer = torch.frombuffer(
+            segment.buf, dtype=torch.uint8, count=total_bytes
+        )
+        _pack_flat(tensordict, entries, flat_buffer)
+        del flat_buffer  # Views must be gone before the segment can be closed
+
+    return segment, grpc_pb2.TensorDict(entries=entries, shm_name=segment.name)
+
+
+def read_tensordict(proto_tensordict: grpc_pb2.TensorDict) -> Dict[str, torch.Tensor]:
+    """
+    Copy a tensor dictionary out of the shared-memory segment named in a proto.
+
+    The data is copied with a single bulk memcpy so the segment can be
+    released by its owner right after this returns.
+
+    Args:
+        proto_tensordict: TensorDict with layout entries and shm_name
+
+    Returns:
+        Dictionary mapping parameter names to tensors (views into one private buffer)
+    """
+    entries = proto_tensordict.entries
+    total_bytes = max((e.offset + e.data_size for e in entries), default=0)
+
+    segment = attach_segment(proto_tensordict.shm_name)
+    try:
+        if total_bytes == 0:
+            flat_buffer = torch.empty(0, dtype=torch.uint8)
+        else:
+            shared = torch.frombuffer(segment.buf, dtype=torch.uint8, count=total_bytes)
+            flat_buffer = shared.clone()
+            del shared
+    finally:
+        segment.close()
+
+    return _flat_buffer_to_tensordict(entries, flat_buffer)
+
+
+@rich.repr.auto
+class SharedMemoryRing:
+    """
+    Server-side store of published shared-memory payloads.
+
+    Each channel (e.g. "broadcast", "result") keeps its latest `keep`
+    segments alive; publishing a new one unlinks the oldest. Readers copy
+    out right after receiving a segment name, and FL rounds cannot publish
+    twice before every client has consumed the previous payload, so a
+    depth of two leaves a full round of slack.
+
+    Used by: GrpcServer for co-located clients
+    """
+
+    def __init__(self, keep: int = 2):
+        """
+        Initialize an empty ring and the co-location probe segment.
+
+        Args:
+            keep: Segments retained per channel
+        """
+        self.keep = keep
+        self._lock = threading.Lock()
+        self._segments: Dict[str, Deque[shared_memory.SharedMemory]] = defaultdict(
+            deque
+        )
+        self._probe = create_segment(1, prefix="omnifed_probe")
+
+    @property
+    def probe_name(self) -> str:
+        """Name of the segment clients attach to in order to detect co-location."""
+        return self._probe.name
+
+    def publish(
+        self, channel: str, tensordict: Dict[str, torch.Tensor]
+    ) -> grpc_pb2.TensorDict:
+        """
+        Write a payload to a new segment and retire the channel's oldest one.
+
+        Args:
+            channel: Payload channel name
+            tensordict: Tensors to publish
+
+        Returns:
+            TensorDict proto referencing the new segment
+        """
+        segment, proto_tensordict = write_tensordict(tensordict)
+        with self._lock:
+            retained = self._segments[channel]
+            retained.append(segment)
+            while len(retained) > self.keep:
+                release_segment(retained.popleft())
+        return proto_tensordict
+
+    def close(self):
+        """Unlink every retained segment and the probe."""
+        with self._lock:
+            for retained in self._segments.values():
+                while retained:
+                    release_segment(retained.popleft())
+            if self._probe is not None:
+                release_segment(self._probe)
+                self._probe = None
@@ -13,16 +13,20 @@
 # limitations under the License.
 
 import datetime
-import warnings
+import socket
 from enum import Enum
+from typing import Callable, Dict, Iterator, List, Optional
 
+import ray
 import rich.repr
 import torch
 import torch.distributed as dist
 from torch import nn
+from torch._utils import _flatten_dense_tensors, _unflatten_dense_tensors
 
 from ..utils import print
-from .base import AggregationOp, BaseCommunicator
+from .base import AggregationOp, AsyncWork, BaseCommunicator, TensorFilter
+from .compression import BaseCompressor
 from .utils import get_msg_info
 
 
@@ -36,6 +40,95 @@ class InitMethod(str, Enum):
 # ======================================================================================
 
 
+def _host_id() -> str:
+    """
+    Identify the host this process runs on.
+
+    Uses the Ray node IP (as listed by ray.nodes()) inside Ray actors and
+    falls back to the hostname outside of Ray.
+
+    Returns:
+        Host identifier shared by all co-located ranks
+    """
+    if ray.is_initialized():
+        return ray.util.get_node_ip_address()
+    return socket.gethostname()
+
+
+def _iter_buckets(
+    tensors: List[torch.Tensor], bucket_size_bytes: int
+) -> Iterator[List[torch.Tensor]]:
+    """
+    Group tensors into size-capped buckets of a single dtype and device.
+
+    Tensors keep their order within each (dtype, device) group, so every
+    rank forms identical buckets from identically ordered inputs.
+
+    Args:
+        tensors: Tensors to group
+        bucket_size_bytes: Soft cap per bucket (a larger tensor gets its own bucket)
+
+    Yields:
+        Lists of tensors sharing dtype and device
+    """
+    open_buckets = {}
+    for tensor in tensors:
+        key = (tensor.dtype, tensor.device)
+        bucket, nbytes = open_buckets.get(key, ([], 0))
+        tensor_bytes = tensor.numel() * tensor.element_size()
+        if bucket and nbytes + tensor_bytes > bucket_size_bytes:
+            yield bucket
+            bucket, nbytes = [], 0
+        bucket.append(tensor)
+        open_buckets[key] = (bucket, nbytes + tensor_bytes)
+    for bucket, _ in open_buckets.values():
+        yield bucket
+
+
+def _launch_coalesced(
+    tensors: List[torch.Tensor],
+    collective: Callable[[torch.Tensor], dist.Work],
+    bucket_size_bytes: int,
+) -> Callable[[], None]:
+    """
+    Launch a non-blocking in-place collective over tensors, one call per bucket.
+
+    Each multi-tensor bucket is flattened and its collective started before
+    the next bucket is packed, so packing overlaps with communication.
+
+    Args:
+        tensors: Tensors to update in place (same order on every rank)
+        collective: Starts an async_op collective on a tensor and returns its work
+        bucket_size_bytes: Bucket cap in bytes (0 runs one collective per tensor)
+
+    Returns:
+        Function that waits for all buckets and copies results back in place
+    """
+    if bucket_size_bytes <= 0:
+        buckets = [[tensor] for tensor in tensors]
+    else:
+        buckets = _iter_buckets(tensors, bucket_size_bytes)
+
+    pending = []
+    for bucket in buckets:
+        if len(bucket) == 1:
+            pending.append((collective(bucket[0]), None, None))
+            continue
+        flat = _flatten_dense_tensors(bucket)
+        pending.append((collective(flat), flat, bucket))
+
+    def wait():
+        for work, flat, bucket in pending:
+            work.wait()
+            if bucket is None:
+                continue
+            for tensor, synced in zip(bucket, _unflatten_dense_tensors(flat, bucket)):
+                tensor.copy_(synced)
+        pending.clear()
+
+    return wait
+
+
 @rich.repr.auto
 class TorchDistCommunicator(BaseCommunicator):
     """
@@ -58,6 +151,9 @@ class TorchDistCommunicator(BaseCommunicator):
         sharedfile: str = "sharedfile",
         timeout: int = 60,
         max_retries: int = 5,
+        bucket_size_mb: float = 25.0,
+        hierarchical: bool = False,
+        compression: Optional[BaseCompressor] = None,
     ) -> None:
         """
         Initialize PyTorch distributed communicator.
@@ -72,6 +168,11 @@ class TorchDistCommunicator(BaseCommunicator):
             sharedfile: Shared file path for file-based initialization
             timeout: Process group initialization timeout (seconds)
             max_retries: Maximum initialization retry attempts
+            bucket_size_mb: Coalesce tensors into flat buckets of this size so each
+                bucket needs one collective (0 disables coalescing)
+            hierarchical: Reduce within each host first, then across host leaders
+            compression: Compressor for aggregation payloads (between host
+                leaders only when hierarchical)
         """
         super().__init__(rank, world_size, master_addr, master_port)
         print(
@@ -90,6 +191,14 @@ class TorchDistCommunicator(BaseCommunicator):
         self.sharedfile: str = sharedfile
         self.timeout: datetime.timedelta = datetime.timedelta(seconds=timeout)
         self.max_retries: int = max_retries
+        self.bucket_size_bytes: int = int(bucket_size_mb * 1024 * 1024)
+        self.hierarchical: bool = hierarchical
+        self.compression: Optional[BaseCompressor] = compression
+
+        # Two-level process groups (set in _setup_hierarchy when it pays off)
+        self.host_group = None
+        self.host_leader: int = rank
+        self.leader_group = None
 
         # Backend validation with automatic fallback
         if self.backend == "nccl" and not torch.cuda.is_available():
@@ -134,75 +243,297 @@ class TorchDistCommunicator(BaseCommunicator):
                     f"Unknown init_method: {self.init_method}. Supported: {[m.value for m in InitMethod]}"
                 )
 
+        if self.hierarchical:
+            self._setup_hierarchy()
+
+    def _setup_hierarchy(self):
+        """
+        Group ranks by host and create the intra-host and leader process groups.
+
+        Every rank must create every group in the same order, so the host
+        map is exchanged first and groups are built from it deterministically.
+        The lowest rank on each host acts as its leader. Falls back to flat
+        all-reduce when there is a single host or one rank per host.
+        """
+        hosts = [None] * self.world_size
+        dist.all_gather_object(hosts, _host_id())
+
+        host_ranks: Dict[str, List[int]] = {}
+        for rank, host in enumerate(hosts):
+            host_ranks.setdefault(host, []).append(rank)
+
+        num_hosts = len(host_ranks)
+        if num_hosts == 1 or num_hosts == self.world_size:
+            print(f"Hierarchy disabled | {num_hosts} hosts for {self.world_size} ranks")
+            return
+
+        for ranks in host_ranks.values():
+            group = dist.new_group(ranks)
+            if self.rank in ranks:
+                self.host_group = group
+                self.host_leader = ranks[0]
+        self.leader_group = dist.new_group([ranks[0] for ranks in host_ranks.values()])
+
+        print(
+            f"Hierarchy | {num_hosts} hosts | leader={self.host_leader} | host_ranks={host_ranks}"
+        )
+
+    def _hierarchical_all_reduce(
+        self, tensor: torch.Tensor, op: dist.ReduceOp
+    ) -> dist.Work:
+        """
+        All-reduce a tensor in two levels.
+
+        The intra-host reduce and the leaders' all-reduce complete before
+        returning; only the final intra-host broadcast is left in flight.
+
+        Args:
+            tensor: Tensor to reduce in place
+            op: Reduction operation (SUM or MAX)
+
+        Returns:
+            Work handle of the intra-host broadcast
+        """
+        dist.reduce(tensor, dst=self.host_leader, op=op, group=self.host_group)
+        if self.rank == self.host_leader:
+            dist.all_reduce(tensor, op=op, group=self.leader_group)
+        return dist.broadcast(
+            tensor, src=self.host_leader, group=self.host_group, async_op=True
+        )
+
+    def _collect_tensors(
+        self,
+        msg: BaseCommunicator.MsgT,
+        operation: str,
+        tensor_filter: Optional[TensorFilter] = None,
+    ) -> Dict[str, torch.Tensor]:
+        """
+        Collect the named tensors of a message that take part in a collective.
+
+        Args:
+            msg: Model, tensor dict, or tensor
+            operation: Operation name for warnings
+            tensor_filter: Tensors to include (default: TensorFilter())
+
+        Returns:
+            Tensors to update in place by name, in a rank-independent order
+            (a bare tensor is named "tensor")
+        """
+        if isinstance(msg, (nn.Module, dict)):
+            tensor_filter = tensor_filter or TensorFilter()
+            return tensor_filter.select(msg, operation)
+        else:
+            return {"tensor": msg}
+
+    def _launch_compressed(
+        self,
+        tensors: Dict[str, torch.Tensor],
+        reduction: AggregationOp,
+        group: Optional[dist.ProcessGroup] = None,
+    ) -> Callable[[], None]:
+        """
+        Start a compressed aggregation of tensors.
+
+        Compressed parts are not summable (e.g. top-k indices differ per
+        rank), so they are all-gathered with one collective per dtype and
+        every rank decompresses and reduces all contributions locally.
+
+        Payloads keep the caller's tensor names, so per-tensor compressor
+        state (e.g. PowerSGD warm starts) follows the same tensor across calls.
+
+        Args:
+            tensors: Tensors to update in place by name (same order on every rank)
+            reduction: SUM, MEAN, or MAX reduction operation
+            group: Ranks to gather from (default: all; MEAN still divides by
+                world_size, so members must contribute sums over their hosts)
+
+        Returns:
+            Function that waits for the gathers and writes reduced values in place
+        """
+        group_size = dist.get_world_size(group)
+        compressed = self.compression.compress(tensors)
+
+        keys_by_dtype: Dict[torch.dtype, List[str]] = {}
+        for key, part in compressed.items():
+            keys_by_dtype.setdefault(part.dtype, []).append(key)
+
+        pending = []
+        for keys in keys_by_dtype.values():
+            parts = [compressed[key] for key in keys]
+            flat = _flatten_dense_tensors(parts)
+            gathered = [torch.empty_like(flat) for _ in range(group_size)]
+            work = dist.all_gather(gathered, flat, group=group, async_op=True)
+            pending.append((work, gathered, keys, parts))
+
+        def wait():
+            for work, *_ in pending:
+                work.wait()
+
+            reduced = None
+            for rank in range(group_size):
+                received = {}
+                for _, gathered, keys, parts in pending:
+                    synced = _unflatten_dense_tensors(gathered[rank], parts)
+                    received.update(zip(keys, synced))
+                contribution = self.compression.decompress(received)
+                if reduced is None:
+                    reduced = contribution
+                    continue
+                for key, value in contribution.items():
+                    if reduction == AggregationOp.MAX:
+                        reduced[key] = torch.maximum(reduced[key], value)
+                    else:
+                        reduced[key] = reduced[key] + value
+
+            for name, tensor in tensors.items():
+                value = reduced[name]
+                if reduction == AggregationOp.MEAN:
+                    if value.is_floating_point():
+                        value = value / self.world_size
+                    else:
+                        value = value // self.world_size
+                tensor.copy_(value)
+
+        return wait
+
+    def _launch_hierarchical_compressed(
+        self, tensors: Dict[str, torch.Tensor], reduction: AggregationOp
+    ) -> Callable[[], None]:
+        """
+        Start a two-level aggregation that compresses only between hosts.
+
+        Each host reduces its ranks' tensors to its leader uncompressed, the
+        leaders run the compressed aggregation among themselves, and every
+        leader broadcasts the result within its host. The intra-host reduce
+        and the leaders' exchange complete before returning; only the final
+        intra-host broadcast is left in flight.
+
+        Args:
+            tensors: Tensors to update in place by name (same order on every rank)
+            reduction: SUM, MEAN, or MAX reduction operation
+
+        Returns:
+            Function that waits for the broadcast (results are written in place)
+        """
+        op = dist.ReduceOp.MAX if reduction == AggregationOp.MAX else dist.ReduceOp.SUM
+        ordered = list(tensors.values())
+        _launch_coalesced(
+            ordered,
+            lambda tensor: dist.reduce(
+                tensor,
+                dst=self.host_leader,
+                op=op,
+                group=self.host_group,
+                async_op=True,
+            ),
+            self.bucket_size_bytes,
+        )()
+        if self.rank == self.host_leader:
+            self._launch_compressed(tensors, reduction, group=self.leader_group)()
+        return _launch_coalesced(
+            ordered,
+            lambda tensor: dist.broadcast(
+                tensor, src=self.host_leader, group=self.host_group, async_op=True
+            ),
+            self.bucket_size_bytes,
+        )
+
     def broadcast(
         self,
         msg: BaseCommunicator.MsgT,
         src: int = 0,
-        # TODO: Consider adding control arguments like utils.scale_params:
-        # requires_grad: Optional[bool] = None,
-        # include_buffers: bool = True,
-        # filter_fn: Optional[Callable[[str, torch.Tensor], bool]] = None
+        tensor_filter: Optional[TensorFilter] = None,
     ) -> BaseCommunicator.MsgT:
         """
         Broadcast message from source rank to all other ranks.
 
         Uses PyTorch's distributed broadcast collective for efficient
-        one-to-many communication within the process group.
+        one-to-many communication within the process group. Tensors are
+        coalesced into buckets so each bucket needs a single collective.
 
         Args:
             msg: Model, tensor dict, or tensor to broadcast
             src: Source rank ID (default: 0)
+            tensor_filter: Tensors to send (default: TensorFilter())
 
         Returns:
             Message with broadcasted values
         """
+        return self.broadcast_async(msg, src, tensor_filter).wait()
+
+    def broadcast_async(
+        self,
+        msg: BaseCommunicator.MsgT,
+        src: int = 0,
+        tensor_filter: Optional[TensorFilter] = None,
+    ) -> AsyncWork:
+        """
+        Start a bucketed broadcast with async_op collectives.
+
+        Args:
+            msg: Model, tensor dict, or tensor to broadcast
+            src: Source rank ID (default: 0)
+            tensor_filter: Tensors to send (default: TensorFilter())
+
+        Returns:
+            Handle whose wait() completes the broadcast in place and returns msg
+        """
         print(f"{get_msg_info(msg)} | src={src}")
 
-        if isinstance(msg, nn.Module):
-            # Broadcast all trainable parameters
-            for _, p in msg.named_parameters():
-                # Only broadcast trainable parameters (frozen params stay local)
-                if p.requires_grad:
-                    dist.broadcast(p.data, src=src)
-            # Broadcast all buffers (batch norm stats, etc.) - only floating-point buffers
-            for name, buffer in msg.named_buffers():
-                if buffer is None:  # type: ignore
-                    warnings.warn(f"Buffer '{name}' is None, skipping broadcast")
-                    continue
-                if not buffer.dtype.is_floating_point:
-                    continue  # Skip integer buffers like num_batches_tracked
-                dist.broadcast(buffer.data, src=src)
-        elif isinstance(msg, dict):
-            # Broadcast each tensor in dictionary
-            for tensor in msg.values():
-                dist.broadcast(tensor, src=src)
-        else:
-            # Broadcast single tensor
-            dist.broadcast(msg, src=src)
-        return msg
+        wait_buckets = _launch_coalesced(
+            list(self._collect_tensors(msg, "broadcast", tensor_filter).values()),
+            lambda tensor: dist.broadcast(tensor, src=src, async_op=True),
+            self.bucket_size_bytes,
+        )
+
+        def wait():
+            wait_buckets()
+            return msg
+
+        return AsyncWork(wait)
 
     def aggregate(
         self,
         msg: BaseCommunicator.MsgT,
         reduction: AggregationOp,
-        # TODO: Consider adding control arguments like utils.scale_params:
-        # requires_grad: Optional[bool] = None,
-        # include_buffers: bool = True,
-        # filter_fn: Optional[Callable[[str, torch.Tensor], bool]] = None
+        tensor_filter: Optional[TensorFilter] = None,
     ) -> BaseCommunicator.MsgT:
         """
         Aggregate message across all ranks using PyTorch all-reduce collective.
 
-        Performs efficient element-wise reduction across all process ranks.
+        Performs efficient element-wise reduction across all process ranks,
+        with one all-reduce per bucket of coalesced tensors.
 
         Args:
             msg: Model, tensor dict, or tensor to aggregate
             reduction: SUM, MEAN, or MAX reduction operation
+            tensor_filter: Tensors to reduce (default: TensorFilter())
 
         Returns:
             Message with aggregated values distributed to all ranks
         """
+        return self.aggregate_async(msg, reduction, tensor_filter).wait()
+
+    def aggregate_async(
+        self,
+        msg: BaseCommunicator.MsgT,
+        reduction: AggregationOp,
+        tensor_filter: Optional[TensorFilter] = None,
+    ) -> AsyncWork:
+        """
+        Start a bucketed all-reduce with async_op collectives.
+
+        Later buckets are packed while earlier ones are already reducing;
+        the caller can keep computing until it needs the result.
 
+        Args:
+            msg: Model, tensor dict, or tensor to aggregate
+            reduction: SUM, MEAN, or MAX reduction operation
+            tensor_filter: Tensors to reduce (default: TensorFilter())
+
+        Returns:
+            Handle whose wait() completes the reduction in place and returns msg
+        """
         print(f"{get_msg_info(msg)} | reduction={reduction}")
 
         # Map reduction type to PyTorch operation
@@ -216,29 +547,50 @@ class TorchDistCommunicator(BaseCommunicator):
             raise ValueError(f"Unsupported reduction type: {reduction}")
 
         op = reduction_ops[reduction]
+        tensors = self._collect_tensors(msg, "aggregation", tensor_filter)
 
-        if isinstance(msg, nn.Module):
-            # Aggregate all trainable parameters
-            for _, p in msg.named_parameters():
-                if p.requires_grad:
-                    dist.all_reduce(p.data, op=op)
-            # Aggregate all buffers (batch norm stats, etc.) - only floating-point buffers
-            for name, buffer in msg.named_buffers():
-                if buffer is None:  # type: ignore
-                    warnings.warn(f"Buffer '{name}' is None, skipping aggregation")
-                    continue
-                if not buffer.dtype.is_floating_point:
-                    continue  # Skip integer buffers like num_batches_tracked
-                dist.all_reduce(buffer.data, op=op)
-        elif isinstance(msg, dict):
-            # Aggregate each tensor in dictionary
-            for tensor in msg.values():
-                dist.all_reduce(tensor, op=op)
-        else:
-            # Aggregate single tensor
-            dist.all_reduce(msg, op=op)
+        hierarchical = self.host_group is not None
+        if self.compression is not None:
+            if hierarchical:
+                wait_compressed = self._launch_hierarchical_compressed(
+                    tensors, reduction
+                )
+            else:
+                wait_compressed = self._launch_compressed(tensors, reduction)
+
+            def wait():
+                wait_compressed()
+                return msg
+
+            return AsyncWork(wait)
+
+        # Gloo and the two-level reduce lack AVG: MEAN is a SUM scaled afterwards
+        scale_mean = reduction == AggregationOp.MEAN and (
+            hierarchical or self.backend == "gloo"
+        )
+        if scale_mean:
+            op = dist.ReduceOp.SUM
+
+        def collective(tensor: torch.Tensor) -> dist.Work:
+            if hierarchical:
+                return self._hierarchical_all_reduce(tensor, op)
+            return dist.all_reduce(tensor, op=op, async_op=True)
+
+        wait_buckets = _launch_coalesced(
+            list(tensors.values()), collective, self.bucket_size_bytes
+        )
 
-        return msg
+        def wait():
+            wait_buckets()
+            if scale_mean:
+                for tensor in tensors.values():
+                    if tensor.is_floating_point():
+                        tensor.div_(self.world_size)
+                    else:
+                        tensor.floor_divide_(self.world_size)
+            return msg
+
+        return AsyncWork(wait)
 
     def close(self):
         """
@@ -12,17 +12,97 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Dict, Union
+import warnings
+from enum import Enum
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
-import numpy as np
 import torch
 import torch.nn as nn
 
 from . import grpc_pb2
 
 
+class SerializationMode(str, Enum):
+    """Wire formats for tensor dictionaries sent over gRPC."""
+
+    ENTRIES = "entries"  # One bytes field per tensor
+    FLAT = "flat"  # Single contiguous buffer with a compact offset table
+
+
+# Byte alignment of each tensor inside a flat buffer (allows zero-copy dtype views)
+FLAT_ALIGNMENT = 8
+
+# Dtype tags carried on the wire: string -> torch dtype.
+# Tensors travel as raw storage bytes, so any dtype torch can view bytes as works.
+WIRE_DTYPES = {
+    "torch.float32": torch.float32,
+    "torch.float64": torch.float64,
+    "torch.float16": torch.float16,
+    "torch.bfloat16": torch.bfloat16,
+    "torch.int64": torch.int64,
+    "torch.int32": torch.int32,
+    "torch.int8": torch.int8,
+    "torch.uint8": torch.uint8,
+    "torch.bool": torch.bool,
+}
+
+
+def _wire_dtype(dtype_tag: str) -> torch.dtype:
+    """
+    Resolve a dtype tag from the wire.
+
+    Args:
+        dtype_tag: Dtype string (e.g., "torch.bfloat16")
+
+    Returns:
+        Corresponding torch dtype
+
+    Raises:
+        ValueError: If the dtype is not supported
+    """
+    if dtype_tag not in WIRE_DTYPES:
+        supported_dtypes = list(WIRE_DTYPES.keys())
+        raise ValueError(
+            f"Unsupported dtype: {dtype_tag}. Supported: {supported_dtypes}"
+        )
+    return WIRE_DTYPES[dtype_tag]
+
+
+def _host_uint8(tensor: torch.Tensor) -> torch.Tensor:
+    """View a tensor's raw bytes on the host (copies only non-contiguous or device tensors)."""
+    flat = tensor.detach().cpu().contiguous().reshape(-1)
+    return flat.view(torch.uint8)  # No NumPy dtype round trip, so bfloat16 works
+
+
+def _tensor_to_bytes(tensor: torch.Tensor) -> bytes:
+    """Serialize a tensor's raw storage bytes."""
+    return _host_uint8(tensor).numpy().tobytes()
+
+
+def cast_floating(
+    tensordict: Dict[str, torch.Tensor], dtype: Optional[torch.dtype]
+) -> Dict[str, torch.Tensor]:
+    """
+    Cast floating-point tensors to a transmission dtype (others pass through).
+
+    Args:
+        tensordict: Dictionary mapping parameter names to tensor values
+        dtype: Target floating-point dtype, or None to leave tensors unchanged
+
+    Returns:
+        Dictionary with floating-point tensors cast to dtype
+    """
+    if dtype is None:
+        return tensordict
+    return {
+        key: tensor.to(dtype) if tensor.dtype.is_floating_point else tensor
+        for key, tensor in tensordict.items()
+    }
+
+
 def tensordict_to_proto(
     tensordict: Dict[str, torch.Tensor],
+    serialization: SerializationMode = SerializationMode.ENTRIES,
 ) -> grpc_pb2.TensorDict:
     """
     Convert tensor dictionary to protobuf format for gRPC transmission.
@@ -32,27 +112,30 @@ def tensordict_to_proto(
 
     Args:
         tensordict: Dictionary mapping parameter names to tensor values
+        serialization: ENTRIES (one bytes field per tensor) or FLAT (single packed buffer)
 
     Returns:
         TensorDict protobuf message ready for gRPC transmission
     """
+    if serialization == SerializationMode.FLAT:
+        return _tensordict_to_flat_proto(tensordict)
+
     entries = []
 
     for key, tensor in tensordict.items():
         # Store original device before CPU conversion
         original_device = str(tensor.device)
 
-        # Convert to CPU for serialization (required for protobuf)
-        tensor_cpu = tensor.cpu()
+        _wire_dtype(str(tensor.dtype))
 
-        # Serialize tensor data to bytes for transmission
-        tensor_bytes = tensor_cpu.numpy().tobytes()
+        # Serialize raw tensor bytes for transmission (CPU copy if needed)
+        tensor_bytes = _tensor_to_bytes(tensor)
 
         entry = grpc_pb2.TensorEntry(
             key=key,
             data=tensor_bytes,
-            shape=list(tensor_cpu.shape),
-            dtype=str(tensor_cpu.dtype),
+            shape=list(tensor.shape),
+            dtype=str(tensor.dtype),
             device=original_device,
             data_size=len(tensor_bytes),
         )
@@ -61,6 +144,317 @@ def tensordict_to_proto(
     return grpc_pb2.TensorDict(entries=entries)
 
 
+def _flat_layout(
+    tensordict: Dict[str, torch.Tensor],
+) -> Tuple[List[grpc_pb2.TensorEntry], int]:
+    """
+    Compute the flat buffer layout (metadata entries with aligned offsets).
+
+    Offsets are aligned so receivers can view each tensor without copying.
+
+    Args:
+        tensordict: Dictionary mapping parameter names to tensor values
+
+    Returns:
+        Tuple of (metadata entries in dictionary order, total buffer size in bytes)
+
+    Raises:
+        ValueError: If a tensor has an unsupported dtype
+    """
+    entries = []
+    total_bytes = 0
+    for key, tensor in tensordict.items():
+        if str(tensor.dtype) not in WIRE_DTYPES:
+            raise ValueError(
+                f"Unsupported dtype for tensor {key}: {tensor.dtype}. Supported: {list(WIRE_DTYPES.keys())}"
+            )
+        offset = -(-total_bytes // FLAT_ALIGNMENT) * FLAT_ALIGNMENT
+        nbytes = tensor.numel() * tensor.element_size()
+
+        entry = grpc_pb2.TensorEntry(
+            key=key,
+            shape=list(tensor.shape),
+            dtype=str(tensor.dtype),
+            device=str(tensor.device),
+            data_size=nbytes,
+            offset=offset,
+        )
+        entries.append(entry)
+        total_bytes = offset + nbytes
+
+    return entries, total_bytes
+
+
+def _pack_flat(
+    tensordict: Dict[str, torch.Tensor],
+    entries: List[grpc_pb2.TensorEntry],
+    flat_buffer: torch.Tensor,
+):
+    """
+    Copy tensors into a uint8 buffer following a flat layout.
+
+    Args:
+        tensordict: Dictionary mapping parameter names to tensor values
+        entries: Layout from _flat_layout (same order as tensordict)
+        flat_buffer: Destination uint8 tensor of at least the layout's total size
+    """
+    for entry, tensor in zip(entries, tensordict.values()):
+        # Copy straight from the source device into the packed buffer
+        flat_buffer[entry.offset : entry.offset + entry.data_size].view(
+            tensor.dtype
+        ).view(tensor.shape).copy_(tensor.detach())
+
+
+def _tensordict_to_flat_proto(
+    tensordict: Dict[str, torch.Tensor],
+) -> grpc_pb2.TensorDict:
+    """
+    Pack a tensor dictionary into one contiguous buffer with an offset table.
+
+    The bytes protobuf requires are joined straight from each tensor's host
+    memory and zero alignment padding, so CPU tensors are copied exactly once
+    (other devices add the transfer to host); entries carry only metadata
+    (name, dtype, shape, offset).
+
+    Args:
+        tensordict: Dictionary mapping parameter names to tensor values
+
+    Returns:
+        TensorDict protobuf message with metadata entries and packed flat_data
+    """
+    entries, _ = _flat_layout(tensordict)
+    pieces = []
+    position = 0
+    for entry, tensor in zip(entries, tensordict.values()):
+        if entry.offset > position:
+            pieces.append(bytes(entry.offset - position))
+        pieces.append(_host_uint8(tensor).numpy())
+        position = entry.offset + entry.data_size
+
+    return grpc_pb2.TensorDict(entries=entries, flat_data=b"".join(pieces))
+
+
+def _flat_buffer_to_tensordict(
+    entries: Iterable[grpc_pb2.TensorEntry],
+    flat_buffer: torch.Tensor,
+) -> Dict[str, torch.Tensor]:
+    """
+    Rebuild tensors as views into a packed uint8 buffer.
+
+    CPU tensors share memory with the buffer (no copies); tensors from
+    other devices are transferred once to their original device.
+
+    Args:
+        entries: Metadata entries describing the buffer layout
+        flat_buffer: Packed uint8 tensor holding all tensor data
+
+    Returns:
+        Dictionary mapping parameter names to reconstructed tensors
+
+    Raises:
+        ValueError: If an entry exceeds the buffer or has an unsupported dtype
+    """
+    tensordict = {}
+    for entry in entries:
+        if entry.offset + entry.data_size > flat_buffer.numel():
+            raise ValueError(
+                f"Data size mismatch for tensor {entry.key}: offset {entry.offset} + {entry.data_size} exceeds buffer of {flat_buffer.numel()}"
+            )
+
+        tensor = (
+            flat_buffer[entry.offset : entry.offset + entry.data_size]
+            .view(_wire_dtype(entry.dtype))
+            .view(tuple(entry.shape))
+        )
+
+        # No-op for CPU tensors, single transfer otherwise
+        tensordict[entry.key] = tensor.to(entry.device)
+
+    return tensordict
+
+
+def _bytes_to_uint8(data: bytes) -> torch.Tensor:
+    """
+    View a received bytes payload as a uint8 tensor without copying.
+
+    The view shares the immutable bytes object, so it must only be read;
+    clone it before handing out tensors that callers may modify.
+    """
+    if not data:
+        return torch.empty(0, dtype=torch.uint8)  # frombuffer rejects empty buffers
+    with warnings.catch_warnings():
+        # Non-writable buffer: every caller only reads or clones the view
+        warnings.simplefilter("ignore", UserWarning)
+        return torch.frombuffer(data, dtype=torch.uint8)
+
+
+def tensordict_to_chunks(
+    tensordict: Dict[str, torch.Tensor],
+    chunk_size: int,
+    **header: Any,
+) -> Iterator[grpc_pb2.TensorChunk]:
+    """
+    Lazily split a tensor dictionary into fixed-size chunks of its flat buffer.
+
+    Only one chunk is materialized at a time, so peak memory is bounded by
+    chunk_size (plus the host copy of the tensor currently being sliced).
+    The first chunk carries the layout and any header fields.
+
+    Args:
+        tensordict: Dictionary mapping parameter names to tensor values
+        chunk_size: Maximum chunk payload in bytes (rounded down to the alignment)
+        **header: Extra TensorChunk fields for the first chunk (client_id, is_ready, ...)
+
+    Yields:
+        TensorChunk messages covering the flat buffer in order
+    """
+    entries, total_bytes = _flat_layout(tensordict)
+    chunk_size = max(FLAT_ALIGNMENT, chunk_size // FLAT_ALIGNMENT * FLAT_ALIGNMENT)
+    tensors = list(tensordict.values())
+
+    index = 0
+    source = None  # Host byte view of tensors[index]
+    chunk_start = 0
+    while True:
+        chunk_end = min(chunk_start + chunk_size, total_bytes)
+        chunk = torch.zeros(chunk_end - chunk_start, dtype=torch.uint8)
+
+        # Copy every tensor region overlapping [chunk_start, chunk_end)
+        while index < len(entries) and entries[index].offset < chunk_end:
+            entry = entries[index]
+            entry_end = entry.offset + entry.data_size
+            if source is None:
+                source = tensors[index].detach().cpu().contiguous().reshape(-1)
+                source = source.view(torch.uint8)
+            lo = max(entry.offset, chunk_start)
+            hi = min(entry_end, chunk_end)
+            if hi > lo:
+                chunk[lo - chunk_start : hi - chunk_start] = source[
+                    lo - entry.offset : hi - entry.offset
+                ]
+            if entry_end > chunk_end:
+                break  # Tensor continues in the next chunk
+            index += 1
+            source = None
+
+        if chunk_start == 0:
+            yield grpc_pb2.TensorChunk(
+                entries=entries,
+                total_size=total_bytes,
+                offset=chunk_start,
+                data=chunk.numpy().tobytes(),
+                **header,
+            )
+        else:
+            yield grpc_pb2.TensorChunk(offset=chunk_start, data=chunk.numpy().tobytes())
+
+        chunk_start = chunk_end
+        if chunk_start >= total_bytes:
+            return
+
+
+class ChunkAssembler:
+    """
+    Incrementally reassemble a chunked tensor stream.
+
+    Chunks are copied into a single preallocated buffer as they arrive;
+    the resulting tensors are views into that buffer.
+    """
+
+    def __init__(self):
+        """Initialize an empty assembler (the first chunk carries the layout)."""
+        self.header: Optional[grpc_pb2.TensorChunk] = None
+        self._flat_buffer: Optional[torch.Tensor] = None
+
+    def add(self, chunk: grpc_pb2.TensorChunk):
+        """
+        Copy one chunk into the buffer.
+
+        Args:
+            chunk: Next TensorChunk of the stream
+
+        Raises:
+            ValueError: If the chunk falls outside the announced buffer size
+        """
+        if self.header is None:
+            self.header = chunk
+            self._flat_buffer = torch.empty(chunk.total_size, dtype=torch.uint8)
+        if not chunk.data:
+            return
+        end = chunk.offset + len(chunk.data)
+        if end > self._flat_buffer.numel():
+            raise ValueError(
+                f"Chunk at offset {chunk.offset} ({len(chunk.data)} bytes) exceeds buffer of {self._flat_buffer.numel()}"
+            )
+        self._flat_buffer[chunk.offset : end] = _bytes_to_uint8(chunk.data)
+
+    def tensordict(self) -> Dict[str, torch.Tensor]:
+        """
+        Build the tensors announced by the header.
+
+        Returns:
+            Dictionary mapping parameter names to tensors (empty if no chunks arrived)
+        """
+        if self.header is None:
+            return {}
+        return _flat_buffer_to_tensordict(self.header.entries, self._flat_buffer)
+
+
+def chunks_to_tensordict(
+    chunks: Iterable[grpc_pb2.TensorChunk],
+) -> Tuple[Optional[grpc_pb2.TensorChunk], Dict[str, torch.Tensor]]:
+    """
+    Reassemble a chunked stream into a tensor dictionary.
+
+    Args:
+        chunks: TensorChunk stream (first chunk carries the layout)
+
+    Returns:
+        Tuple of (first chunk with header fields or None if the stream was empty,
+        dictionary mapping parameter names to tensors)
+
+    Raises:
+        ValueError: If a chunk falls outside the announced buffer size
+    """
+    assembler = ChunkAssembler()
+    for chunk in chunks:
+        assembler.add(chunk)
+    return assembler.header, assembler.tensordict()
+
+
+def chunk_tensor_slices(
+    entries: Iterable[grpc_pb2.TensorEntry],
+    chunk: grpc_pb2.TensorChunk,
+) -> Iterator[Tuple[grpc_pb2.TensorEntry, int, torch.Tensor]]:
+    """
+    Split a chunk into per-tensor element slices for incremental folding.
+
+    Args:
+        entries: Layout entries from the first chunk of the stream
+        chunk: TensorChunk to split
+
+    Yields:
+        Tuples of (entry, first element index, 1-D tensor view of the slice)
+
+    Raises:
+        ValueError: If an entry has an unsupported dtype
+    """
+    if not chunk.data:
+        return
+    data = _bytes_to_uint8(chunk.data)
+    chunk_end = chunk.offset + len(chunk.data)
+
+    for entry in entries:
+        lo = max(entry.offset, chunk.offset)
+        hi = min(entry.offset + entry.data_size, chunk_end)
+        if hi <= lo:
+            continue
+        dtype = _wire_dtype(entry.dtype)
+        itemsize = torch.empty((), dtype=dtype).element_size()
+        values = data[lo - chunk.offset : hi - chunk.offset].view(dtype)
+        yield entry, (lo - entry.offset) // itemsize, values
+
+
 def proto_to_tensordict(
     proto_tensordict: grpc_pb2.TensorDict,
 ) -> Dict[str, torch.Tensor]:
@@ -69,6 +463,9 @@ def proto_to_tensordict(
 
     Deserializes byte data back to PyTorch tensors with original shapes,
     data types, and device placement preserved.
+    Flat payloads are detected automatically and decoded with a single copy
+    into one writable buffer that all tensors view; shared-memory payloads are
+    copied out of their segment.
 
     Args:
         proto_tensordict: TensorDict protobuf message from gRPC
@@ -79,6 +476,16 @@ def proto_to_tensordict(
     Raises:
         ValueError: If data size mismatch or unsupported dtype
     """
+    if proto_tensordict.shm_name:
+        from .shm import read_tensordict  # shm builds on this module
+
+        return read_tensordict(proto_tensordict)
+
+    if proto_tensordict.flat_data:
+        # Cloned: protobuf bytes are read-only and tensors may be modified in place
+        flat_buffer = _bytes_to_uint8(proto_tensordict.flat_data).clone()
+        return _flat_buffer_to_tensordict(proto_tensordict.entries, flat_buffer)
+
     tensordict = {}
     for entry in proto_tensordict.entries:
         # Validate data size
@@ -87,30 +494,11 @@ def proto_to_tensordict(
                 f"Data size mismatch for tensor {entry.key}: expected {entry.data_size}, got {len(entry.data)}"
             )
 
-        # Dtype mapping: string -> numpy_dtype
-        dtype_mapping = {
-            "torch.float32": np.float32,
-            "torch.float64": np.float64,
-            "torch.int32": np.int32,
-            "torch.int64": np.int64,
-            "torch.bool": np.bool_,
-        }
-
-        if entry.dtype not in dtype_mapping:
-            supported_dtypes = list(dtype_mapping.keys())
-            raise ValueError(
-                f"Unsupported dtype: {entry.dtype}. Supported: {supported_dtypes}"
-            )
-
-        numpy_dtype = dtype_mapping[entry.dtype]
-
-        # Reconstruct tensor from serialized bytes
-        numpy_array = np.frombuffer(entry.data, dtype=numpy_dtype)
-        numpy_array = numpy_array.reshape(tuple(entry.shape))
+        dtype = _wire_dtype(entry.dtype)
 
-        # Create tensor and restore to original device
-        # Note: .copy() needed because np.frombuffer creates read-only arrays
-        tensor = torch.from_numpy(numpy_array.copy()).to(entry.device)
+        # Reconstruct tensor from raw bytes (cloned: protobuf bytes are read-only)
+        tensor = _bytes_to_uint8(entry.data).clone().view(dtype)
+        tensor = tensor.view(tuple(entry.shape)).to(entry.device)
 
         tensordict[entry.key] = tensor
 
@@ -14,3 +14,4 @@
 
 from ._configs import *
 from .datamodule import DataModule
+from .prefetch import BatchPrefetcher
@@ -30,3 +30,4 @@ class DataModuleConfig:
 
     train: Optional[Any] = None  # DataLoader config for training data
     eval: Optional[Any] = None  # DataLoader config for evaluation data
+    prefetch: int = 0  # Batches loaded ahead on a background thread (0: off)
@@ -12,12 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Optional
+from typing import Any, Callable, Iterator, Optional
 
 import rich.repr
+import torch
 from torch.utils.data import DataLoader
 from typeguard import typechecked
 from ..utils import print
+from .prefetch import BatchPrefetcher
 
 
 @rich.repr.auto
@@ -29,7 +31,8 @@ class DataModule:
     Provides consistent interface for algorithm access to local data.
 
     Typically created by Hydra configuration and passed to Node constructors.
-    Algorithms access data via node.datamodule.train and node.datamodule.eval.
+    Algorithms access data via node.datamodule.train and node.datamodule.eval,
+    or iterate device-ready batches with iter_batches().
 
     See conf/datamodule/ for configuration examples.
     """
@@ -39,6 +42,7 @@ class DataModule:
         self,
         train: Optional[DataLoader[Any]] = None,
         eval: Optional[DataLoader[Any]] = None,
+        prefetch: int = 0,
     ):
         """
         Initialize data module with PyTorch DataLoaders.
@@ -46,8 +50,67 @@ class DataModule:
         Args:
             train: DataLoader for training data (local to this node)
             eval: DataLoader for evaluation data (local to this node)
+            prefetch: Batches loaded and transferred ahead on a background
+                thread (0 loads each batch when it is requested)
+
+        Raises:
+            ValueError: If prefetch is negative
         """
-        print(f"train={train}, eval={eval}")
+        print(f"train={train}, eval={eval}, prefetch={prefetch}")
+        if prefetch < 0:
+            raise ValueError(f"prefetch must be non-negative, got {prefetch}")
 
         self.train: Optional[DataLoader[Any]] = train
         self.eval: Optional[DataLoader[Any]] = eval
+        self.prefetch: int = prefetch
+
+    def iter_batches(
+        self,
+        loader: Optional[DataLoader[Any]],
+        device: torch.device,
+        transfer: Callable[[Any], Any],
+    ) -> Iterator[Any]:
+        """
+        Iterate over a DataLoader's batches, already moved to the device.
+
+        With prefetch > 0, the first batch is loaded on the calling thread
+        (so samplers draw their seeds from the global RNG deterministically)
+        and the rest by a BatchPrefetcher. Without DataLoader workers, batches
+        are still loaded on the calling thread, one ahead, so random dataset
+        transforms stay reproducible; only pinning and transfer run in the
+        background. Nothing is loaded before the first batch is requested;
+        close() the iterator to stop prefetching early.
+
+        Args:
+            loader: DataLoader to iterate (None yields nothing)
+            device: Device the batches are moved to
+            transfer: Moves one batch to the device
+
+        Yields:
+            Device-ready batches
+        """
+        if loader is None:
+            return
+        batches = iter(loader)
+        if self.prefetch == 0:
+            for batch in batches:
+                yield transfer(batch)
+            return
+
+        try:
+            first = transfer(next(batches))
+        except StopIteration:
+            return
+        # Worker processes seed their own RNG; in-process loading shares ours
+        prefetcher = BatchPrefetcher(
+            batches,
+            transfer,
+            device,
+            self.prefetch,
+            load_in_thread=loader.num_workers > 0,
+        )
+        try:
+            yield first
+            yield from prefetcher
+        finally:
+            prefetcher.close()
@@ -0,0 +1,221 @@
+# Copyright (c) 2025, Oak Ridge National Laboratory.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import queue
+import threading
+from contextlib import nullcontext
+from typing import Any, Callable, Iterator
+
+import rich.repr
+import torch
+
+# Queue item marking the end of the underlying iterator
+_END = object()
+
+
+def map_tensors(batch: Any, fn: Callable[[torch.Tensor], torch.Tensor]) -> Any:
+    """
+    Apply a function to every tensor in a (nested) batch.
+
+    Handles tensors, tuples, lists and dicts; other values are kept as-is.
+
+    Args:
+        batch: Batch structure
+        fn: Function applied to each tensor
+
+    Returns:
+        Batch of the same structure with transformed tensors
+    """
+    if isinstance(batch, torch.Tensor):
+        return fn(batch)
+    if isinstance(batch, (tuple, list)):
+        mapped = [map_tensors(item, fn) for item in batch]
+        return tuple(mapped) if isinstance(batch, tuple) else mapped
+    if isinstance(batch, dict):
+        return {key: map_tensors(value, fn) for key, value in batch.items()}
+    return batch
+
+
+def _pin(tensor: torch.Tensor) -> torch.Tensor:
+    """Page-lock a CPU tensor so host-to-device copies can run asynchronously."""
+    if tensor.device.type == "cpu" and not tensor.is_pinned():
+        return tensor.pin_memory()
+    return tensor
+
+
+def _record_stream(batch: Any, stream: torch.cuda.Stream):
+    """Mark the batch's CUDA tensors as used by stream (for the caching allocator)."""
+
+    def record(tensor: torch.Tensor) -> torch.Tensor:
+        if tensor.is_cuda:
+            tensor.record_stream(stream)
+        return tensor
+
+    map_tensors(batch, record)
+
+
+@rich.repr.auto
+class BatchPrefetcher:
+    """
+    Load and transfer batches on a background thread ahead of their use.
+
+    A loader thread pulls batches from the iterator, pins them and moves
+    them to the device (on a side CUDA stream for GPU targets) into a
+    bounded queue, so batch k+1 is prepared while batch k computes. The
+    consumer's stream waits on each batch's copy before using it.
+
+    Threads share torch's global RNG, so dataset code run on the loader
+    thread would draw random numbers interleaved with the training thread
+    (e.g. dropout) in a timing-dependent order. Unless load_in_thread is
+    set (safe when DataLoader workers, which seed their own RNG, do the
+    loading), the consumer fetches each host batch one step ahead on its
+    own thread and only pinning and transfer run in the background.
+
+    Used by: DataModule.iter_batches() when prefetch > 0
+    """
+
+    def __init__(
+        self,
+        batches: Iterator[Any],
+        transfer: Callable[[Any], Any],
+        device: torch.device,
+        depth: int = 2,
+        load_in_thread: bool = False,
+    ):
+        """
+        Start the loader thread.
+
+        Args:
+            batches: Iterator of host batches (e.g. iter(DataLoader))
+            transfer: Moves one batch to the device
+            device: Target device of the transfer
+            depth: Maximum number of prepared batches held in the queue
+            load_in_thread: Also pull batches from the iterator on the loader
+                thread (only reproducible if that does not use the global RNG)
+        """
+        self.device = torch.device(device)
+        self.depth = depth
+        self.load_in_thread = load_in_thread
+        self._batches = batches
+        self._transfer = transfer
+        self._cuda = self.device.type == "cuda"
+        self._queue: queue.Queue = queue.Queue(maxsize=depth)
+        self._host: queue.Queue = queue.Queue()  # Host batches fetched by the consumer
+        self._exhausted = False  # Consumer reached the end of the iterator
+        self._closed = threading.Event()
+        self._thread = threading.Thread(
+            target=self._load, name="batch-prefetch", daemon=True
+        )
+        self._thread.start()
+        if not load_in_thread:
+            self._fetch()  # One batch ahead, so its transfer overlaps compute
+
+    def _fetch(self):
+        """Consumer thread: pull the next host batch and hand it to the loader."""
+        if self._exhausted:
+            return
+        try:
+            self._host.put(next(self._batches))
+        except StopIteration:
+            self._exhausted = True
+            self._host.put(_END)
+        except Exception as e:
+            self._exhausted = True
+            self._host.put(e)  # Raised in order, after earlier batches
+
+    def _host_batches(self) -> Iterator[Any]:
+        """Loader thread: yield host batches fetched by the consumer until the end."""
+        while not self._closed.is_set():
+            try:
+                item = self._host.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if item is _END:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+    def _put(self, item: Any) -> bool:
+        """
+        Queue an item, giving up once the prefetcher is closed.
+
+        Returns:
+            True if the item was queued
+        """
+        while not self._closed.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _load(self):
+        """Loader thread: fetch, pin and transfer batches until exhausted or closed."""
+        stream = torch.cuda.Stream(device=self.device) if self._cuda else None
+        batches = self._batches if self.load_in_thread else self._host_batches()
+        try:
+            with torch.cuda.stream(stream) if stream is not None else nullcontext():
+                for batch in batches:
+                    if self._closed.is_set():
+                        return
+                    event = None
+                    if stream is not None:
+                        batch = self._transfer(map_tensors(batch, _pin))
+                        event = stream.record_event()
+                    else:
+                        batch = self._transfer(batch)
+                    if not self._put((batch, event)):
+                        return
+            self._put(_END)
+        except Exception as e:
+            self._put(e)  # Re-raised by the consumer
+
+    def __iter__(self) -> "BatchPrefetcher":
+        return self
+
+    def __next__(self) -> Any:
+        """
+        Return the next device-ready batch.
+
+        Raises:
+            StopIteration: When the underlying iterator is exhausted
+            Exception: Any error raised while loading or transferring a batch
+        """
+        if not self.load_in_thread:
+            self._fetch()
+        item = self._queue.get()
+        if item is _END:
+            self._queue.put(_END)  # Keep reporting exhaustion
+            raise StopIteration
+        if isinstance(item, Exception):
+            raise item
+        batch, event = item
+        if event is not None:
+            current = torch.cuda.current_stream(self.device)
+            current.wait_event(event)
+            # Memory allocated on the side stream is now also used by this one
+            _record_stream(batch, current)
+        return batch
+
+    def close(self):
+        """Stop the loader thread and drop prefetched batches."""
+        self._closed.set()
+        while self._thread.is_alive():
+            try:
+                self._queue.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        self._thread.join()
@@ -0,0 +1,252 @@
+# Copyright (c) 2025, Oak Ridge National Laboratory.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+import torch
+import torch.nn as nn
+import torch.nn.functional as F
+
+from src.omnifed.algorithm import Ditto
+from src.omnifed.algorithm.base import BaseAlgorithm
+from src.omnifed.algorithm.utils import (
+    OptimizerPolicy,
+    Precision,
+    optimizes_model,
+    zero_optimizer_state,
+)
+
+
+class _Regression(BaseAlgorithm):
+    """Minimal algorithm: Adam on a mean squared error loss."""
+
+    def _configure_local_optimizer(self, local_lr):
+        return torch.optim.Adam(self.local_model.parameters(), lr=local_lr)
+
+    def _compute_loss(self, batch):
+        x, y = batch
+        return F.mse_loss(self.local_model(x), y)
+
+
+def _make_algorithm(grad_accumulation_steps=1, optimizer_policy="reset"):
+    """Build just the state _train_batch and the optimizer policy use."""
+    torch.manual_seed(0)
+    algorithm = object.__new__(_Regression)
+    algorithm.local_model = nn.Sequential(nn.Linear(4, 8), nn.Tanh(), nn.Linear(8, 2))
+    algorithm.local_lr = 0.01
+    algorithm.precision = Precision.FP32
+    algorithm.grad_accumulation_steps = grad_accumulation_steps
+    algorithm.optimizer_policy = OptimizerPolicy(optimizer_policy)
+    algorithm._BaseAlgorithm__grad_scaler = None
+    algorithm._BaseAlgorithm__local_optimizer = None
+    algorithm._BaseAlgorithm__renew_local_optimizer()
+    return algorithm
+
+
+def _batch(size):
+    generator = torch.Generator().manual_seed(1)
+    return torch.randn(size, 4, generator=generator), torch.randn(
+        size, 2, generator=generator
+    )
+
+
+# =============================================================================
+# GRADIENT ACCUMULATION
+# =============================================================================
+
+
+@pytest.mark.parametrize("steps", [2, 3, 4, 10, 16])
+def test_micro_batches_match_full_batch(steps):
+    # 10 samples: uneven splits for 3 and 4, empty micro-batches for 16
+    batch = _batch(10)
+    full = _make_algorithm()
+    accumulated = _make_algorithm(grad_accumulation_steps=steps)
+
+    for _ in range(3):
+        full_metrics = full._train_batch(batch)
+        accumulated_metrics = accumulated._train_batch(batch)
+        assert accumulated_metrics["loss"] == pytest.approx(full_metrics["loss"])
+        assert accumulated_metrics["grad_norm"] == pytest.approx(
+            full_metrics["grad_norm"]
+        )
+
+    for expected, actual in zip(
+        full.local_model.parameters(), accumulated.local_model.parameters()
+    ):
+        torch.testing.assert_close(actual, expected)
+
+
+def _make_ditto(grad_accumulation_steps=1, grad_scaler=None):
+    """Ditto with a classifier, built like _make_algorithm plus Ditto's _setup."""
+    torch.manual_seed(0)
+    algorithm = object.__new__(Ditto)
+    algorithm.local_model = nn.Sequential(nn.Linear(4, 8), nn.Tanh(), nn.Linear(8, 3))
+    algorithm.local_lr = 0.1
+    algorithm.precision = Precision.FP32
+    algorithm.grad_accumulation_steps = grad_accumulation_steps
+    algorithm.optimizer_policy = OptimizerPolicy.RESET
+    algorithm._BaseAlgorithm__grad_scaler = grad_scaler
+    algorithm._BaseAlgorithm__local_optimizer = None
+    algorithm._BaseAlgorithm__renew_local_optimizer()
+    algorithm.ditto_lambda = 0.1
+    algorithm.global_model = nn.Sequential(nn.Linear(4, 8), nn.Tanh(), nn.Linear(8, 3))
+    algorithm.global_optimizer = torch.optim.SGD(
+        algorithm.global_model.parameters(), lr=0.1
+    )
+    return algorithm
+
+
+def _class_batch(size):
+    generator = torch.Generator().manual_seed(2)
+    return torch.randn(size, 4, generator=generator), torch.randint(
+        3, (size,), generator=generator
+    )
+
+
+@pytest.mark.parametrize(
+    "steps, grad_scaler",
+    [(3, None), (4, None), (1, "scaled"), (4, "scaled")],
+)
+def test_ditto_steps_global_model_once_per_batch(steps, grad_scaler):
+    batch = _class_batch(10)
+    full = _make_ditto()
+    if grad_scaler is not None:
+        # Scaling only (fp32 compute), so results must match the unscaled run
+        grad_scaler = torch.amp.GradScaler("cpu", init_scale=1024.0)
+    ditto = _make_ditto(grad_accumulation_steps=steps, grad_scaler=grad_scaler)
+
+    # Reference global update: one plain SGD step on the full batch per batch
+    expected_global = _make_ditto().global_model
+    reference_optimizer = torch.optim.SGD(expected_global.parameters(), lr=0.1)
+
+    for _ in range(3):
+        full_metrics = full._train_batch(batch)
+        metrics = ditto._train_batch(batch)
+        assert metrics["loss"] == pytest.approx(full_metrics["loss"])
+
+        reference_optimizer.zero_grad()
+        F.cross_entropy(expected_global(batch[0]), batch[1]).backward()
+        reference_optimizer.step()
+
+    for model, expected in [
+        (ditto.local_model, full.local_model),
+        (ditto.global_model, expected_global),
+        (full.global_model, expected_global),
+    ]:
+        for actual, reference in zip(model.parameters(), expected.parameters()):
+            torch.testing.assert_close(actual, reference)
+
+
+def test_ditto_eval_loss_is_personal_objective():
+    ditto = _make_ditto()
+    global_state = {k: v.clone() for k, v in ditto.global_model.state_dict().items()}
+
+    with torch.no_grad():
+        loss = ditto._compute_loss(_class_batch(6))
+
+    assert torch.isfinite(loss)
+    for name, tensor in ditto.global_model.state_dict().items():
+        assert torch.equal(tensor, global_state[name])
+    assert all(p.grad is None for p in ditto.global_model.parameters())
+
+
+def test_split_batch_keeps_structure():
+    algorithm = _make_algorithm()
+    x, y = _batch(5)
+    parts = algorithm._split_batch({"inputs": x, "pair": (y, [x]), "tag": "a"}, 2)
+
+    assert len(parts) == 2
+    assert [part["inputs"].shape[0] for part in parts] == [3, 2]
+    assert isinstance(parts[0]["pair"], tuple)
+    assert isinstance(parts[0]["pair"][1], list)
+    assert torch.equal(torch.cat([part["pair"][0] for part in parts]), y)
+    assert all(part["tag"] == "a" for part in parts)
+
+
+# =============================================================================
+# OPTIMIZER POLICY
+# =============================================================================
+
+
+def _state_tensors(optimizer):
+    return [
+        value
+        for state in optimizer.state.values()
+        for value in state.values()
+        if isinstance(value, torch.Tensor)
+    ]
+
+
+def test_zero_optimizer_state_matches_fresh_optimizer_in_place():
+    algorithm = _make_algorithm()
+    batch = _batch(8)
+    algorithm._train_batch(batch)
+    optimizer = algorithm.local_optimizer
+    pointers = [tensor.data_ptr() for tensor in _state_tensors(optimizer)]
+
+    zero_optimizer_state(optimizer)
+    assert [tensor.data_ptr() for tensor in _state_tensors(optimizer)] == pointers
+    assert all(state["step"].item() == 0 for state in optimizer.state.values())
+
+    # A step from zeroed state equals a step from a fresh optimizer
+    fresh = _make_algorithm()
+    fresh.local_model.load_state_dict(algorithm.local_model.state_dict())
+    algorithm._train_batch(batch)
+    fresh._train_batch(batch)
+    for expected, actual in zip(
+        fresh.local_model.parameters(), algorithm.local_model.parameters()
+    ):
+        torch.testing.assert_close(actual, expected)
+
+
+def test_optimizes_model():
+    model = nn.Linear(3, 1)
+    assert optimizes_model(torch.optim.SGD(model.parameters(), lr=0.1), model)
+    assert optimizes_model(torch.optim.SGD([model.weight], lr=0.1), model)
+    other = nn.Linear(3, 1)
+    assert not optimizes_model(torch.optim.SGD(other.parameters(), lr=0.1), model)
+
+
+@pytest.mark.parametrize("policy", list(OptimizerPolicy))
+def test_optimizer_policy_after_aggregation(policy):
+    algorithm = _make_algorithm(optimizer_policy=policy)
+    algorithm._train_batch(_batch(8))
+    optimizer = algorithm.local_optimizer
+    exp_avg = optimizer.state[algorithm.local_model[0].weight]["exp_avg"].clone()
+
+    algorithm._BaseAlgorithm__renew_local_optimizer()
+
+    if policy == OptimizerPolicy.RESET:
+        assert algorithm.local_optimizer is not optimizer
+        assert len(algorithm.local_optimizer.state) == 0
+        return
+    assert algorithm.local_optimizer is optimizer
+    state = optimizer.state[algorithm.local_model[0].weight]
+    if policy == OptimizerPolicy.ZERO:
+        assert not state["exp_avg"].any()
+        assert state["step"].item() == 0
+    else:
+        assert torch.equal(state["exp_avg"], exp_avg)
+        assert state["step"].item() == 1
+
+
+@pytest.mark.parametrize("policy", ["zero", "keep"])
+def test_optimizer_rebuilt_when_model_replaced(policy):
+    algorithm = _make_algorithm(optimizer_policy=policy)
+    optimizer = algorithm.local_optimizer
+    algorithm.local_model = nn.Sequential(nn.Linear(4, 8), nn.Tanh(), nn.Linear(8, 2))
+
+    algorithm._BaseAlgorithm__renew_local_optimizer()
+
+    assert algorithm.local_optimizer is not optimizer
+    assert optimizes_model(algorithm.local_optimizer, algorithm.local_model)
@@ -0,0 +1,56 @@
+# Copyright (c) 2025, Oak Ridge National Laboratory.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+import torch
+
+from src.omnifed.algorithm.utils import fused_norm, zero_optimizer_state
+
+
+@pytest.fixture(params=[True, False], ids=["foreach", "fallback"])
+def foreach(request, monkeypatch):
+    """Run with torch's private fused kernels and without them."""
+    if not request.param:
+        monkeypatch.delattr(torch, "_foreach_norm")
+        monkeypatch.delattr(torch, "_foreach_zero_")
+    return request.param
+
+
+def test_fused_norm_matches_joint_norm(foreach):
+    tensors = [
+        torch.randn(3, 4),
+        torch.randn(7, dtype=torch.float16),
+        torch.randn(2, 2, dtype=torch.bfloat16),
+    ]
+    expected = torch.linalg.vector_norm(
+        torch.cat([t.float().flatten() for t in tensors])
+    )
+
+    assert fused_norm(tensors) == pytest.approx(expected.item(), rel=1e-5)
+    assert fused_norm([]) == 0.0
+
+
+def test_zero_optimizer_state_in_place(foreach):
+    param = torch.nn.Parameter(torch.randn(5))
+    optimizer = torch.optim.Adam([param], lr=0.1)
+    param.grad = torch.randn(5)
+    optimizer.step()
+    state = optimizer.state[param]
+    exp_avg = state["exp_avg"]
+
+    zero_optimizer_state(optimizer)
+
+    assert state["exp_avg"] is exp_avg
+    assert not exp_avg.any() and not state["exp_avg_sq"].any()
+    assert state["step"].item() == 0
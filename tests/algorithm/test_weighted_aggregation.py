@@ -0,0 +1,107 @@
+# Copyright (c) 2025, Oak Ridge National Laboratory.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+import weakref
+
+import pytest
+import torch
+import torch.nn as nn
+
+from src.omnifed.algorithm import Ditto, FedDyn, FedProx
+from src.omnifed.communicator import AggregationOp, TensorFilter
+
+
+class _MirrorComm:
+    """Two-rank SUM where the peer contributes exactly what this rank sends."""
+
+    def __init__(self):
+        self.sent = []
+
+    def aggregate(self, msg, reduction, tensor_filter=None):
+        assert reduction == AggregationOp.SUM
+        tensors = (tensor_filter or TensorFilter()).select(msg)
+        self.sent.append({name: tensor.clone() for name, tensor in tensors.items()})
+        if isinstance(msg, dict):
+            return {name: tensor * 2 for name, tensor in msg.items()}
+        with torch.no_grad():
+            for tensor in tensors.values():
+                tensor.mul_(2)
+        return msg
+
+
+def _model():
+    torch.manual_seed(0)
+    model = nn.Sequential(nn.Linear(3, 4), nn.BatchNorm1d(4), nn.Linear(4, 2))
+    model.train()
+    model(torch.randn(8, 3))  # Non-trivial running statistics
+    return model
+
+
+def _make(cls, delta_transmission=False):
+    """Build just the state _aggregate_within_group uses."""
+    algorithm = object.__new__(cls)
+    algorithm.local_model = _model()
+    algorithm.delta_transmission = delta_transmission
+    algorithm._BaseAlgorithm__model_references = weakref.WeakKeyDictionary()
+    algorithm._BaseAlgorithm__global_reference = None
+    if delta_transmission:
+        algorithm._BaseAlgorithm__update_global_reference()
+    return algorithm
+
+
+def _assert_same_state(model, expected):
+    for name, tensor in expected.state_dict().items():
+        torch.testing.assert_close(model.state_dict()[name], tensor)
+
+
+@pytest.mark.parametrize("delta_transmission", [False, True])
+@pytest.mark.parametrize("cls", [FedProx, FedDyn])
+def test_weighted_aggregation_includes_buffers(cls, delta_transmission):
+    algorithm = _make(cls, delta_transmission)
+    if cls is FedDyn:
+        algorithm.alpha = 0.1
+        algorithm.server_momentum = {}
+    expected = copy.deepcopy(algorithm.local_model)
+    comm = _MirrorComm()
+
+    model = algorithm._aggregate_within_group(comm, 0.5)
+
+    # Running statistics are sent, and weighted like the parameters
+    assert "1.running_mean" in comm.sent[0]
+    assert "1.num_batches_tracked" not in comm.sent[0]
+    _assert_same_state(model, expected)
+
+
+@pytest.mark.parametrize("delta_transmission", [False, True])
+def test_ditto_aggregates_global_model_only(delta_transmission):
+    algorithm = _make(Ditto, delta_transmission)
+    algorithm.global_model = _model()
+    with torch.no_grad():
+        for param in algorithm.global_model.parameters():
+            param.add_(1.0)
+    expected = copy.deepcopy(algorithm.global_model)
+    personal = copy.deepcopy(algorithm.local_model)
+    comm = _MirrorComm()
+
+    for _ in range(2):
+        model = algorithm._aggregate_within_group(comm, 0.5)
+        assert model is algorithm.local_model
+        _assert_same_state(algorithm.local_model, personal)
+        _assert_same_state(algorithm.global_model, expected)
+        assert "1.running_var" in comm.sent[-1]
+
+    if delta_transmission:
+        # Later syncs send deltas to the previous global aggregate
+        assert all(not tensor.any() for tensor in comm.sent[-1].values())
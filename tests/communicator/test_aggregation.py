@@ -0,0 +1,90 @@
+# Copyright (c) 2025, Oak Ridge National Laboratory.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+import torch
+
+from src.omnifed.communicator import AggregationOp
+from src.omnifed.communicator.aggregation import IncrementalAggregator
+
+
+def reference(contributions, op):
+    stacked = torch.stack(contributions)
+    if op == AggregationOp.MAX:
+        return stacked.max(dim=0).values
+    total = stacked.sum(dim=0)
+    return total / len(contributions) if op == AggregationOp.MEAN else total
+
+
+@pytest.mark.parametrize("op", list(AggregationOp))
+def test_fold_matches_reference(op):
+    contributions = [torch.randn(4, 3) for _ in range(5)]
+    aggregator = IncrementalAggregator(op)
+    for tensor in contributions:
+        aggregator.fold({"w": tensor})
+
+    assert aggregator.num_folded == 5
+    result = aggregator.finalize(len(contributions))
+    torch.testing.assert_close(result["w"], reference(contributions, op))
+
+
+@pytest.mark.parametrize("op", list(AggregationOp))
+def test_fold_slice_matches_fold(op):
+    contributions = [torch.randn(10) for _ in range(3)]
+    aggregator = IncrementalAggregator(op)
+    for tensor in contributions:
+        aggregator.ensure("w", tensor.shape, tensor.dtype)
+        # Uneven slices, as produced by streamed chunks
+        for start, end in [(0, 3), (3, 4), (4, 10)]:
+            aggregator.fold_slice("w", start, tensor[start:end])
+        aggregator.mark_folded()
+
+    result = aggregator.finalize(len(contributions))
+    torch.testing.assert_close(result["w"], reference(contributions, op))
+
+
+@pytest.mark.parametrize("dtype", [torch.float16, torch.bfloat16])
+@pytest.mark.parametrize("op", list(AggregationOp))
+def test_half_precision_accumulates_in_float32(dtype, op):
+    # 1 + 256 * 2^-12 is exact in float32 but every step rounds away in half precision
+    contributions = [torch.ones(2, dtype=dtype)] + [
+        torch.full((2,), 2.0**-12, dtype=dtype) for _ in range(256)
+    ]
+    aggregator = IncrementalAggregator(op)
+    for tensor in contributions:
+        aggregator.fold({"w": tensor})
+
+    assert aggregator.accumulators["w"].dtype == torch.float32
+    result = aggregator.finalize(len(contributions))["w"]
+
+    assert result.dtype == dtype
+    expected = reference([tensor.float() for tensor in contributions], op)
+    torch.testing.assert_close(result, expected.to(dtype))
+
+
+def test_max_identity_for_integers():
+    aggregator = IncrementalAggregator(AggregationOp.MAX)
+    aggregator.fold({"n": torch.tensor([-5, -7])})
+
+    assert torch.equal(aggregator.finalize(1)["n"], torch.tensor([-5, -7]))
+
+
+def test_finalize_resets_state():
+    aggregator = IncrementalAggregator(AggregationOp.SUM)
+    aggregator.fold({"w": torch.ones(2)})
+    aggregator.finalize(1)
+
+    assert aggregator.accumulators == {}
+    aggregator.fold({"w": torch.ones(2)})
+    assert torch.equal(aggregator.finalize(1)["w"], torch.ones(2))
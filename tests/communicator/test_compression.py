@@ -0,0 +1,142 @@
+# Copyright (c) 2025, Oak Ridge National Laboratory.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+import torch
+
+from src.omnifed.communicator.compression import (
+    ErrorFeedback,
+    PowerSGDCompressor,
+    QSGDCompressor,
+    RandomKCompressor,
+    SignSGDCompressor,
+    TopKCompressor,
+)
+from src.omnifed.communicator.compression.base import pack_bits, unpack_bits
+
+COMPRESSORS = [
+    lambda: TopKCompressor(ratio=0.1, min_numel=16),
+    lambda: RandomKCompressor(ratio=0.1, min_numel=16),
+    lambda: QSGDCompressor(bits=4, min_numel=16),
+    lambda: SignSGDCompressor(min_numel=16),
+    lambda: PowerSGDCompressor(rank=2, min_numel=16),
+]
+
+
+def make_tensordict():
+    return {
+        "weight": torch.randn(32, 24),
+        "bias": torch.randn(8),  # Below min_numel: sent raw
+        "steps": torch.tensor([3], dtype=torch.int64),
+    }
+
+
+@pytest.mark.parametrize("make_compressor", COMPRESSORS)
+def test_round_trip_preserves_names_shapes_and_dtypes(make_compressor):
+    compressor = make_compressor()
+    tensordict = make_tensordict()
+
+    decoded = compressor.decompress(compressor.compress(tensordict))
+
+    assert list(decoded) == list(tensordict)
+    for name, tensor in tensordict.items():
+        assert decoded[name].shape == tensor.shape
+        assert decoded[name].dtype == tensor.dtype
+    assert torch.equal(decoded["bias"], tensordict["bias"])
+    assert torch.equal(decoded["steps"], tensordict["steps"])
+
+
+def test_lossless_settings_round_trip_exactly():
+    tensordict = {"w": torch.randn(16, 8)}
+    for compressor in [
+        TopKCompressor(ratio=1.0, min_numel=1),
+        RandomKCompressor(ratio=1.0, min_numel=1),
+    ]:
+        decoded = compressor.decompress(compressor.compress(tensordict))
+        assert torch.equal(decoded["w"], tensordict["w"])
+
+
+def test_topk_keeps_largest_entries():
+    tensor = torch.tensor([0.1, -5.0, 0.2, 3.0, -0.3, 0.0, 0.05, 1.0])
+    compressor = TopKCompressor(ratio=0.25, min_numel=1)
+
+    decoded = compressor.decompress(compressor.compress({"t": tensor}))["t"]
+
+    assert torch.equal(decoded, torch.tensor([0, -5.0, 0, 3.0, 0, 0, 0, 0]))
+
+
+def test_powersgd_is_exact_for_low_rank_matrices():
+    matrix = torch.randn(20, 2) @ torch.randn(2, 30)
+    compressor = PowerSGDCompressor(rank=2, min_numel=1)
+
+    decoded = compressor.decompress(compressor.compress({"m": matrix}))["m"]
+
+    torch.testing.assert_close(decoded, matrix, rtol=1e-4, atol=1e-4)
+
+
+@pytest.mark.parametrize("bits", [1, 2, 4, 8])
+def test_pack_bits_round_trip(bits):
+    codes = torch.randint(0, 2**bits, (37,), dtype=torch.uint8)
+    packed = pack_bits(codes, bits)
+
+    assert packed.numel() == -(-37 * bits // 8)
+    assert torch.equal(unpack_bits(packed, bits, 37), codes)
+
+
+@pytest.mark.parametrize("make_compressor", COMPRESSORS)
+def test_error_feedback_carries_dropped_mass(make_compressor):
+    compressor = make_compressor()
+    feedback = ErrorFeedback()
+    compressor.error_feedback = feedback
+    updates = [torch.randn(32, 24) for _ in range(4)]
+
+    transmitted = torch.zeros(32, 24)
+    for update in updates:
+        feedback.reset_calls()
+        payload = compressor.compress({"w": update})
+        transmitted += compressor.decompress(payload)["w"]
+
+    # Everything not yet transmitted is held in the residual
+    residual = feedback.residuals["0/w"]
+    torch.testing.assert_close(transmitted + residual, sum(updates))
+
+
+def test_error_feedback_keys_residuals_by_call():
+    compressor = TopKCompressor(ratio=0.1, min_numel=1)
+    feedback = ErrorFeedback(dtype="bfloat16")
+    compressor.error_feedback = feedback
+
+    feedback.reset_calls()
+    compressor.compress({"w": torch.randn(64)})
+    compressor.compress({"w": torch.randn(8, 8)})
+
+    assert set(feedback.residuals) == {"0/w", "1/w"}
+    assert feedback.residuals["1/w"].shape == (8, 8)
+    assert feedback.residuals["0/w"].dtype == torch.bfloat16
+
+
+def test_error_feedback_rejects_non_float_dtype():
+    with pytest.raises(ValueError):
+        ErrorFeedback(dtype="int32")
+
+
+def test_powersgd_state_is_kept_per_call_with_error_feedback():
+    compressor = PowerSGDCompressor(rank=2, min_numel=1)
+    compressor.error_feedback = ErrorFeedback()
+
+    compressor.error_feedback.reset_calls()
+    compressor.compress({"w": torch.randn(16, 12)})
+    compressor.compress({"w": torch.randn(16, 12)})
+
+    assert set(compressor._q_factors) == {"0/w", "1/w"}
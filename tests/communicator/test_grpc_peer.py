@@ -0,0 +1,114 @@
+# Copyright (c) 2025, Oak Ridge National Laboratory.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent import futures
+
+import pytest
+import torch
+
+from src.omnifed.communicator.aggregation import AggregationOp
+from src.omnifed.communicator.grpc_peer import (
+    GrpcPeerGroup,
+    PeerBroadcast,
+    PeerCollective,
+)
+
+
+def _run_group(world_size, fn):
+    """Start world_size in-process peers and run fn(group) on each rank."""
+    groups = [
+        GrpcPeerGroup(rank, world_size, stream_chunk_size=64, timeout=30.0)
+        for rank in range(world_size)
+    ]
+    addresses = [f"localhost:{group.start()}" for group in groups]
+    try:
+        for group in groups:
+            group.connect(addresses)
+        with futures.ThreadPoolExecutor(max_workers=world_size) as pool:
+            return list(pool.map(fn, groups))
+    finally:
+        for group in groups:
+            group.close()
+
+
+def _rank_tensors(rank):
+    # Odd sizes so ring segments are uneven; mixed dtypes exercise flattening
+    generator = torch.Generator().manual_seed(rank)
+    return {
+        "w": torch.randn(7, 3, generator=generator),
+        "b": torch.randn(5, generator=generator),
+        "count": torch.tensor([rank + 1, 2 * rank], dtype=torch.int64),
+    }
+
+
+@pytest.mark.parametrize("collective", list(PeerCollective))
+@pytest.mark.parametrize("world_size", [2, 3, 5])
+def test_all_reduce_sum_matches_plain_sum(collective, world_size):
+    inputs = [_rank_tensors(rank) for rank in range(world_size)]
+    expected = {name: sum(td[name] for td in inputs) for name in inputs[0]}
+
+    results = _run_group(
+        world_size,
+        lambda group: group.all_reduce(
+            inputs[group.rank], AggregationOp.SUM, collective
+        ),
+    )
+
+    for rank, result in enumerate(results):
+        assert result.keys() == expected.keys()
+        for name, tensor in expected.items():
+            assert result[name].dtype == tensor.dtype
+            torch.testing.assert_close(result[name], tensor)
+        # Inputs are left untouched
+        for name, tensor in _rank_tensors(rank).items():
+            assert torch.equal(inputs[rank][name], tensor)
+
+
+@pytest.mark.parametrize("collective", list(PeerCollective))
+def test_all_reduce_mean_and_max(collective):
+    world_size = 4
+    inputs = [{"x": torch.full((6,), float(rank))} for rank in range(world_size)]
+
+    means = _run_group(
+        world_size,
+        lambda group: group.all_reduce(
+            inputs[group.rank], AggregationOp.MEAN, collective
+        ),
+    )
+    maxes = _run_group(
+        world_size,
+        lambda group: group.all_reduce(
+            inputs[group.rank], AggregationOp.MAX, collective
+        ),
+    )
+
+    for mean, peak in zip(means, maxes):
+        torch.testing.assert_close(mean["x"], torch.full((6,), 1.5))
+        torch.testing.assert_close(peak["x"], torch.full((6,), 3.0))
+
+
+@pytest.mark.parametrize("topology", list(PeerBroadcast))
+def test_broadcast_reaches_every_rank(topology):
+    world_size = 4
+    payload = {"w": torch.arange(40, dtype=torch.float32)}
+
+    results = _run_group(
+        world_size,
+        lambda group: group.broadcast(
+            payload if group.rank == 2 else None, src=2, topology=topology
+        ),
+    )
+
+    for result in results:
+        assert torch.equal(result["w"], payload["w"])
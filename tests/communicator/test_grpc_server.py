@@ -0,0 +1,95 @@
+# Copyright (c) 2025, Oak Ridge National Laboratory.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+import torch
+
+from src.omnifed.communicator import grpc_pb2
+from src.omnifed.communicator.grpc_server import GrpcServer
+from src.omnifed.communicator.utils import (
+    chunks_to_tensordict,
+    proto_to_tensordict,
+    tensordict_to_chunks,
+)
+
+
+def test_broadcast_payload_is_snapshot_at_publish():
+    server = GrpcServer(world_size=2)
+    weights = {"w": torch.zeros(4)}
+    version = server.set_broadcast_state(weights)
+
+    # The publisher keeps training in place before any client asks
+    weights["w"].add_(1.0)
+
+    response = server._create_broadcast_response(after_version=0)
+    _, streamed = chunks_to_tensordict(server._broadcast_chunks(after_version=0))
+
+    assert response.version == version
+    assert torch.equal(proto_to_tensordict(response.tensor_dict)["w"], torch.zeros(4))
+    assert torch.equal(streamed["w"], torch.zeros(4))
+    assert torch.equal(server.get_broadcast_state()["w"], torch.zeros(4))
+
+
+def _result(server, client_id):
+    return proto_to_tensordict(
+        server.GetAggregationResult(
+            grpc_pb2.ClientInfo(client_id=client_id), None
+        ).tensor_dict
+    )
+
+
+@pytest.mark.parametrize("reduction", ["SUM", "MEAN"])
+def test_duplicate_submission_is_folded_once(reduction):
+    server = GrpcServer(world_size=2)
+    with pytest.warns(RuntimeWarning, match="duplicate submission from client a"):
+        server.submit_tensordict("a", {"w": torch.ones(3)}, reduction)
+        server.submit_tensordict("a", {"w": torch.ones(3)}, reduction)
+    server.submit_tensordict("b", {"w": torch.full((3,), 3.0)}, reduction)
+
+    expected = torch.full((3,), 4.0 if reduction == "SUM" else 2.0)
+    assert torch.equal(_result(server, "a")["w"], expected)
+    assert torch.equal(_result(server, "b")["w"], expected)
+
+
+def test_duplicate_stream_is_folded_once():
+    server = GrpcServer(world_size=2, stream_chunk_size=64)
+
+    def submit(client_id, value):
+        chunks = tensordict_to_chunks(
+            {"w": torch.full((40,), value)},
+            server.stream_chunk_size,
+            client_id=client_id,
+            reduction_type="SUM",
+        )
+        return server.SubmitForAggregationStream(chunks, None)
+
+    assert submit("a", 1.0).success
+    with pytest.warns(RuntimeWarning, match="duplicate submission from client a"):
+        assert submit("a", 1.0).success
+    assert submit("b", 2.0).success
+
+    assert torch.equal(_result(server, "b")["w"], torch.full((40,), 3.0))
+
+
+def test_aggregation_result_is_held_once():
+    server = GrpcServer(world_size=2)
+    session_id = server.submit_tensordict("a", {"w": torch.ones(3)}, "SUM")
+    session_state = server.aggregation_state[session_id]
+    accumulators = session_state["aggregator"].accumulators
+    server.submit_tensordict("b", {"w": torch.ones(3)}, "SUM")
+
+    # The payload owns the finalized accumulators instead of a copy of them
+    assert session_state["payload"].tensordict is accumulators
+    assert "result" not in session_state
+    assert torch.equal(_result(server, "a")["w"], torch.full((3,), 2.0))
@@ -0,0 +1,105 @@
+# Copyright (c) 2025, Oak Ridge National Laboratory.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+import torch
+
+from src.omnifed.communicator import grpc_pb2
+from src.omnifed.communicator.utils import (
+    SerializationMode,
+    chunks_to_tensordict,
+    proto_to_tensordict,
+    tensordict_to_chunks,
+    tensordict_to_proto,
+)
+
+
+def make_tensordict():
+    return {
+        "weight": torch.randn(5, 7),
+        "bias": torch.randn(3, dtype=torch.bfloat16),
+        "half": torch.randn(2, 3, dtype=torch.float16),
+        "empty": torch.empty(0, 4),
+        "steps": torch.tensor(11, dtype=torch.int64),
+        "mask": torch.tensor([True, False, True]),
+        "transposed": torch.randn(4, 6).t(),
+    }
+
+
+def assert_same(decoded, original):
+    assert list(decoded) == list(original)
+    for key, tensor in original.items():
+        assert decoded[key].dtype == tensor.dtype
+        assert decoded[key].shape == tensor.shape
+        assert torch.equal(decoded[key], tensor)
+
+
+@pytest.mark.parametrize("mode", list(SerializationMode))
+def test_proto_round_trip(mode):
+    tensordict = make_tensordict()
+    proto = tensordict_to_proto(tensordict, mode)
+    assert_same(proto_to_tensordict(proto), tensordict)
+
+
+@pytest.mark.parametrize("mode", list(SerializationMode))
+def test_decoded_tensors_are_writable(mode):
+    tensordict = make_tensordict()
+    proto = tensordict_to_proto(tensordict, mode)
+    decoded = proto_to_tensordict(proto)
+
+    decoded["weight"].add_(1.0)
+
+    assert torch.equal(decoded["weight"], tensordict["weight"] + 1.0)
+    # The message itself is untouched, so decoding it again gives the original
+    assert_same(proto_to_tensordict(proto), tensordict)
+
+
+def test_flat_proto_matches_chunked_layout():
+    tensordict = make_tensordict()
+    proto = tensordict_to_proto(tensordict, SerializationMode.FLAT)
+    chunks = list(tensordict_to_chunks(tensordict, 1 << 20))
+
+    assert proto.flat_data == b"".join(chunk.data for chunk in chunks)
+
+
+def test_entry_sizes_are_64_bit():
+    size = 3 << 30  # Past the int32 range
+    entry = grpc_pb2.TensorEntry(data_size=size, offset=size)
+    decoded = grpc_pb2.TensorEntry.FromString(entry.SerializeToString())
+    assert (decoded.data_size, decoded.offset) == (size, size)
+
+
+def test_flat_proto_of_empty_dict():
+    proto = tensordict_to_proto({}, SerializationMode.FLAT)
+    assert proto_to_tensordict(proto) == {}
+
+
+@pytest.mark.parametrize("chunk_size", [8, 24, 1 << 20])
+def test_chunked_round_trip(chunk_size):
+    tensordict = make_tensordict()
+    chunks = list(tensordict_to_chunks(tensordict, chunk_size, client_id="3"))
+
+    header, decoded = chunks_to_tensordict(chunks)
+
+    assert header.client_id == "3"
+    assert all(len(chunk.data) <= max(chunk_size, 8) for chunk in chunks)
+    assert_same(decoded, tensordict)
+
+
+def test_chunked_round_trip_of_empty_tensors():
+    tensordict = {"a": torch.empty(0), "b": torch.empty(0, 3, dtype=torch.bfloat16)}
+    header, decoded = chunks_to_tensordict(tensordict_to_chunks(tensordict, 64))
+
+    assert header.total_size == 0
+    assert_same(decoded, tensordict)
@@ -0,0 +1,201 @@
+# Copyright (c) 2025, Oak Ridge National Laboratory.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+import torch
+import torch.distributed as dist
+import torch.multiprocessing as mp
+
+from src.omnifed.communicator import AggregationOp
+from src.omnifed.communicator import torchdist
+from src.omnifed.communicator.compression import PowerSGDCompressor, TopKCompressor
+from src.omnifed.communicator.torchdist import (
+    InitMethod,
+    TorchDistCommunicator,
+    _iter_buckets,
+    _launch_coalesced,
+)
+
+
+class DoneWork:
+    """Stand-in for a finished dist.Work."""
+
+    def wait(self):
+        pass
+
+
+def sizes(buckets):
+    return [[tensor.numel() for tensor in bucket] for bucket in buckets]
+
+
+def test_buckets_respect_size_cap():
+    tensors = [torch.zeros(n) for n in (4, 4, 4, 10, 1)]  # float32: 4 bytes each
+
+    buckets = list(_iter_buckets(tensors, bucket_size_bytes=32))
+
+    # A tensor larger than the cap gets a bucket of its own
+    assert sizes(buckets) == [[4, 4], [4], [10], [1]]
+
+
+def test_buckets_split_by_dtype_and_keep_order():
+    tensors = [
+        torch.zeros(2),
+        torch.zeros(3, dtype=torch.int64),
+        torch.zeros(4),
+        torch.zeros(5, dtype=torch.int64),
+    ]
+
+    buckets = list(_iter_buckets(tensors, bucket_size_bytes=1 << 20))
+
+    assert [bucket[0].dtype for bucket in buckets] == [torch.float32, torch.int64]
+    assert sizes(buckets) == [[2, 4], [3, 5]]
+    assert all(len({tensor.dtype for tensor in bucket}) == 1 for bucket in buckets)
+
+
+def test_every_tensor_lands_in_exactly_one_bucket():
+    tensors = [torch.zeros(n) for n in range(1, 30)]
+
+    buckets = list(_iter_buckets(tensors, bucket_size_bytes=64))
+
+    bucketed = [id(tensor) for bucket in buckets for tensor in bucket]
+    assert sorted(bucketed) == sorted(id(tensor) for tensor in tensors)
+
+
+def test_launch_coalesced_writes_results_back_in_place():
+    tensors = [torch.arange(n, dtype=torch.float32) for n in (3, 5, 40)]
+    tensors.append(torch.arange(4, dtype=torch.int64).view(2, 2))
+    expected = [tensor * 2 for tensor in tensors]
+    launched = []
+
+    def collective(tensor):
+        launched.append(tensor.numel())
+        tensor.mul_(2)
+        return DoneWork()
+
+    wait = _launch_coalesced(tensors, collective, bucket_size_bytes=64)
+    wait()
+
+    # Two small float tensors share a flat bucket; the others run alone
+    assert launched == [8, 40, 4]
+    for tensor, value in zip(tensors, expected):
+        assert torch.equal(tensor, value)
+
+
+def test_launch_coalesced_without_buckets_runs_per_tensor():
+    tensors = [torch.ones(2), torch.ones(3)]
+    launched = []
+
+    def collective(tensor):
+        launched.append(tensor.numel())
+        return DoneWork()
+
+    _launch_coalesced(tensors, collective, bucket_size_bytes=0)()
+
+    assert launched == [2, 3]
+
+
+@pytest.fixture
+def single_rank_comm(tmp_path):
+    comm = TorchDistCommunicator(
+        rank=0,
+        world_size=1,
+        init_method=InitMethod.FILE,
+        sharedfile=str(tmp_path / "rendezvous"),
+        compression=PowerSGDCompressor(rank=2, min_numel=1),
+    )
+    comm.setup()
+    yield comm
+    dist.destroy_process_group()
+
+
+def test_compressed_aggregation_keys_state_by_tensor_name(single_rank_comm):
+    low_rank = torch.randn(16, 2) @ torch.randn(2, 12)
+    other = torch.randn(16, 2) @ torch.randn(2, 20)
+
+    first = single_rank_comm.aggregate({"a": low_rank.clone()}, AggregationOp.MEAN)
+    second = single_rank_comm.aggregate({"b": other.clone()}, AggregationOp.SUM)
+
+    assert set(single_rank_comm.compression._q_factors) == {"a", "b"}
+    torch.testing.assert_close(first["a"], low_rank, rtol=1e-4, atol=1e-4)
+    torch.testing.assert_close(second["b"], other, rtol=1e-4, atol=1e-4)
+
+
+class _CountingTopK(TopKCompressor):
+    """Lossless top-k that counts compress calls."""
+
+    def __init__(self):
+        super().__init__(ratio=1.0, min_numel=1)
+        self.calls = 0
+
+    def compress(self, tensordict):
+        self.calls += 1
+        return super().compress(tensordict)
+
+
+def _rank_tensors(rank):
+    return {
+        "w": torch.arange(12, dtype=torch.float32).view(3, 4) * (rank + 1),
+        "b": torch.full((5,), float(rank)),
+    }
+
+
+def _hierarchical_worker(rank, world_size, rendezvous, out_dir):
+    # Two ranks per "host", so the two-level groups are used
+    torchdist._host_id = lambda: f"host{rank // 2}"
+    comm = TorchDistCommunicator(
+        rank=rank,
+        world_size=world_size,
+        init_method=InitMethod.FILE,
+        sharedfile=rendezvous,
+        hierarchical=True,
+        compression=_CountingTopK(),
+        bucket_size_mb=0.0001,
+    )
+    comm.setup()
+    try:
+        results = {
+            reduction.value: comm.aggregate(_rank_tensors(rank), reduction)
+            for reduction in (AggregationOp.SUM, AggregationOp.MEAN, AggregationOp.MAX)
+        }
+        results["hierarchical"] = comm.host_group is not None
+        results["leader"] = comm.host_leader == rank
+        results["compress_calls"] = comm.compression.calls
+        torch.save(results, f"{out_dir}/{rank}.pt")
+    finally:
+        dist.destroy_process_group()
+
+
+def test_compression_keeps_hierarchical_all_reduce(tmp_path):
+    world_size = 4
+    mp.spawn(
+        _hierarchical_worker,
+        args=(world_size, str(tmp_path / "rendezvous"), str(tmp_path)),
+        nprocs=world_size,
+    )
+
+    inputs = [_rank_tensors(rank) for rank in range(world_size)]
+    expected = {
+        "SUM": {k: sum(td[k] for td in inputs) for k in inputs[0]},
+        "MEAN": {k: sum(td[k] for td in inputs) / world_size for k in inputs[0]},
+        "MAX": {k: torch.stack([td[k] for td in inputs]).amax(0) for k in inputs[0]},
+    }
+    for rank in range(world_size):
+        results = torch.load(tmp_path / f"{rank}.pt")
+        assert results["hierarchical"]
+        # Only host leaders compress (once per aggregation), between hosts
+        assert results["leader"] == (rank % 2 == 0)
+        assert results["compress_calls"] == (3 if results["leader"] else 0)
+        for reduction, tensors in expected.items():
+            for name, tensor in tensors.items():
+                torch.testing.assert_close(results[reduction][name], tensor)